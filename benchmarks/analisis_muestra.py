@@ -0,0 +1,73 @@
+"""
+Compara el análisis del texto de una muestra con el camino anterior
+(validar con una expresión regular, separar y convertir) sobre una
+línea de muchas observaciones, y reporta observaciones por segundo.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.analisis_muestra
+    py -m benchmarks.analisis_muestra --observaciones 1000000 --repeticiones 5
+"""
+import argparse
+import re
+import statistics
+import time
+
+import numpy as np
+
+from src.muestra import Muestra
+
+_FORMATO_ANTERIOR = r'^\d+(\.\d+)?( \d+(\.\d+)?)*$'
+
+def analisis_anterior(texto: str) -> np.ndarray:
+    """
+    Camino anterior: la expresión regular recorre el texto, luego se
+    separa y se convierte.
+    """
+    if re.fullmatch(_FORMATO_ANTERIOR, texto.strip()) is None:
+        raise ValueError("formato")
+
+    return np.array(texto.split(), dtype=np.float64)
+
+
+def analisis_actual(texto: str) -> np.ndarray:
+    """Análisis con validación en un solo recorrido."""
+    return Muestra.desde_texto(texto).datos
+
+
+def _medir(funcion, texto: str, repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(texto)
+        tiempos.append(time.perf_counter() - inicio)
+
+    return statistics.median(tiempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--observaciones", type=int, default=1_000_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args()
+
+    # Observaciones positivas para que el formato anterior las acepte
+    generador = np.random.default_rng(argumentos.semilla)
+    valores = np.abs(generador.normal(50, 10, argumentos.observaciones))
+    texto = " ".join(f"{valor:.4f}" for valor in valores.tolist())
+
+    if not np.array_equal(analisis_anterior(texto), analisis_actual(texto)):
+        raise SystemExit(">> Los dos caminos no dan las mismas observaciones")
+
+    anterior = _medir(analisis_anterior, texto, argumentos.repeticiones)
+    actual = _medir(analisis_actual, texto, argumentos.repeticiones)
+    for nombre, segundos in (("anterior", anterior), ("actual", actual)):
+        print(
+            f">> {nombre:<8} {segundos * 1000:8.1f} ms "
+            f"({argumentos.observaciones / segundos / 1e6:.2f} M observaciones/s)"
+        )
+
+    print(f">> Aceleración: {anterior / actual:.2f}x")
+
+if __name__ == "__main__":
+    main()
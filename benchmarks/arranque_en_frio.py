@@ -0,0 +1,118 @@
+"""
+Benchmark del arranque en frío del módulo de cálculos con cada backend
+de valores críticos y de la concordancia del backend nativo con scipy.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.arranque_en_frio
+    py -m benchmarks.arranque_en_frio --repeticiones 20
+"""
+import argparse
+import itertools
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+TOLERANCIA = 1e-8
+
+# Importa los cálculos y obtiene un valor crítico de cada distribución
+CODIGO_ARRANQUE = """
+from src.services.calculos import (
+    intervalo_caso_2,
+    intervalo_caso_7,
+    intervalo_caso_9,
+    intervalo_caso_10,
+)
+intervalo_caso_2(5, "1 2 3 4 5", 95)
+intervalo_caso_7(20, 100, 95)
+intervalo_caso_9(5, "1 2 3 4 5", 95)
+intervalo_caso_10(5, 4, "1 2 3 4 5", "2 4 6 9", 95)
+"""
+
+PROBABILIDADES = (1e-10, 1e-6, 0.005, 0.025, 0.05, 0.1, 0.3, 0.7, 0.9, 0.95, 0.975, 0.995, 1 - 1e-6)
+GRADOS_LIBERTAD = (0.5, 1, 2, 3, 4.7, 5, 10, 29, 57.3, 100, 1000, 1e4, 1e5)
+GRADOS_LIBERTAD_F = (1, 2, 3, 7.5, 10, 30, 100, 1000, 1e5)
+
+def _medir_proceso(codigo: str, backend: str) -> float:
+    entorno = dict(os.environ, CALCULADORA_BACKEND_CUANTILES=backend)
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, "-c", codigo], cwd=BASE_DIR, env=entorno, check=True)
+    return time.perf_counter() - inicio
+
+
+def medir_arranque(repeticiones: int) -> dict[str, float]:
+    """
+    Mide la mediana del tiempo de un proceso nuevo que importa los
+    cálculos y obtiene sus primeros valores críticos, descontando el
+    arranque del intérprete.
+
+    :param repeticiones: Número de procesos por backend.
+    :type repeticiones: int
+    :return: Mediana en segundos por backend.
+    :rtype: dict[str, float]
+    """
+    interprete = statistics.median(
+        _medir_proceso("pass", "scipy") for _ in range(repeticiones)
+    )
+    return {
+        backend: statistics.median(
+            _medir_proceso(CODIGO_ARRANQUE, backend) for _ in range(repeticiones)
+        ) - interprete
+        for backend in ("scipy", "nativo")
+    }
+
+
+def comparar_con_scipy() -> dict[str, float]:
+    """
+    Calcula el máximo error relativo del backend nativo contra scipy
+    en una malla de probabilidades y grados de libertad.
+
+    :return: Máximo error relativo por distribución.
+    :rtype: dict[str, float]
+    """
+    from scipy.stats import norm, t, chi2, f
+
+    from src.services import distribuciones
+
+    def error(valor: float, referencia: float) -> float:
+        return abs(valor - referencia) / max(abs(referencia), 1e-300)
+
+    errores = {"normal": 0.0, "t": 0.0, "chi2": 0.0, "f": 0.0}
+    for p in PROBABILIDADES:
+        errores["normal"] = max(errores["normal"], error(distribuciones.cuantil_normal(p), norm.ppf(p)))
+        for gl in GRADOS_LIBERTAD:
+            errores["t"] = max(errores["t"], error(distribuciones.cuantil_t(p, gl), t.ppf(p, gl)))
+            errores["chi2"] = max(errores["chi2"], error(distribuciones.cuantil_chi2(p, gl), chi2.ppf(p, gl)))
+
+        for gl1, gl2 in itertools.product(GRADOS_LIBERTAD_F, repeat=2):
+            errores["f"] = max(errores["f"], error(distribuciones.cuantil_f(p, gl1, gl2), f.ppf(p, gl1, gl2)))
+
+    return errores
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=10)
+    argumentos = parser.parse_args()
+
+    tiempos = medir_arranque(argumentos.repeticiones)
+    print(">> Arranque en frío (importar cálculos y primeros valores críticos)")
+    for backend, segundos in tiempos.items():
+        print(f"   {backend:<7} {segundos * 1000:8.1f} ms")
+    print(f"   ahorro  {(tiempos['scipy'] - tiempos['nativo']) * 1000:8.1f} ms")
+
+    errores = comparar_con_scipy()
+    print(f"\n>> Error relativo máximo del backend nativo contra scipy (tolerancia {TOLERANCIA:g})")
+    for distribucion, maximo in errores.items():
+        estado = "ok" if maximo <= TOLERANCIA else "FALLA"
+        print(f"   {distribucion:<7} {maximo:.3e} {estado}")
+
+    if any(maximo > TOLERANCIA for maximo in errores.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+"""
+Prueba de carga del servicio HTTP/JSON de la calculadora. Un cliente
+``asyncio`` con conexiones persistentes envía solicitudes mezcladas de
+los seis parámetros con la concurrencia indicada y reporta la latencia
+p50/p99 y las solicitudes por segundo.
+
+Si no se da ``--url`` se inicia un servicio local en un puerto libre
+y se detiene al terminar.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.carga_servidor
+    py -m benchmarks.carga_servidor --solicitudes 5000 --concurrencia 64 --procesos 4
+    py -m benchmarks.carga_servidor --url 127.0.0.1:8000
+"""
+import argparse
+import asyncio
+import json
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+def _muestra(generador: random.Random, tamano: int, media: float) -> str:
+    return " ".join(f"{abs(generador.gauss(media, 2)):.3f}" for _ in range(tamano))
+
+
+def generar_solicitudes(cantidad: int, semilla: int = 0) -> list[tuple[str, bytes]]:
+    """
+    Genera solicitudes válidas de los seis parámetros.
+
+    :return: Lista de pares (ruta, cuerpo JSON).
+    :rtype: list[tuple[str, bytes]]
+    """
+    generador = random.Random(semilla)
+    solicitudes = []
+    for _ in range(cantidad):
+        tamano = generador.choice((10, 50, 200))
+        confianza = generador.choice((90, 95, 99))
+        ruta = generador.choice((
+            "media", "dif_medias", "proporcion", "dif_proporciones", "varianza", "coc_varianzas",
+        ))
+        trabajo = {"porcentaje_confianza": confianza}
+        if ruta in ("media", "varianza"):
+            trabajo["muestra"] = _muestra(generador, tamano, 10)
+        elif ruta in ("dif_medias", "coc_varianzas"):
+            trabajo["muestra_1"] = _muestra(generador, tamano, 10)
+            trabajo["muestra_2"] = _muestra(generador, tamano + 5, 12)
+        elif ruta == "proporcion":
+            trabajo.update(numero_exitos=generador.randint(20, 80), tamano_muestra=100)
+        else:
+            trabajo.update(
+                numero_exitos_1=generador.randint(20, 80),
+                tamano_muestra_1=100,
+                numero_exitos_2=generador.randint(20, 80),
+                tamano_muestra_2=120,
+            )
+
+        solicitudes.append((ruta, json.dumps(trabajo).encode("utf-8")))
+
+    return solicitudes
+
+
+async def _solicitar(
+        lector: asyncio.StreamReader,
+        escritor: asyncio.StreamWriter,
+        anfitrion: str,
+        ruta: str,
+        cuerpo: bytes,
+    ) -> int:
+    escritor.write(
+        (
+            f"POST /{ruta} HTTP/1.1\r\nHost: {anfitrion}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(cuerpo)}\r\n\r\n"
+        ).encode("latin-1")
+        + cuerpo
+    )
+    await escritor.drain()
+    encabezado = (await lector.readuntil(b"\r\n\r\n")).decode("latin-1")
+    estado = int(encabezado.split(" ", 2)[1])
+    longitud = 0
+    for linea in encabezado.split("\r\n")[1:]:
+        if linea.lower().startswith("content-length:"):
+            longitud = int(linea.split(":", 1)[1])
+
+    await lector.readexactly(longitud)
+    return estado
+
+
+async def _cliente(
+        anfitrion: str,
+        puerto: int,
+        cola: asyncio.Queue,
+        latencias: list[float],
+        errores: list[int],
+    ) -> None:
+    lector, escritor = await asyncio.open_connection(anfitrion, puerto)
+    try:
+        while True:
+            try:
+                ruta, cuerpo = cola.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+
+            inicio = time.perf_counter()
+            estado = await _solicitar(lector, escritor, anfitrion, ruta, cuerpo)
+            latencias.append(time.perf_counter() - inicio)
+            if estado != 200:
+                errores.append(estado)
+    finally:
+        escritor.close()
+
+
+async def ejecutar_carga(
+        anfitrion: str,
+        puerto: int,
+        solicitudes: list[tuple[str, bytes]],
+        concurrencia: int,
+    ) -> dict:
+    """
+    Envía las solicitudes con ``concurrencia`` conexiones simultáneas.
+
+    :return: Latencias p50/p99 en ms, solicitudes por segundo y
+    número de errores.
+    :rtype: dict
+    """
+    cola = asyncio.Queue()
+    for solicitud in solicitudes:
+        cola.put_nowait(solicitud)
+
+    latencias = []
+    errores = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        _cliente(anfitrion, puerto, cola, latencias, errores) for _ in range(concurrencia)
+    ))
+    segundos = time.perf_counter() - inicio
+    cuantiles = statistics.quantiles(latencias, n=100, method="inclusive")
+    return {
+        "solicitudes": len(latencias),
+        "errores": len(errores),
+        "segundos": segundos,
+        "solicitudes_por_segundo": len(latencias) / segundos,
+        "p50_ms": cuantiles[49] * 1000,
+        "p99_ms": cuantiles[98] * 1000,
+    }
+
+
+def _puerto_libre() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _esperar_servicio(anfitrion: str, puerto: int, segundos: float) -> None:
+    limite = time.monotonic() + segundos
+    while time.monotonic() < limite:
+        try:
+            with socket.create_connection((anfitrion, puerto), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+
+    raise RuntimeError("El servicio no respondió a tiempo")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="anfitrion:puerto de un servicio ya iniciado")
+    parser.add_argument("--solicitudes", type=int, default=2000)
+    parser.add_argument("--concurrencia", type=int, default=32)
+    parser.add_argument("--procesos", type=int, default=None)
+    parser.add_argument("--calentamiento", type=int, default=100)
+    argumentos = parser.parse_args()
+
+    servicio = None
+    if argumentos.url:
+        anfitrion, puerto = argumentos.url.rsplit(":", 1)
+        puerto = int(puerto)
+    else:
+        anfitrion, puerto = "127.0.0.1", _puerto_libre()
+        comando = [sys.executable, "main.py", "servidor", "--puerto", str(puerto)]
+        if argumentos.procesos:
+            comando += ["--procesos", str(argumentos.procesos)]
+
+        servicio = subprocess.Popen(comando, cwd=BASE_DIR, stdout=subprocess.DEVNULL)
+
+    try:
+        _esperar_servicio(anfitrion, puerto, 30)
+        if argumentos.calentamiento > 1:
+            asyncio.run(ejecutar_carga(
+                anfitrion,
+                puerto,
+                generar_solicitudes(argumentos.calentamiento, semilla=1),
+                argumentos.concurrencia,
+            ))
+
+        resultado = asyncio.run(ejecutar_carga(
+            anfitrion,
+            puerto,
+            generar_solicitudes(argumentos.solicitudes),
+            argumentos.concurrencia,
+        ))
+    finally:
+        if servicio is not None:
+            servicio.terminate()
+            servicio.wait()
+
+    print(
+        f">> {resultado['solicitudes']} solicitudes en {resultado['segundos']:.2f} s "
+        f"({resultado['solicitudes_por_segundo']:.1f} solicitudes/s), "
+        f"p50 {resultado['p50_ms']:.2f} ms, p99 {resultado['p99_ms']:.2f} ms, "
+        f"{resultado['errores']} errores"
+    )
+    if resultado["errores"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
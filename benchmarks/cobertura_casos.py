@@ -0,0 +1,121 @@
+"""
+Tabla de cobertura simulada: estima con ``simular_coberturas`` la
+cobertura real y el ancho medio de cada caso con varios tamaños de
+muestra y distribuciones de la población, y muestra el tiempo total.
+
+Los casos de medias y varianzas se simulan con cada distribución de
+``--distribuciones`` (los de dos muestras con la segunda desviación
+estándar igual a ``--razon-desv`` veces la primera, para que el caso
+6 quede fuera de su supuesto); los de proporciones, con cada
+proporción de ``--proporciones``.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.cobertura_casos
+    py -m benchmarks.cobertura_casos --replicas 10000000 --procesos 4
+    py -m benchmarks.cobertura_casos --casos 4 5 6 --tamanos 5 30 --distribuciones normal exponencial
+"""
+import argparse
+import time
+
+from src.services.cobertura import (
+    CASOS_COBERTURA,
+    DISTRIBUCIONES_POBLACION,
+    ConfiguracionCobertura,
+    simular_coberturas,
+)
+
+TAMANOS = (5, 10, 30, 100)
+PROPORCIONES = (0.05, 0.2, 0.5)
+
+_PROPORCIONES = (7, 8, "wilson", "agresti_coull", "clopper_pearson", "newcombe")
+
+def _caso(texto: str) -> int | str:
+    return int(texto) if texto.isdigit() else texto
+
+
+def configuraciones(
+        casos: list,
+        tamanos: list[int],
+        distribuciones: list[str],
+        proporciones: list[float],
+        porcentaje_confianza: int,
+        razon_desv: float,
+    ) -> list[ConfiguracionCobertura]:
+    """
+    :return: Una configuración por caso, tamaño y distribución (o
+    proporción).
+    :rtype: list[ConfiguracionCobertura]
+    """
+    resultado = []
+    for caso in casos:
+        for tamano in tamanos:
+            if caso in _PROPORCIONES:
+                resultado.extend(
+                    ConfiguracionCobertura(
+                        caso, tamano, porcentaje_confianza=porcentaje_confianza,
+                        proporcion_1=proporcion, proporcion_2=proporcion,
+                    )
+                    for proporcion in proporciones
+                )
+            else:
+                resultado.extend(
+                    ConfiguracionCobertura(
+                        caso, tamano, porcentaje_confianza=porcentaje_confianza,
+                        distribucion=distribucion, desv_estandar_2=razon_desv,
+                    )
+                    for distribucion in distribuciones
+                )
+
+    return resultado
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--casos", type=_caso, nargs="+", default=list(CASOS_COBERTURA))
+    parser.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS))
+    parser.add_argument(
+        "--distribuciones", nargs="+", choices=DISTRIBUCIONES_POBLACION,
+        default=list(DISTRIBUCIONES_POBLACION),
+    )
+    parser.add_argument("--proporciones", type=float, nargs="+", default=list(PROPORCIONES))
+    parser.add_argument("--porcentaje-confianza", type=int, default=95)
+    parser.add_argument("--razon-desv", type=float, default=3.0)
+    parser.add_argument("--replicas", type=int, default=100_000)
+    parser.add_argument("--procesos", type=int, default=None, help="Por defecto, uno por núcleo")
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args()
+
+    lista = configuraciones(
+        argumentos.casos,
+        argumentos.tamanos,
+        argumentos.distribuciones,
+        argumentos.proporciones,
+        argumentos.porcentaje_confianza,
+        argumentos.razon_desv,
+    )
+
+    inicio = time.perf_counter()
+    resultados = simular_coberturas(lista, argumentos.replicas, argumentos.semilla, argumentos.procesos)
+    transcurrido = time.perf_counter() - inicio
+
+    for resultado in resultados:
+        configuracion = resultado.configuracion
+        poblacion = (
+            f"P={configuracion.proporcion_1:g}"
+            if configuracion.caso in _PROPORCIONES else configuracion.distribucion
+        )
+        print(
+            f">> caso {configuracion.caso!s:<16} n={configuracion.tamano_muestra_1:<6} {poblacion:<12} "
+            f"cobertura {resultado.cobertura:.4f} ± {resultado.error_estandar:.4f} "
+            f"(debajo {resultado.por_debajo:.4f}, encima {resultado.por_encima:.4f}) "
+            f"ancho medio {resultado.ancho_medio:.4g}"
+        )
+
+    total = len(resultados) * argumentos.replicas
+    print(
+        f">> {len(resultados)} configuraciones, {total:,} intervalos en {transcurrido:.1f} s "
+        f"({total / transcurrido:,.0f} intervalos/s)"
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""
+Suite de benchmarks de los cálculos: mide cada ``intervalo_caso_1`` a
+``intervalo_caso_10`` y cada ``validar_*`` con muestras de distintos
+tamaños y guarda los resultados en JSON. ``comparar`` contrasta dos
+resultados y termina con código 1 si alguna medición empeoró más que
+el umbral.
+
+Los casos con muestras se miden por fases:
+
+- ``analisis``: convertir el texto de las muestras en ``Muestra``.
+- ``momentos``: calcular n, X̄ y M2 de las muestras ya analizadas.
+- ``valor_critico``: obtener el valor crítico con la caché vacía.
+- ``total``: el ``intervalo_caso_*`` completo a partir del texto y
+  con la caché de valores críticos vacía.
+
+Los casos de proporciones (7 y 8) solo tienen ``valor_critico`` y
+``total``. Cada medición guarda el tiempo mínimo y la mediana por
+llamada; ``comparar`` usa el mínimo, que es el menos ruidoso.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.suite_calculos ejecutar --salida base.json
+    py -m benchmarks.suite_calculos ejecutar --tamanos 10 1000 --salida nuevo.json
+    py -m benchmarks.suite_calculos comparar base.json nuevo.json --umbral 0.2 --piso-us 1
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from src.muestra import Muestra
+from src.services import calculos
+from src.services.momentos import AcumuladorMomentos
+from src.services.valores_criticos import backend_actual, limpiar_cache
+from src import validaciones
+
+TAMANOS = (10, 10**3, 10**5, 10**7)
+PORCENTAJE_CONFIANZA = 95
+DESV_ESTANDAR_POBLACIONAL = 10.0
+
+# Segundos mínimos de cada repetición; las funciones rápidas se
+# llaman varias veces por repetición para que el reloj alcance
+_TIEMPO_REPETICION = 0.1
+
+def _medir(funcion, repeticiones: int) -> dict:
+    """
+    Mide una función sin argumentos.
+
+    :return: Tiempo mínimo y mediana por llamada en segundos y el
+    número de llamadas por repetición.
+    :rtype: dict
+    """
+    inicio = time.perf_counter()
+    funcion()
+    primera = time.perf_counter() - inicio
+    llamadas = max(1, int(_TIEMPO_REPETICION / primera)) if primera > 0 else 1000
+
+    # Como timeit, sin recolector de basura durante la medición
+    tiempos = []
+    recolector_activo = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            for _ in range(llamadas):
+                funcion()
+            tiempos.append((time.perf_counter() - inicio) / llamadas)
+    finally:
+        if recolector_activo:
+            gc.enable()
+
+    return {
+        "minimo_s": min(tiempos),
+        "mediana_s": statistics.median(tiempos),
+        "llamadas": llamadas,
+    }
+
+
+def _texto(datos: np.ndarray) -> str:
+    return " ".join(map("{:.4f}".format, datos.tolist()))
+
+
+def _sin_cache(funcion):
+    def medir():
+        limpiar_cache()
+        return funcion()
+
+    return medir
+
+
+def _mediciones_casos(n: int, textos: tuple[str, str], muestras: tuple[Muestra, Muestra]):
+    """
+    Genera (función, fase, llamada) de cada caso para el tamaño n.
+    """
+    texto_1, texto_2 = textos
+    datos_1, datos_2 = (muestra.datos for muestra in muestras)
+    conf = PORCENTAJE_CONFIANZA
+    sigma = DESV_ESTANDAR_POBLACIONAL
+
+    def analisis_una():
+        Muestra.desde_texto(texto_1)
+
+    def analisis_dos():
+        Muestra.desde_texto(texto_1)
+        Muestra.desde_texto(texto_2)
+
+    def momentos_una():
+        AcumuladorMomentos.desde_arreglo(datos_1)
+
+    def momentos_dos():
+        AcumuladorMomentos.desde_arreglo(datos_1)
+        AcumuladorMomentos.desde_arreglo(datos_2)
+
+    z = lambda: calculos._calcular_valor_critico_normal_estandar(conf)
+    casos = {
+        1: (1, lambda: calculos.intervalo_caso_1(n, texto_1, conf, sigma), z),
+        2: (
+            1,
+            lambda: calculos.intervalo_caso_2(n, texto_1, conf),
+            lambda: calculos._calcular_valor_critico_t_student(conf, n, 2),
+        ),
+        3: (2, lambda: calculos.intervalo_caso_3(n, n, sigma, sigma, texto_1, texto_2, conf), z),
+        4: (2, lambda: calculos.intervalo_caso_4(n, n, texto_1, texto_2, conf), z),
+        5: (
+            2,
+            lambda: calculos.intervalo_caso_5(n, n, texto_1, texto_2, conf),
+            lambda: calculos._calcular_valor_critico_t_student(conf, 2 * n - 2, 5),
+        ),
+        6: (
+            2,
+            lambda: calculos.intervalo_caso_6(n, n, texto_1, texto_2, conf),
+            lambda: calculos._calcular_valor_critico_t_student(conf, 2 * n, 6),
+        ),
+        7: (0, lambda: calculos.intervalo_caso_7(n // 3, n, conf), z),
+        8: (0, lambda: calculos.intervalo_caso_8(n // 3, n // 2, n, n, conf), z),
+        9: (
+            1,
+            lambda: calculos.intervalo_caso_9(n, texto_1, conf),
+            lambda: calculos._calcular_valor_critico_chi_cuadrada(n, conf),
+        ),
+        10: (
+            2,
+            lambda: calculos.intervalo_caso_10(n, n, texto_1, texto_2, conf),
+            lambda: calculos._calcular_valor_critico_f(n, n, conf),
+        ),
+    }
+    for caso, (numero_muestras, total, valor_critico) in casos.items():
+        funcion = f"intervalo_caso_{caso}"
+        if numero_muestras:
+            yield funcion, "analisis", analisis_una if numero_muestras == 1 else analisis_dos
+            yield funcion, "momentos", momentos_una if numero_muestras == 1 else momentos_dos
+
+        yield funcion, "valor_critico", _sin_cache(valor_critico)
+        yield funcion, "total", _sin_cache(total)
+
+
+def _mediciones_validaciones(n: int, texto: str, muestra: Muestra):
+    yield "validar_formato_muestra", lambda: validaciones.validar_formato_muestra(texto)
+    yield "validar_numero_observaciones", lambda: validaciones.validar_numero_observaciones(muestra, n)
+    yield "validar_tamano_muestra", lambda: validaciones.validar_tamano_muestra(n)
+    yield "validar_numero_exitos", lambda: validaciones.validar_numero_exitos(n, n // 3)
+    yield "validar_porcentaje_confianza", lambda: validaciones.validar_porcentaje_confianza(95)
+    yield (
+        "validar_desviacion_estandar_poblacional",
+        lambda: validaciones.validar_desviacion_estandar_poblacional(DESV_ESTANDAR_POBLACIONAL),
+    )
+    yield (
+        "validar_condicion_normalidad_proporcion",
+        lambda: validaciones.validar_condicion_normalidad_proporcion(n, n // 3),
+    )
+    yield (
+        "validar_condicion_normalidad_dif_proporciones",
+        lambda: validaciones.validar_condicion_normalidad_dif_proporciones(n, n // 3, n, n // 2),
+    )
+
+
+def ejecutar(tamanos, repeticiones: int, semilla: int) -> dict:
+    """
+    Ejecuta la suite.
+
+    :return: Metadatos del entorno y lista de mediciones.
+    :rtype: dict
+    """
+    generador = np.random.default_rng(semilla)
+    mediciones = []
+
+    # Importa el backend de valores críticos antes de medir
+    calculos.intervalo_caso_2(3, "1 2 3", PORCENTAJE_CONFIANZA)
+
+    for n in tamanos:
+        textos = (
+            _texto(generador.normal(50, DESV_ESTANDAR_POBLACIONAL, n)),
+            _texto(generador.normal(53, DESV_ESTANDAR_POBLACIONAL, n)),
+        )
+        muestras = tuple(Muestra.desde_texto(texto) for texto in textos)
+
+        pendientes = [
+            (funcion, fase, llamada)
+            for funcion, fase, llamada in _mediciones_casos(n, textos, muestras)
+        ] + [
+            (funcion, "total", llamada)
+            for funcion, llamada in _mediciones_validaciones(n, textos[0], muestras[0])
+        ]
+        for funcion, fase, llamada in pendientes:
+            medicion = {"funcion": funcion, "fase": fase, "n": n, **_medir(llamada, repeticiones)}
+            mediciones.append(medicion)
+            print(
+                f">> {funcion:<46} {fase:<14} n={n:<9} "
+                f"{medicion['minimo_s'] * 1e6:14.2f} µs",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    return {
+        "metadatos": {
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "backend_cuantiles": backend_actual(),
+            "repeticiones": repeticiones,
+            "semilla": semilla,
+        },
+        "mediciones": mediciones,
+    }
+
+
+def comparar(base: dict, nuevo: dict, umbral: float, piso: float = 0.0) -> list[dict]:
+    """
+    Compara las mediciones comunes de dos resultados.
+
+    :param umbral: Aumento relativo máximo del tiempo mínimo (0.1 es
+    un 10%).
+    :type umbral: float
+    :param piso: Aumento absoluto en segundos por debajo del cual no
+    se considera regresión (evita el ruido de las funciones de
+    nanosegundos).
+    :type piso: float
+    :return: Una fila por medición común con la razón nuevo/base y si
+    es una regresión.
+    :rtype: list[dict]
+    """
+    clave = lambda medicion: (medicion["funcion"], medicion["fase"], medicion["n"])
+    anteriores = {clave(medicion): medicion for medicion in base["mediciones"]}
+    filas = []
+    for medicion in nuevo["mediciones"]:
+        anterior = anteriores.get(clave(medicion))
+        if anterior is None or anterior["minimo_s"] <= 0:
+            continue
+
+        razon = medicion["minimo_s"] / anterior["minimo_s"]
+        filas.append({
+            "funcion": medicion["funcion"],
+            "fase": medicion["fase"],
+            "n": medicion["n"],
+            "base_s": anterior["minimo_s"],
+            "nuevo_s": medicion["minimo_s"],
+            "razon": razon,
+            "regresion": (
+                razon > 1 + umbral and medicion["minimo_s"] - anterior["minimo_s"] > piso
+            ),
+        })
+
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    parser_ejecutar = subcomandos.add_parser("ejecutar", help="Ejecuta la suite")
+    parser_ejecutar.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS))
+    parser_ejecutar.add_argument("--repeticiones", type=int, default=7)
+    parser_ejecutar.add_argument("--semilla", type=int, default=0)
+    parser_ejecutar.add_argument("--salida", help="Archivo JSON de resultados (por defecto stdout)")
+
+    parser_comparar = subcomandos.add_parser("comparar", help="Compara dos resultados")
+    parser_comparar.add_argument("base")
+    parser_comparar.add_argument("nuevo")
+    parser_comparar.add_argument(
+        "--umbral", type=float, default=0.2, help="Aumento relativo máximo (por defecto 0.2)"
+    )
+    parser_comparar.add_argument(
+        "--piso-us", type=float, default=1.0, help="Aumento absoluto mínimo en µs (por defecto 1)"
+    )
+    argumentos = parser.parse_args()
+
+    if argumentos.comando == "ejecutar":
+        resultado = ejecutar(argumentos.tamanos, argumentos.repeticiones, argumentos.semilla)
+        contenido = json.dumps(resultado, ensure_ascii=False, indent=2)
+        if argumentos.salida:
+            with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+                archivo.write(contenido + "\n")
+        else:
+            print(contenido)
+
+        return
+
+    with open(argumentos.base, encoding="utf-8") as archivo:
+        base = json.load(archivo)
+
+    with open(argumentos.nuevo, encoding="utf-8") as archivo:
+        nuevo = json.load(archivo)
+
+    filas = comparar(base, nuevo, argumentos.umbral, argumentos.piso_us * 1e-6)
+    for fila in filas:
+        marca = "REGRESIÓN" if fila["regresion"] else ""
+        print(
+            f">> {fila['funcion']:<46} {fila['fase']:<14} n={fila['n']:<9} "
+            f"{fila['base_s'] * 1e6:12.2f} → {fila['nuevo_s'] * 1e6:12.2f} µs "
+            f"({fila['razon']:.2f}x) {marca}"
+        )
+
+    regresiones = sum(fila["regresion"] for fila in filas)
+    print(f">> {len(filas)} mediciones comparadas, {regresiones} regresiones (umbral {argumentos.umbral:.0%})")
+    if regresiones:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Verificación del tiempo de importación de la calculadora. En un
+proceso nuevo se importa ``main`` (lo necesario para mostrar el
+``MENU_PRINCIPAL``) y se comprueba que matplotlib y scipy no se
+hayan cargado. Termina con código 1 si alguno se cargó o si se
+excede el tiempo máximo indicado.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.tiempo_importacion
+    py -m benchmarks.tiempo_importacion --maximo-ms 500
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+MODULOS_PESADOS = ("matplotlib", "scipy")
+
+CODIGO_IMPORTACION = """
+import json, sys, time
+inicio = time.perf_counter()
+import main
+segundos = time.perf_counter() - inicio
+cargados = sorted({nombre.split(".")[0] for nombre in sys.modules} & set(sys.argv[1:]))
+print(json.dumps({"segundos": segundos, "cargados": cargados}))
+"""
+
+def medir_importacion() -> dict:
+    """
+    Importa ``main`` en un proceso nuevo.
+
+    :return: Segundos que tardó la importación y los módulos pesados
+    que se cargaron.
+    :rtype: dict
+    """
+    salida = subprocess.run(
+        [sys.executable, "-c", CODIGO_IMPORTACION, *MODULOS_PESADOS],
+        cwd=BASE_DIR,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(salida.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--maximo-ms", type=float, default=None)
+    argumentos = parser.parse_args()
+
+    resultado = medir_importacion()
+    milisegundos = resultado["segundos"] * 1000
+    print(f">> Importar main: {milisegundos:.1f} ms")
+
+    falla = False
+    if resultado["cargados"]:
+        print(f">> Se cargaron módulos pesados: {', '.join(resultado['cargados'])}")
+        falla = True
+
+    if argumentos.maximo_ms is not None and milisegundos > argumentos.maximo_ms:
+        print(f">> Se excedió el máximo de {argumentos.maximo_ms:.1f} ms")
+        falla = True
+
+    if falla:
+        sys.exit(1)
+
+    print(">> ok")
+
+if __name__ == "__main__":
+    main()
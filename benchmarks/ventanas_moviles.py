@@ -0,0 +1,98 @@
+"""
+Comprobación de los intervalos en ventanas móviles con un cambio de
+nivel: una serie con observaciones alrededor de ``--nivel`` seguidas
+de otras alrededor de 0 (ruido normal con σ = 1). Compara
+``intervalos_varianza_moviles`` con ``intervalo_caso_9`` sobre las
+mismas N observaciones en las ventanas alrededor del cambio y en
+otras al azar, muestra el tiempo de la pasada completa y termina con
+código 1 si algún intervalo no coincide.
+
+Solo se aceptan diferencias cuando la varianza exacta de la ventana
+cae en un empate del redondeo a cuatro decimales.
+
+Uso (desde la raíz del proyecto):
+    py -m benchmarks.ventanas_moviles
+    py -m benchmarks.ventanas_moviles --longitud 2000000 --ventana 500 --nivel 1e9
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from src.muestra import Muestra
+from src.services.calculos import intervalo_caso_9
+from src.services.ventanas import intervalos_varianza_moviles
+
+PORCENTAJE_CONFIANZA = 95
+
+# Distancia máxima de la varianza exacta a un empate de redondeo
+_EMPATE = 1e-9
+
+def _es_empate(varianza: float) -> bool:
+    escalada = varianza * 1e4
+    return abs(escalada - np.floor(escalada) - 0.5) * 1e-4 < _EMPATE
+
+
+def comprobar(longitud: int, tamano_ventana: int, nivel: float, muestras: int, semilla: int) -> int:
+    """
+    :return: Número de ventanas cuyo intervalo no coincide.
+    :rtype: int
+    """
+    generador = np.random.default_rng(semilla)
+    mitad = longitud // 2
+    serie = generador.standard_normal(longitud)
+    serie[:mitad] += nivel
+
+    inicio = time.perf_counter()
+    resultado = intervalos_varianza_moviles(serie, tamano_ventana, PORCENTAJE_CONFIANZA)
+    transcurrido = time.perf_counter() - inicio
+    ventanas = resultado.limite_inferior.shape[0]
+    print(f">> {ventanas:,} ventanas de {tamano_ventana} en {transcurrido:.3f} s")
+
+    cerca = np.arange(max(0, mitad - 2 * tamano_ventana), min(ventanas, mitad + 2 * tamano_ventana))
+    indices = np.union1d(cerca, generador.integers(0, ventanas, muestras))
+
+    diferencias = 0
+    for indice in indices.tolist():
+        datos = serie[indice:indice + tamano_ventana]
+        esperado = intervalo_caso_9(tamano_ventana, Muestra(datos), PORCENTAJE_CONFIANZA)
+        obtenido = (resultado.limite_inferior[indice], resultado.limite_superior[indice])
+        if np.allclose(obtenido, esperado[:2], rtol=1e-12, atol=0):
+            continue
+
+        if _es_empate(float(np.var(datos, ddof=1))):
+            continue
+
+        diferencias += 1
+        if diferencias <= 10:
+            print(
+                f">> ventana {indice}: [{obtenido[0]}, {obtenido[1]}] "
+                f"≠ [{esperado.limite_inferior}, {esperado.limite_superior}]"
+            )
+
+    print(f">> {indices.shape[0]} ventanas comparadas con intervalo_caso_9, {diferencias} diferencias")
+    return diferencias
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--longitud", type=int, default=1_000_000)
+    parser.add_argument("--ventana", type=int, default=50)
+    parser.add_argument("--nivel", type=float, default=1e6)
+    parser.add_argument("--muestras", type=int, default=2000, help="Ventanas al azar a comparar")
+    parser.add_argument("--semilla", type=int, default=0)
+    argumentos = parser.parse_args()
+
+    diferencias = comprobar(
+        argumentos.longitud,
+        argumentos.ventana,
+        argumentos.nivel,
+        argumentos.muestras,
+        argumentos.semilla,
+    )
+    if diferencias:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,27 @@
-from .coc_varianzas import intervalo_coc_varianzas_poblacionales
-from .dif_medias import intervalo_dif_medias_poblacionales
-from .dif_proporciones import intervalo_dif_proporciones
-from .media import intervalo_media_poblacional
-from .proporcion import intervalo_proporcion
-from .varianza import intervalo_varianza_poblacional
+"""
+Los módulos de cada caso se importan hasta que se pide alguna de sus
+funciones, para que el menú principal no pague el costo de importar
+los cálculos y las gráficas.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .coc_varianzas import intervalo_coc_varianzas_poblacionales
+    from .dif_medias import intervalo_dif_medias_poblacionales
+    from .dif_proporciones import intervalo_dif_proporciones
+    from .media import intervalo_media_poblacional
+    from .proporcion import intervalo_proporcion
+    from .varianza import intervalo_varianza_poblacional
+
+_SUBMODULOS = {
+    "intervalo_coc_varianzas_poblacionales": ".coc_varianzas",
+    "intervalo_dif_medias_poblacionales": ".dif_medias",
+    "intervalo_dif_proporciones": ".dif_proporciones",
+    "intervalo_media_poblacional": ".media",
+    "intervalo_proporcion": ".proporcion",
+    "intervalo_varianza_poblacional": ".varianza",
+}
 
 __all__ = [
     "intervalo_coc_varianzas_poblacionales",
@@ -13,3 +31,16 @@ __all__ = [
     "intervalo_proporcion",
     "intervalo_varianza_poblacional",
 ]
+
+def __getattr__(nombre: str):
+    submodulo = _SUBMODULOS.get(nombre)
+    if submodulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+    valor = getattr(importlib.import_module(submodulo, __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -10,15 +10,18 @@ from src import (
     RESET,
     ERR_NUMERO_ENTERO,
     ERR_TAMANO_MUESTRA,
-    ERR_FORMATO_OBSERVACIONES,
     ERR_NUMERO_OBSERVACIONES,
+    ERR_OBSERVACIONES_INSUFICIENTES,
     ERR_PORCENTAJE_CONFIANZA,
     mostrar_error,
 )
 
+from src.muestra import Muestra
+
+from src.instrumentacion import tramo
+
 from src.validaciones import (
     validar_tamano_muestra,
-    validar_formato_muestra,
     validar_numero_observaciones,
     validar_porcentaje_confianza,
 )
@@ -57,11 +60,16 @@ def intervalo_coc_varianzas_poblacionales() -> None:
         f"{BRIGHT_BLUE}\n>>>{RESET} "
         f"Escribe las {tamano_muestra_1} observaciones (x₁ x₂ ... xₙ): "
     )
-    if not validar_formato_muestra(muestra_1):
-        mostrar_error(ERR_FORMATO_OBSERVACIONES)
+    try:
+        with tramo("coc_varianzas.analisis"):
+            muestra_1 = Muestra.desde_texto(muestra_1)
+    except ValueError as error:
+        mostrar_error(str(error))
         return
-    
-    if not validar_numero_observaciones(muestra_1, tamano_muestra_1):
+
+    with tramo("coc_varianzas.validacion"):
+        valido = validar_numero_observaciones(muestra_1, tamano_muestra_1)
+    if not valido:
         mostrar_error(ERR_NUMERO_OBSERVACIONES)
         return
     
@@ -82,13 +90,22 @@ def intervalo_coc_varianzas_poblacionales() -> None:
         f"{BRIGHT_BLUE}\n>>>{RESET} "
         f"Escribe las {tamano_muestra_2} observaciones (x₁ x₂ ... xₙ): "
     )
-    if not validar_formato_muestra(muestra_2):
-        mostrar_error(ERR_FORMATO_OBSERVACIONES)
+    try:
+        with tramo("coc_varianzas.analisis"):
+            muestra_2 = Muestra.desde_texto(muestra_2)
+    except ValueError as error:
+        mostrar_error(str(error))
         return
-    
-    if not validar_numero_observaciones(muestra_2, tamano_muestra_2):
+
+    with tramo("coc_varianzas.validacion"):
+        valido = validar_numero_observaciones(muestra_2, tamano_muestra_2)
+    if not valido:
         mostrar_error(ERR_NUMERO_OBSERVACIONES)
         return
+
+    if tamano_muestra_1 < 2 or tamano_muestra_2 < 2:
+        mostrar_error(ERR_OBSERVACIONES_INSUFICIENTES)
+        return
     
     try:
         porcentaje_confianza = int(input(
@@ -120,60 +137,63 @@ def intervalo_coc_varianzas_poblacionales() -> None:
     
     # Calcular el intervalo de confianza y otro datos necesarios
     # para la gráfica
-    (
-        limite_superior,
-        limite_inferior,
-        varianzas_son_iguales,
-        coc_varianzas_muestrales,
-        grados_libertad_1,
-        grados_libertad_2,
-    ) = intervalo_caso_10(
-        tamano_muestra_1,
-        tamano_muestra_2,
-        muestra_1,
-        muestra_2,
-        porcentaje_confianza,
-    )
+    with tramo("coc_varianzas.caso_10"):
+        (
+            limite_inferior,
+            limite_superior,
+            varianzas_son_iguales,
+            coc_varianzas_muestrales,
+            grados_libertad_1,
+            grados_libertad_2,
+        ) = intervalo_caso_10(
+            tamano_muestra_1,
+            tamano_muestra_2,
+            muestra_1,
+            muestra_2,
+            porcentaje_confianza,
+        )
     
     if varianzas_son_iguales:
         print(
             f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-            f"[{limite_superior}, {limite_inferior}] y el 1 si se encuentra en este{RESET}"
+            f"[{limite_inferior}, {limite_superior}] y el 1 si se encuentra en este{RESET}"
         )
 
         # Graficar el intervalo de confianza
-        graficar_intervalo_f_caso_10(
-            coc_varianzas_muestrales,
-            limite_superior,
-            limite_inferior,
-            grados_libertad_1,
-            grados_libertad_2,
-            porcentaje_confianza,
-            (
-                f"Intervalo de confianza al {porcentaje_confianza} para σ₁² / σ₂²" 
-                "(dos muestras independientes de poblaciones normales)"
-                f"\n n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}, "
-                f"S₁² / S₂² = {coc_varianzas_muestrales}"
-            ),
-        )
+        with tramo("coc_varianzas.grafica"):
+            graficar_intervalo_f_caso_10(
+                coc_varianzas_muestrales,
+                limite_inferior,
+                limite_superior,
+                grados_libertad_1,
+                grados_libertad_2,
+                porcentaje_confianza,
+                (
+                    f"Intervalo de confianza al {porcentaje_confianza} para σ₁² / σ₂²" 
+                    "(dos muestras independientes de poblaciones normales)"
+                    f"\n n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}, "
+                    f"S₁² / S₂² = {coc_varianzas_muestrales}"
+                ),
+            )
     if not varianzas_son_iguales:
         print(
             f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-            f"[{limite_superior}, {limite_inferior}] y el 1 no se encuentra en este{RESET}"
+            f"[{limite_inferior}, {limite_superior}] y el 1 no se encuentra en este{RESET}"
         )
 
         # Graficar el intervalo de confianza
-        graficar_intervalo_f_caso_10(
-            coc_varianzas_muestrales,
-            limite_superior,
-            limite_inferior,
-            grados_libertad_1,
-            grados_libertad_2,
-            porcentaje_confianza,
-            (
-                f"Intervalo de confianza al {porcentaje_confianza} para σ₁² / σ₂²" 
-                "(dos muestras independientes de poblaciones normales)"
-                f"\n n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}, "
-                f"S₁² / S₂² = {coc_varianzas_muestrales}"
-            ),
-        )
+        with tramo("coc_varianzas.grafica"):
+            graficar_intervalo_f_caso_10(
+                coc_varianzas_muestrales,
+                limite_inferior,
+                limite_superior,
+                grados_libertad_1,
+                grados_libertad_2,
+                porcentaje_confianza,
+                (
+                    f"Intervalo de confianza al {porcentaje_confianza} para σ₁² / σ₂²" 
+                    "(dos muestras independientes de poblaciones normales)"
+                    f"\n n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}, "
+                    f"S₁² / S₂² = {coc_varianzas_muestrales}"
+                ),
+            )
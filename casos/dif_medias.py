@@ -10,8 +10,8 @@ from src import (
     RESET,
     ERR_NUMERO_ENTERO,
     ERR_TAMANO_MUESTRA,
-    ERR_FORMATO_OBSERVACIONES,
     ERR_NUMERO_OBSERVACIONES,
+    ERR_OBSERVACIONES_INSUFICIENTES,
     ERR_PORCENTAJE_CONFIANZA,
     ERR_NUMERO,
     ERR_DESV_ESTANDAR_POBLACIONAL,
@@ -19,9 +19,12 @@ from src import (
     mostrar_error,    
 )
 
+from src.muestra import Muestra
+
+from src.instrumentacion import tramo
+
 from src.validaciones import (
     validar_tamano_muestra,
-    validar_formato_muestra,
     validar_numero_observaciones,
     validar_porcentaje_confianza,
     validar_desviacion_estandar_poblacional,
@@ -76,11 +79,16 @@ def intervalo_dif_medias_poblacionales() -> None:
         f"{BRIGHT_BLUE}\n>>>{RESET} "
         f"Escribe las {tamano_muestra_1} observaciones (x₁ x₂ ... xₙ): "
     )
-    if not validar_formato_muestra(muestra_1):
-        mostrar_error(ERR_FORMATO_OBSERVACIONES)
+    try:
+        with tramo("dif_medias.analisis"):
+            muestra_1 = Muestra.desde_texto(muestra_1)
+    except ValueError as error:
+        mostrar_error(str(error))
         return
-    
-    if not validar_numero_observaciones(muestra_1, tamano_muestra_1):
+
+    with tramo("dif_medias.validacion"):
+        valido = validar_numero_observaciones(muestra_1, tamano_muestra_1)
+    if not valido:
         mostrar_error(ERR_NUMERO_OBSERVACIONES)
         return
     
@@ -101,11 +109,16 @@ def intervalo_dif_medias_poblacionales() -> None:
         f"{BRIGHT_BLUE}\n>>>{RESET} "
         f"Escribe las {tamano_muestra_2} observaciones (x₁ x₂ ... xₙ): "
     )
-    if not validar_formato_muestra(muestra_2):
-        mostrar_error(ERR_FORMATO_OBSERVACIONES)
+    try:
+        with tramo("dif_medias.analisis"):
+            muestra_2 = Muestra.desde_texto(muestra_2)
+    except ValueError as error:
+        mostrar_error(str(error))
         return
-    
-    if not validar_numero_observaciones(muestra_2, tamano_muestra_2):
+
+    with tramo("dif_medias.validacion"):
+        valido = validar_numero_observaciones(muestra_2, tamano_muestra_2)
+    if not valido:
         mostrar_error(ERR_NUMERO_OBSERVACIONES)
         return
     
@@ -170,41 +183,47 @@ def intervalo_dif_medias_poblacionales() -> None:
 
             # Calcular el intervalo de confianza y otro datos
             # necesarios para la gráfica
-            (
-                limite_superior,
-                limite_inferior,
-                dif_medias_muestrales,
-            ) = intervalo_caso_3(
-                tamano_muestra_1,
-                tamano_muestra_2,
-                desv_estandar_poblacional_1,
-                desv_estandar_poblacional_2,
-                muestra_1,
-                muestra_2,
-                porcentaje_confianza,
-            )
+            with tramo("dif_medias.caso_3"):
+                (
+                    limite_inferior,
+                    limite_superior,
+                    dif_medias_muestrales,
+                ) = intervalo_caso_3(
+                    tamano_muestra_1,
+                    tamano_muestra_2,
+                    desv_estandar_poblacional_1,
+                    desv_estandar_poblacional_2,
+                    muestra_1,
+                    muestra_2,
+                    porcentaje_confianza,
+                )
 
             print(
                 f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                f"[{limite_superior}, {limite_inferior}]{RESET}"
+                f"[{limite_inferior}, {limite_superior}]{RESET}"
             )
 
             # Graficar el intervalo de confianza
-            graficar_intervalo_z_caso_3(
-                dif_medias_muestrales,
-                limite_superior,
-                limite_inferior,
-                porcentaje_confianza,
-                (
-                    f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
-                    "(dos muestras independientes de poblaciones normales con varianzas "
-                    "conocidas)"
-                    f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}, "
-                    f"n₂ = {tamano_muestra_2}, σ₁ = {desv_estandar_poblacional_1}, "
-                    f"σ₂ = {desv_estandar_poblacional_2}"
+            with tramo("dif_medias.grafica"):
+                graficar_intervalo_z_caso_3(
+                    dif_medias_muestrales,
+                    limite_inferior,
+                    limite_superior,
+                    porcentaje_confianza,
+                    (
+                        f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
+                        "(dos muestras independientes de poblaciones normales con varianzas "
+                        "conocidas)"
+                        f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}, "
+                        f"n₂ = {tamano_muestra_2}, σ₁ = {desv_estandar_poblacional_1}, "
+                        f"σ₂ = {desv_estandar_poblacional_2}"
+                    )
                 )
-            )
         case "no":
+            if tamano_muestra_1 < 2 or tamano_muestra_2 < 2:
+                mostrar_error(ERR_OBSERVACIONES_INSUFICIENTES)
+                return
+
             varianzas_poblacionales = input(
                 f"{BRIGHT_BLUE}\n>>>{RESET} "
                 "¿Las varianzas poblacionales (σ₁ y σ₂) son diferentes (si / no / no se)? "
@@ -229,39 +248,41 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                         # Calcular el intervalo de confianza y otros
                         # datos necesarios para la gráfica
-                        (
-                            limite_superior,
-                            limite_inferior,
-                            dif_medias_muestrales,
-                            valor_critico_Z,
-                        ) = intervalo_caso_4(
-                            tamano_muestra_1,
-                            tamano_muestra_2,
-                            muestra_1,
-                            muestra_2,
-                            porcentaje_confianza,
-                        )
+                        with tramo("dif_medias.caso_4"):
+                            (
+                                limite_inferior,
+                                limite_superior,
+                                dif_medias_muestrales,
+                                valor_critico_Z,
+                            ) = intervalo_caso_4(
+                                tamano_muestra_1,
+                                tamano_muestra_2,
+                                muestra_1,
+                                muestra_2,
+                                porcentaje_confianza,
+                            )
 
                         print(
                             f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                            f"[{limite_superior}, {limite_inferior}]{RESET}"
+                            f"[{limite_inferior}, {limite_superior}]{RESET}"
                         )
 
                         # Graficar el intervalo de confianza
-                        graficar_intervalo_z_caso_4(
-                            dif_medias_muestrales,
-                            limite_superior,
-                            limite_inferior,
-                            valor_critico_Z,
-                            porcentaje_confianza,
-                            (
-                                f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂"
-                                "(dos muestras grandes (n > 30) independientes de poblaciones "
-                                "normales con varianzas diferentes y desconocidas)"
-                                f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}"
-                                f", n₂ = {tamano_muestra_2}"
-                            ),
-                        )
+                        with tramo("dif_medias.grafica"):
+                            graficar_intervalo_z_caso_4(
+                                dif_medias_muestrales,
+                                limite_inferior,
+                                limite_superior,
+                                valor_critico_Z,
+                                porcentaje_confianza,
+                                (
+                                    f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂"
+                                    "(dos muestras grandes (n > 30) independientes de poblaciones "
+                                    "normales con varianzas diferentes y desconocidas)"
+                                    f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}"
+                                    f", n₂ = {tamano_muestra_2}"
+                                ),
+                            )
                     # Determinar si las muestras son grandes o chicas
                     if tamano_muestra_1 < 30 and tamano_muestra_2 < 30:
                         # ================================
@@ -280,41 +301,43 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                         # Calcular el intervalo de confianza y otros
                         # datos necesarios para la gráfica
-                        (
-                            limite_superior,
-                            limite_inferior,
-                            dif_medias_muestrales,
-                            valor_critico_t,
-                            grados_libertad_efectivos,
-                        ) = intervalo_caso_5(
-                            tamano_muestra_1,
-                            tamano_muestra_2,
-                            muestra_1,
-                            muestra_2,
-                            porcentaje_confianza,
-                        )
+                        with tramo("dif_medias.caso_5"):
+                            (
+                                limite_inferior,
+                                limite_superior,
+                                dif_medias_muestrales,
+                                valor_critico_t,
+                                grados_libertad_efectivos,
+                            ) = intervalo_caso_5(
+                                tamano_muestra_1,
+                                tamano_muestra_2,
+                                muestra_1,
+                                muestra_2,
+                                porcentaje_confianza,
+                            )
 
                         print(
                             f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                            f"[{limite_superior}, {limite_inferior}]{RESET}"
+                            f"[{limite_inferior}, {limite_superior}]{RESET}"
                         )
 
                         # Graficar el intervalo de confianza
-                        graficar_intervalo_t_caso_5(
-                            dif_medias_muestrales,
-                            limite_superior,
-                            limite_inferior,
-                            valor_critico_t,
-                            grados_libertad_efectivos,
-                            porcentaje_confianza,
-                            (
-                                f"Intrvalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
-                                "(dos muestras chicas independientes de poblaciones normales "
-                                "con varianzas diferentes y desconocidas)"
-                                f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}"
-                                f", n₂ = {tamano_muestra_2}"
-                            ),
-                        )
+                        with tramo("dif_medias.grafica"):
+                            graficar_intervalo_t_caso_5(
+                                dif_medias_muestrales,
+                                limite_inferior,
+                                limite_superior,
+                                valor_critico_t,
+                                grados_libertad_efectivos,
+                                porcentaje_confianza,
+                                (
+                                    f"Intrvalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
+                                    "(dos muestras chicas independientes de poblaciones normales "
+                                    "con varianzas diferentes y desconocidas)"
+                                    f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}"
+                                    f", n₂ = {tamano_muestra_2}"
+                                ),
+                            )
                 case "no":
                     # ===============================
                     # Sexto caso de estimación
@@ -332,40 +355,42 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                     # Calcular el intervalo de confianza y otros datos
                     # necesarios para la gráfica
-                    (
-                        limite_superior,
-                        limite_inferior,
-                        dif_medias_muestrales,
-                        valor_critico_t,
-                        grados_libertad,
-                    ) = intervalo_caso_6(
-                        tamano_muestra_1,
-                        tamano_muestra_2,
-                        muestra_1,
-                        muestra_2,
-                        porcentaje_confianza,
-                    )
+                    with tramo("dif_medias.caso_6"):
+                        (
+                            limite_inferior,
+                            limite_superior,
+                            dif_medias_muestrales,
+                            valor_critico_t,
+                            grados_libertad,
+                        ) = intervalo_caso_6(
+                            tamano_muestra_1,
+                            tamano_muestra_2,
+                            muestra_1,
+                            muestra_2,
+                            porcentaje_confianza,
+                        )
 
                     print(
                         f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                        f"[{limite_superior}, {limite_inferior}]{RESET}"
+                        f"[{limite_inferior}, {limite_superior}]{RESET}"
                     )
 
                     # Graficar el intervalo de confianza
-                    graficar_intervalo_t_caso_6(
-                        dif_medias_muestrales,
-                        limite_superior,
-                        limite_inferior,
-                        valor_critico_t,
-                        grados_libertad,
-                        porcentaje_confianza,
-                        (
-                            f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
-                            "(dos muestras independientes de poblaciones normales con varianzas "
-                            f"iguales y desconocidas)\nX̄₁ - X̄₂ = {dif_medias_muestrales}, "
-                            f"n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}"
-                        ),
-                    )
+                    with tramo("dif_medias.grafica"):
+                        graficar_intervalo_t_caso_6(
+                            dif_medias_muestrales,
+                            limite_inferior,
+                            limite_superior,
+                            valor_critico_t,
+                            grados_libertad,
+                            porcentaje_confianza,
+                            (
+                                f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
+                                "(dos muestras independientes de poblaciones normales con varianzas "
+                                f"iguales y desconocidas)\nX̄₁ - X̄₂ = {dif_medias_muestrales}, "
+                                f"n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}"
+                            ),
+                        )
                 case "no se":
                     print(
                         f"\n{BRIGHT_BLUE}>>> Dado que no se conocen las varianzas poblacionales se "
@@ -378,18 +403,19 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                     # Calcular el intervalo de confianza y otros datos
                     # necesarios para la gráfica
-                    (
-                        limite_superior,
-                        limite_inferior,
-                        varianzas_son_iguales,
-                        *_,
-                    ) = intervalo_caso_10(
-                        tamano_muestra_1,
-                        tamano_muestra_2,
-                        muestra_1,
-                        muestra_2,
-                        porcentaje_confianza,
-                    )
+                    with tramo("dif_medias.caso_10"):
+                        (
+                            limite_inferior,
+                            limite_superior,
+                            varianzas_son_iguales,
+                            *_,
+                        ) = intervalo_caso_10(
+                            tamano_muestra_1,
+                            tamano_muestra_2,
+                            muestra_1,
+                            muestra_2,
+                            porcentaje_confianza,
+                        )
 
                     if varianzas_son_iguales:
                         # ===============================
@@ -408,46 +434,48 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                         # Calcular el intervalo de confianza y otros
                         # datos necesarios para la gráfica
-                        (
-                            limite_superior,
-                            limite_inferior,
-                            dif_medias_muestrales,
-                            valor_critico_t,
-                            grados_libertad,
-                        ) = intervalo_caso_6(
-                            tamano_muestra_1,
-                            tamano_muestra_2,
-                            muestra_1,
-                            muestra_2,
-                            porcentaje_confianza,
-                        )
+                        with tramo("dif_medias.caso_6"):
+                            (
+                                limite_inferior,
+                                limite_superior,
+                                dif_medias_muestrales,
+                                valor_critico_t,
+                                grados_libertad,
+                            ) = intervalo_caso_6(
+                                tamano_muestra_1,
+                                tamano_muestra_2,
+                                muestra_1,
+                                muestra_2,
+                                porcentaje_confianza,
+                            )
 
                         print(
                             f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                            f"[{limite_superior}, {limite_inferior}]{RESET}"
+                            f"[{limite_inferior}, {limite_superior}]{RESET}"
                         )
 
                         # Graficar el intervalo de confianza
-                        graficar_intervalo_t_caso_6(
-                            dif_medias_muestrales,
-                            limite_superior,
-                            limite_inferior,
-                            valor_critico_t,
-                            grados_libertad,
-                            porcentaje_confianza,
-                            (
-                                f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
-                                "(dos muestras independientes de poblaciones normales con "
-                                f"varianzas iguales y desconocidas)\nX̄₁ - X̄₂ = "
-                                f"{dif_medias_muestrales}, n₁ = {tamano_muestra_1}, "
-                                f"n₂ = {tamano_muestra_2}"
-                            ),
-                        )
+                        with tramo("dif_medias.grafica"):
+                            graficar_intervalo_t_caso_6(
+                                dif_medias_muestrales,
+                                limite_inferior,
+                                limite_superior,
+                                valor_critico_t,
+                                grados_libertad,
+                                porcentaje_confianza,
+                                (
+                                    f"Intervalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
+                                    "(dos muestras independientes de poblaciones normales con "
+                                    f"varianzas iguales y desconocidas)\nX̄₁ - X̄₂ = "
+                                    f"{dif_medias_muestrales}, n₁ = {tamano_muestra_1}, "
+                                    f"n₂ = {tamano_muestra_2}"
+                                ),
+                            )
 
                     if not varianzas_son_iguales:
                         print(
                             f"\n{BRIGHT_BLUE}>> El intervalo resultante es "
-                            f"[{limite_superior}, {limite_superior}] en donde el 1 si se "
+                            f"[{limite_inferior}, {limite_superior}] en donde el 1 no se "
                             "encuentra, entonces las varianzas poblacionales se consideran "
                             f"estadísticamente diferentes{RESET}"
                         )
@@ -472,39 +500,41 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                             # Calcular el intervalo de confianza y 
                             # otro datos necesarios para la gráfica
-                            (
-                                limite_superior,
-                                limite_inferior,
-                                dif_medias_muestrales,
-                                valor_critico_Z,
-                            ) = intervalo_caso_4(
-                                tamano_muestra_1,
-                                tamano_muestra_2,
-                                muestra_1,
-                                muestra_2,
-                                porcentaje_confianza,
-                            )
+                            with tramo("dif_medias.caso_4"):
+                                (
+                                    limite_inferior,
+                                    limite_superior,
+                                    dif_medias_muestrales,
+                                    valor_critico_Z,
+                                ) = intervalo_caso_4(
+                                    tamano_muestra_1,
+                                    tamano_muestra_2,
+                                    muestra_1,
+                                    muestra_2,
+                                    porcentaje_confianza,
+                                )
 
                             print(
                                 f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                                f"[{limite_superior}, {limite_inferior}]{RESET}"
+                                f"[{limite_inferior}, {limite_superior}]{RESET}"
                             )
 
                             # Graficar el intervalo de confianza
-                            graficar_intervalo_z_caso_4(
-                                dif_medias_muestrales,
-                                limite_superior,
-                                limite_inferior,
-                                valor_critico_Z,
-                                porcentaje_confianza,
-                                (
-                                    f"Intervalo de confianza al {porcentaje_confianza}% para "
-                                    "μ₁ - μ₂ (dos muestras grandes (n > 30) independientes de "
-                                    "poblaciones normales con varianzas diferentes y desconocidas)"
-                                    f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, "
-                                    f"n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}"
-                                ),
-                            )
+                            with tramo("dif_medias.grafica"):
+                                graficar_intervalo_z_caso_4(
+                                    dif_medias_muestrales,
+                                    limite_inferior,
+                                    limite_superior,
+                                    valor_critico_Z,
+                                    porcentaje_confianza,
+                                    (
+                                        f"Intervalo de confianza al {porcentaje_confianza}% para "
+                                        "μ₁ - μ₂ (dos muestras grandes (n > 30) independientes de "
+                                        "poblaciones normales con varianzas diferentes y desconocidas)"
+                                        f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, "
+                                        f"n₁ = {tamano_muestra_1}, n₂ = {tamano_muestra_2}"
+                                    ),
+                                )
                         
                         # Determinar si las muestras son grandes o 
                         # chicas
@@ -526,41 +556,43 @@ def intervalo_dif_medias_poblacionales() -> None:
 
                             # Calcular el intervalo de confianza y 
                             # otro datos necesarios para la gráfica
-                            (
-                                limite_superior,
-                                limite_inferior,
-                                dif_medias_muestrales,
-                                valor_critico_t,
-                                grados_libertad_efectivos,
-                            ) = intervalo_caso_5(
-                                tamano_muestra_1,
-                                tamano_muestra_2,
-                                muestra_1,
-                                muestra_2,
-                                porcentaje_confianza,
-                            )
+                            with tramo("dif_medias.caso_5"):
+                                (
+                                    limite_inferior,
+                                    limite_superior,
+                                    dif_medias_muestrales,
+                                    valor_critico_t,
+                                    grados_libertad_efectivos,
+                                ) = intervalo_caso_5(
+                                    tamano_muestra_1,
+                                    tamano_muestra_2,
+                                    muestra_1,
+                                    muestra_2,
+                                    porcentaje_confianza,
+                                )
 
                             print(
                                 f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                                f"[{limite_superior}, {limite_inferior}]{RESET}"
+                                f"[{limite_inferior}, {limite_superior}]{RESET}"
                             )
 
                             # Graficar el intervalo de confianza
-                            graficar_intervalo_t_caso_5(
-                                dif_medias_muestrales,
-                                limite_superior,
-                                limite_inferior,
-                                valor_critico_t,
-                                grados_libertad_efectivos,
-                                porcentaje_confianza,
-                                (
-                                    f"Intrvalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
-                                    "(dos muestras chicas independientes de poblaciones normales "
-                                    "con varianzas diferentes y desconocidas)"
-                                    f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}, "
-                                    f"n₂ = {tamano_muestra_2}"
-                                ),
-                            )
+                            with tramo("dif_medias.grafica"):
+                                graficar_intervalo_t_caso_5(
+                                    dif_medias_muestrales,
+                                    limite_inferior,
+                                    limite_superior,
+                                    valor_critico_t,
+                                    grados_libertad_efectivos,
+                                    porcentaje_confianza,
+                                    (
+                                        f"Intrvalo de confianza al {porcentaje_confianza}% para μ₁ - μ₂ "
+                                        "(dos muestras chicas independientes de poblaciones normales "
+                                        "con varianzas diferentes y desconocidas)"
+                                        f"\nX̄₁ - X̄₂ = {dif_medias_muestrales}, n₁ = {tamano_muestra_1}, "
+                                        f"n₂ = {tamano_muestra_2}"
+                                    ),
+                                )
                 case _:
                     mostrar_error(ERR_OPCION_NO_VALIDA)
         case _:
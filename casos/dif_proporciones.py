@@ -12,11 +12,11 @@ from src import (
     ERR_NUMERO_ENTERO,
     ERR_TAMANO_MUESTRA,
     ERR_PORCENTAJE_CONFIANZA,
-    ERR_APROXIMACION_NORMAL,
     mostrar_error,
-    mostrar_error_especial,
 )
 
+from src.instrumentacion import tramo
+
 from src.validaciones import (
     validar_tamano_muestra,
     validar_numero_exitos,
@@ -25,11 +25,13 @@ from src.validaciones import (
 )
 
 from src.advertencias import (
+    ad_aproximacion_normal,
     ad_porcentaje_confianza,
 )
 
 from src.services.calculos import (
     intervalo_caso_8,
+    intervalo_newcombe,
 )
 
 from src.visualization.graficas import (
@@ -63,10 +65,12 @@ def intervalo_dif_proporciones() -> None:
         mostrar_error(ERR_NUMERO_ENTERO)
         return
     
-    if not validar_numero_exitos(tamano_muestra_1, numero_exitos_1):
+    # X = 0 y X = n no cumplen las condiciones de normalidad, así que
+    # más adelante se resuelven con el método sin aproximación normal
+    if not validar_numero_exitos(tamano_muestra_1, numero_exitos_1, incluir_extremos=True):
         print(
             f"{BRIGHT_RED}>> ERROR{RESET} "
-            f"Debe ser mayor o igual a 1, o menor o igual a {tamano_muestra_1}"
+            f"Debe ser mayor o igual a 0 y menor o igual a {tamano_muestra_1}"
         )
         return
     
@@ -92,10 +96,12 @@ def intervalo_dif_proporciones() -> None:
         mostrar_error(ERR_NUMERO_ENTERO)
         return
     
-    if not validar_numero_exitos(tamano_muestra_2, numero_exitos_2):
+    # X = 0 y X = n no cumplen las condiciones de normalidad, así que
+    # más adelante se resuelven con el método sin aproximación normal
+    if not validar_numero_exitos(tamano_muestra_2, numero_exitos_2, incluir_extremos=True):
         print(
             f"{BRIGHT_RED}>> ERROR{RESET} "
-            f"Debe ser mayor o igual a 1, o menor o igual a {tamano_muestra_2}"
+            f"Debe ser mayor o igual a 0 y menor o igual a {tamano_muestra_2}"
         )
         return
     
@@ -114,13 +120,29 @@ def intervalo_dif_proporciones() -> None:
     
     ad_porcentaje_confianza(porcentaje_confianza)
 
-    if not validar_condicion_normalidad_dif_proporciones(
-        tamano_muestra_1,
-        numero_exitos_1,
-        tamano_muestra_2,
-        numero_exitos_2,
-    ):
-        mostrar_error_especial(ERR_APROXIMACION_NORMAL)
+    with tramo("dif_proporciones.validacion"):
+        valido = validar_condicion_normalidad_dif_proporciones(
+            tamano_muestra_1,
+            numero_exitos_1,
+            tamano_muestra_2,
+            numero_exitos_2,
+        )
+    if not valido:
+        # Sin aproximación normal se usa el intervalo de Newcombe, que
+        # no se grafica porque no es simétrico alrededor de 𝑝₁ - 𝑝₂
+        ad_aproximacion_normal("Newcombe")
+        with tramo("dif_proporciones.newcombe"):
+            limite_inferior, limite_superior, _, _ = intervalo_newcombe(
+                numero_exitos_1,
+                numero_exitos_2,
+                tamano_muestra_1,
+                tamano_muestra_2,
+                porcentaje_confianza,
+            )
+        print(
+            f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
+            f"[{limite_inferior}, {limite_superior}]{RESET}"
+        )
         return
     
     # ================================
@@ -137,36 +159,38 @@ def intervalo_dif_proporciones() -> None:
     
     # Calcular el intervalo de confianza y otro datos necesarios
     # para la gráfica
-    (
-        limite_superior,
-        limite_inferior,
-        dif_proporciones_muestrales,
-        valor_critico_Z,
-    ) = intervalo_caso_8(
-        numero_exitos_1,
-        numero_exitos_2,
-        tamano_muestra_1,
-        tamano_muestra_2,
-        porcentaje_confianza,
-    )
+    with tramo("dif_proporciones.caso_8"):
+        (
+            limite_inferior,
+            limite_superior,
+            dif_proporciones_muestrales,
+            valor_critico_Z,
+        ) = intervalo_caso_8(
+            numero_exitos_1,
+            numero_exitos_2,
+            tamano_muestra_1,
+            tamano_muestra_2,
+            porcentaje_confianza,
+        )
 
     print(
         f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-        f"[{limite_superior}, {limite_inferior}]{RESET}"
+        f"[{limite_inferior}, {limite_superior}]{RESET}"
     )
 
     # Graficar el intervalo de confianza
-    graficar_intervalo_z_caso_8(
-        dif_proporciones_muestrales,
-        limite_superior,
-        limite_inferior,
-        valor_critico_Z,
-        porcentaje_confianza,
-        (
-            f"Intervalo de confianza al {porcentaje_confianza}% para P₁ - P₂"
-            "(dos muestras grandes e independientes de una distribución normal)"
-            f"\n X₁ = {numero_exitos_1}, N₁ = {tamano_muestra_1}, " 
-            f"X₂ = {numero_exitos_2}, N₂ = {tamano_muestra_2}, "
-            f"p₁ - p₂ = {dif_proporciones_muestrales}"
-        ),
-    )
\ No newline at end of file
+    with tramo("dif_proporciones.grafica"):
+        graficar_intervalo_z_caso_8(
+            dif_proporciones_muestrales,
+            limite_inferior,
+            limite_superior,
+            valor_critico_Z,
+            porcentaje_confianza,
+            (
+                f"Intervalo de confianza al {porcentaje_confianza}% para P₁ - P₂"
+                "(dos muestras grandes e independientes de una distribución normal)"
+                f"\n X₁ = {numero_exitos_1}, N₁ = {tamano_muestra_1}, " 
+                f"X₂ = {numero_exitos_2}, N₂ = {tamano_muestra_2}, "
+                f"p₁ - p₂ = {dif_proporciones_muestrales}"
+            ),
+        )
\ No newline at end of file
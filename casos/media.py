@@ -10,8 +10,8 @@ from src import (
     RESET,
     ERR_NUMERO_ENTERO,
     ERR_TAMANO_MUESTRA,
-    ERR_FORMATO_OBSERVACIONES,
     ERR_NUMERO_OBSERVACIONES,
+    ERR_OBSERVACIONES_INSUFICIENTES,
     ERR_PORCENTAJE_CONFIANZA,
     ERR_DESV_ESTANDAR_POBLACIONAL,
     ERR_NUMERO,
@@ -19,9 +19,12 @@ from src import (
     mostrar_error,
 )
 
+from src.muestra import Muestra
+
+from src.instrumentacion import tramo
+
 from src.validaciones import (
     validar_tamano_muestra,
-    validar_formato_muestra,
     validar_numero_observaciones,
     validar_porcentaje_confianza,
     validar_desviacion_estandar_poblacional,
@@ -65,11 +68,16 @@ def intervalo_media_poblacional() -> None:
         f"{BRIGHT_BLUE}\n>>>{RESET} "
         f"Escribe las {tamano_muestra} observaciones (x₁ x₂ ... xₙ): "
     )
-    if not validar_formato_muestra(muestra):
-        mostrar_error(ERR_FORMATO_OBSERVACIONES)
+    try:
+        with tramo("media.analisis"):
+            muestra = Muestra.desde_texto(muestra)
+    except ValueError as error:
+        mostrar_error(str(error))
         return
-    
-    if not validar_numero_observaciones(muestra, tamano_muestra):
+
+    with tramo("media.validacion"):
+        valido = validar_numero_observaciones(muestra, tamano_muestra)
+    if not valido:
         mostrar_error(ERR_NUMERO_OBSERVACIONES)
         return
     
@@ -125,53 +133,60 @@ def intervalo_media_poblacional() -> None:
             
             # Calcular el intervalo de confianza y otro datos
             # necesarios para la gráfica
-            (
-                limite_superior,
-                limite_inferior,
-                media_muestral,
-            ) = intervalo_caso_1(
-                tamano_muestra,
-                muestra,
-                porcentaje_confianza,
-                desv_estandar_poblacional,
-            )
+            with tramo("media.caso_1"):
+                (
+                    limite_inferior,
+                    limite_superior,
+                    media_muestral,
+                ) = intervalo_caso_1(
+                    tamano_muestra,
+                    muestra,
+                    porcentaje_confianza,
+                    desv_estandar_poblacional,
+                )
 
             print(
                 f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                f"[{limite_superior}, {limite_inferior}]{RESET}"
+                f"[{limite_inferior}, {limite_superior}]{RESET}"
             )
             
             # Determinar si la muestra es grande o pequeña y mostrar la
             # gráfica correspindiente
             if tamano_muestra >= 30:
-                graficar_intervalo_z_caso_1(
-                    media_muestral,
-                    limite_superior,
-                    limite_inferior,
-                    desv_estandar_poblacional,
-                    tamano_muestra,
-                    porcentaje_confianza,
-                    (
-                        f"Intervalo de confianza al {porcentaje_confianza}% para μ "
-                        f"(muestra grande y varianza conocida)\n X̄ = {media_muestral}, "
-                        f"n = {tamano_muestra}, σ = {desv_estandar_poblacional}"
-                    ),
-                )
+                with tramo("media.grafica"):
+                    graficar_intervalo_z_caso_1(
+                        media_muestral,
+                        limite_inferior,
+                        limite_superior,
+                        desv_estandar_poblacional,
+                        tamano_muestra,
+                        porcentaje_confianza,
+                        (
+                            f"Intervalo de confianza al {porcentaje_confianza}% para μ "
+                            f"(muestra grande y varianza conocida)\n X̄ = {media_muestral}, "
+                            f"n = {tamano_muestra}, σ = {desv_estandar_poblacional}"
+                        ),
+                    )
             else:
-                graficar_intervalo_z_caso_1(
-                    media_muestral,
-                    limite_superior,
-                    limite_inferior,
-                    desv_estandar_poblacional,
-                    tamano_muestra,
-                    porcentaje_confianza,
-                    (
-                        f"Intervalo de confianza al {porcentaje_confianza}% para μ "
-                        f"(muestra pequeña y varianza conocida)\n X̄ = {media_muestral}, "
-                        f"n = {tamano_muestra}, σ = {desv_estandar_poblacional}"
-                    ),
-                )
+                with tramo("media.grafica"):
+                    graficar_intervalo_z_caso_1(
+                        media_muestral,
+                        limite_inferior,
+                        limite_superior,
+                        desv_estandar_poblacional,
+                        tamano_muestra,
+                        porcentaje_confianza,
+                        (
+                            f"Intervalo de confianza al {porcentaje_confianza}% para μ "
+                            f"(muestra pequeña y varianza conocida)\n X̄ = {media_muestral}, "
+                            f"n = {tamano_muestra}, σ = {desv_estandar_poblacional}"
+                        ),
+                    )
         case "no":
+            if tamano_muestra < 2:
+                mostrar_error(ERR_OBSERVACIONES_INSUFICIENTES)
+                return
+
             # =================================
             # Segundo caso de estimación
             # =================================
@@ -190,47 +205,50 @@ def intervalo_media_poblacional() -> None:
 
             # Calcular el intervalo de confianza y otro datos
             # necesarios para la gráfica
-            (
-                limite_superior,
-                limite_inferior,
-                media_muestral,
-                desv_estandar_muestral,
-            ) = intervalo_caso_2(tamano_muestra, muestra, porcentaje_confianza)
+            with tramo("media.caso_2"):
+                (
+                    limite_inferior,
+                    limite_superior,
+                    media_muestral,
+                    desv_estandar_muestral,
+                ) = intervalo_caso_2(tamano_muestra, muestra, porcentaje_confianza)
 
             print(
                 f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-                f"[{limite_superior}, {limite_inferior}]{RESET}"
+                f"[{limite_inferior}, {limite_superior}]{RESET}"
             )
 
             # Determinar si la muestra es grande o pequeña y mostrar la
             # gráfica correspindiente
             if tamano_muestra >= 30:
-                graficar_intervalo_t_caso_2(
-                    media_muestral,
-                    limite_superior,
-                    limite_inferior,
-                    desv_estandar_muestral,
-                    tamano_muestra,
-                    porcentaje_confianza,
-                    (
-                        f"Intervalo de confianza al {porcentaje_confianza}% para μ "
-                        f"(muestra grande y varianza desconocida)\nX̄ = {media_muestral}, "
-                        f"n = {tamano_muestra}"
-                    ),
-                )
+                with tramo("media.grafica"):
+                    graficar_intervalo_t_caso_2(
+                        media_muestral,
+                        limite_inferior,
+                        limite_superior,
+                        desv_estandar_muestral,
+                        tamano_muestra,
+                        porcentaje_confianza,
+                        (
+                            f"Intervalo de confianza al {porcentaje_confianza}% para μ "
+                            f"(muestra grande y varianza desconocida)\nX̄ = {media_muestral}, "
+                            f"n = {tamano_muestra}"
+                        ),
+                    )
             else:
-                graficar_intervalo_t_caso_2(
-                    media_muestral,
-                    limite_superior,
-                    limite_inferior,
-                    desv_estandar_muestral,
-                    tamano_muestra,
-                    porcentaje_confianza,
-                    (
-                        f"Intervalo de confianza al {porcentaje_confianza}% para μ "
-                        f"(muestra pequeña y varianza desconocida)\nX̄ = {media_muestral}, "
-                        f"n = {tamano_muestra}"
-                    ),
-                )
+                with tramo("media.grafica"):
+                    graficar_intervalo_t_caso_2(
+                        media_muestral,
+                        limite_inferior,
+                        limite_superior,
+                        desv_estandar_muestral,
+                        tamano_muestra,
+                        porcentaje_confianza,
+                        (
+                            f"Intervalo de confianza al {porcentaje_confianza}% para μ "
+                            f"(muestra pequeña y varianza desconocida)\nX̄ = {media_muestral}, "
+                            f"n = {tamano_muestra}"
+                        ),
+                    )
         case _:
             mostrar_error(ERR_OPCION_NO_VALIDA)
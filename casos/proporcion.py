@@ -12,11 +12,11 @@ from src import (
     ERR_NUMERO_ENTERO,
     ERR_TAMANO_MUESTRA,
     ERR_PORCENTAJE_CONFIANZA,
-    ERR_APROXIMACION_NORMAL,
     mostrar_error,
-    mostrar_error_especial,
 )
 
+from src.instrumentacion import tramo
+
 from src.validaciones import (
     validar_tamano_muestra,
     validar_numero_exitos,
@@ -25,11 +25,13 @@ from src.validaciones import (
 )
 
 from src.advertencias import (
+    ad_aproximacion_normal,
     ad_porcentaje_confianza,
 )
 
 from src.services.calculos import (
     intervalo_caso_7,
+    intervalo_wilson,
 )
 
 from src.visualization.graficas import (
@@ -62,10 +64,12 @@ def intervalo_proporcion() -> None:
         mostrar_error(ERR_NUMERO_ENTERO)
         return
     
-    if not validar_numero_exitos(tamano_muestra, numero_exitos):
+    # X = 0 y X = n no cumplen las condiciones de normalidad, así que
+    # más adelante se resuelven con el método sin aproximación normal
+    if not validar_numero_exitos(tamano_muestra, numero_exitos, incluir_extremos=True):
         print(
             f"{BRIGHT_RED}>> ERROR{RESET} "
-            f"Debe ser mayor o igual a 1, o menor o igual a {tamano_muestra}"
+            f"Debe ser mayor o igual a 0 y menor o igual a {tamano_muestra}"
         )
         return
     
@@ -84,11 +88,25 @@ def intervalo_proporcion() -> None:
     
     ad_porcentaje_confianza(porcentaje_confianza)
 
-    if not validar_condicion_normalidad_proporcion(
-        tamano_muestra,
-        numero_exitos,
-    ):
-        mostrar_error_especial(ERR_APROXIMACION_NORMAL)
+    with tramo("proporcion.validacion"):
+        valido = validar_condicion_normalidad_proporcion(
+            tamano_muestra,
+            numero_exitos,
+        )
+    if not valido:
+        # Sin aproximación normal se usa el intervalo de Wilson, que
+        # no se grafica porque no es simétrico alrededor de 𝑝
+        ad_aproximacion_normal("Wilson")
+        with tramo("proporcion.wilson"):
+            limite_inferior, limite_superior, _, _ = intervalo_wilson(
+                numero_exitos,
+                tamano_muestra,
+                porcentaje_confianza,
+            )
+        print(
+            f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
+            f"[{limite_inferior}, {limite_superior}]{RESET}"
+        )
         return
     
     # =================================
@@ -103,28 +121,30 @@ def intervalo_proporcion() -> None:
 
     # Calcular el intervalo de confianza y otro datos necesarios
     # para la gráfica
-    (
-        limite_superior,
-        limite_inferior,
-        proporcion_muestral,
-        valor_critico_Z,
-    ) = intervalo_caso_7(numero_exitos, tamano_muestra, porcentaje_confianza)
+    with tramo("proporcion.caso_7"):
+        (
+            limite_inferior,
+            limite_superior,
+            proporcion_muestral,
+            valor_critico_Z,
+        ) = intervalo_caso_7(numero_exitos, tamano_muestra, porcentaje_confianza)
 
     print(
         f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-        f"[{limite_superior}, {limite_inferior}]{RESET}"
+        f"[{limite_inferior}, {limite_superior}]{RESET}"
     )
 
     # Graficar el intervalo de confianza
-    graficar_intervalo_z_caso_7(
-        proporcion_muestral,
-        limite_superior,
-        limite_inferior,
-        valor_critico_Z,
-        porcentaje_confianza,
-        (
-            f"Intervalo de confianza al {porcentaje_confianza}% para P "
-            f"(muestra grande con P pequeña)\n X = {numero_exitos}, "
-            f"N = {tamano_muestra}, p = {proporcion_muestral}"
-        ),
-    )
+    with tramo("proporcion.grafica"):
+        graficar_intervalo_z_caso_7(
+            proporcion_muestral,
+            limite_inferior,
+            limite_superior,
+            valor_critico_Z,
+            porcentaje_confianza,
+            (
+                f"Intervalo de confianza al {porcentaje_confianza}% para P "
+                f"(muestra grande con P pequeña)\n X = {numero_exitos}, "
+                f"N = {tamano_muestra}, p = {proporcion_muestral}"
+            ),
+        )
@@ -10,15 +10,18 @@ from src import (
     RESET,
     ERR_NUMERO_ENTERO,
     ERR_TAMANO_MUESTRA,
-    ERR_FORMATO_OBSERVACIONES,
     ERR_NUMERO_OBSERVACIONES,
+    ERR_OBSERVACIONES_INSUFICIENTES,
     ERR_PORCENTAJE_CONFIANZA,
     mostrar_error,
 )
 
+from src.muestra import Muestra
+
+from src.instrumentacion import tramo
+
 from src.validaciones import (
     validar_tamano_muestra,
-    validar_formato_muestra,
     validar_numero_observaciones,
     validar_porcentaje_confianza,
 )
@@ -56,13 +59,22 @@ def intervalo_varianza_poblacional() -> None:
         f"{BRIGHT_BLUE}\n>>>{RESET} "
         f"Escribe las {tamano_muestra} observaciones (x₁ x₂ ... xₙ): "
     )
-    if not validar_formato_muestra(muestra):
-        mostrar_error(ERR_FORMATO_OBSERVACIONES)
+    try:
+        with tramo("varianza.analisis"):
+            muestra = Muestra.desde_texto(muestra)
+    except ValueError as error:
+        mostrar_error(str(error))
         return
-    
-    if not validar_numero_observaciones(muestra, tamano_muestra):
+
+    with tramo("varianza.validacion"):
+        valido = validar_numero_observaciones(muestra, tamano_muestra)
+    if not valido:
         mostrar_error(ERR_NUMERO_OBSERVACIONES)
         return
+
+    if tamano_muestra < 2:
+        mostrar_error(ERR_OBSERVACIONES_INSUFICIENTES)
+        return
     
     try:
         porcentaje_confianza = int(input(
@@ -91,27 +103,29 @@ def intervalo_varianza_poblacional() -> None:
 
     # Calcular el intervalo de confianza y otro datos necesarios
     # para la gráfica
-    (
-        limite_superior,
-        limite_inferior,
-        varianza_muestral,
-        grados_libertad
-    ) = intervalo_caso_9(tamano_muestra, muestra, porcentaje_confianza)
+    with tramo("varianza.caso_9"):
+        (
+            limite_inferior,
+            limite_superior,
+            varianza_muestral,
+            grados_libertad
+        ) = intervalo_caso_9(tamano_muestra, muestra, porcentaje_confianza)
 
     print(
         f"\n{BRIGHT_GREEN}>> El intervalo de confianza es "
-        f"[{limite_superior}, {limite_inferior}]{RESET}"
+        f"[{limite_inferior}, {limite_superior}]{RESET}"
     )
 
     # Graficar el intervalo de confianza
-    graficar_intervalo_chi2_caso_9(
-        varianza_muestral,
-        limite_superior,
-        limite_inferior,
-        grados_libertad,
-        porcentaje_confianza,
-        (
-            f"Intervalo de confianza al {porcentaje_confianza}% para σ²"
-            f"(una muestra cualquiera)\nn = {tamano_muestra}, S² = {varianza_muestral}"
-        ),
-    )
+    with tramo("varianza.grafica"):
+        graficar_intervalo_chi2_caso_9(
+            varianza_muestral,
+            limite_inferior,
+            limite_superior,
+            grados_libertad,
+            porcentaje_confianza,
+            (
+                f"Intervalo de confianza al {porcentaje_confianza}% para σ²"
+                f"(una muestra cualquiera)\nn = {tamano_muestra}, S² = {varianza_muestral}"
+            ),
+        )
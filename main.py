@@ -8,7 +8,10 @@ confianza para medias, varianzas y proporciones poblaciones.
 
 Uso:
     py main.py
+    py main.py <parámetro> [opciones]    (sin menú, ver --help)
 """
+import sys
+
 from src import (
     esperar_enter,
     limpiar_consola,
@@ -26,14 +29,8 @@ from config import (
     MENU_PRINCIPAL,
 )
 
-from casos import (
-    intervalo_coc_varianzas_poblacionales,
-    intervalo_dif_medias_poblacionales,
-    intervalo_dif_proporciones,
-    intervalo_media_poblacional,
-    intervalo_proporcion,
-    intervalo_varianza_poblacional,
-)
+# Cada caso se importa hasta que se elige en el menú (ver casos/__init__.py)
+import casos
 
 def main() -> None:
     """Ejecuta el menú principal del programa."""
@@ -45,32 +42,32 @@ def main() -> None:
         match param:
             case "1":
                 print(INFO_MEDIA_POBLACIONAL)
-                intervalo_media_poblacional()
+                casos.intervalo_media_poblacional()
                 esperar_enter()
                 limpiar_consola()
             case "2":
                 print(INFO_DIF_MEDIAS_POBLACIONALES)
-                intervalo_dif_medias_poblacionales()
+                casos.intervalo_dif_medias_poblacionales()
                 esperar_enter()
                 limpiar_consola()
             case "3":
                 print(INFO_PROPORCION)
-                intervalo_proporcion()
+                casos.intervalo_proporcion()
                 esperar_enter()
                 limpiar_consola()
             case "4":
                 print(INFO_DIF_PROPORCIONES)
-                intervalo_dif_proporciones()
+                casos.intervalo_dif_proporciones()
                 esperar_enter()
                 limpiar_consola()
             case "5":
                 print(INFO_VARIANZA_POBLACIONAL)
-                intervalo_varianza_poblacional()
+                casos.intervalo_varianza_poblacional()
                 esperar_enter()
                 limpiar_consola()
             case "6":
                 print(INFO_COC_VARIANZAS_POBLACIONALES)
-                intervalo_coc_varianzas_poblacionales()
+                casos.intervalo_coc_varianzas_poblacionales()
                 esperar_enter()
                 limpiar_consola()
             case "salir":
@@ -81,4 +78,9 @@ def main() -> None:
                 limpiar_consola()
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        from src.linea_comandos import ejecutar
+
+        sys.exit(ejecutar(sys.argv[1:]))
+
     main()
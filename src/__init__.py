@@ -1,28 +1,66 @@
-from .utils import (
-    BRIGHT_BLUE,
-    BRIGHT_GREEN,
-    BRIGHT_MAGENTA,
-    BRIGHT_RED,
-    BRIGHT_WHITE,
-    BRIGHT_YELLOW,
-    RESET,
-    esperar_enter,
-    limpiar_consola,
-)
-
-from .errores import (
-    ERR_TAMANO_MUESTRA,
-    ERR_FORMATO_OBSERVACIONES,
-    ERR_NUMERO_OBSERVACIONES,
-    ERR_NUMERO_ENTERO,
-    ERR_PORCENTAJE_CONFIANZA,
-    ERR_NUMERO,
-    ERR_DESV_ESTANDAR_POBLACIONAL,
-    ERR_APROXIMACION_NORMAL,
-    ERR_OPCION_NO_VALIDA,
-    mostrar_error,
-    mostrar_error_especial,
-)
+"""
+Los submódulos se importan hasta que se pide alguno de sus nombres,
+para que importar ``src`` (o cualquiera de sus subpaquetes) no cargue
+de más.
+"""
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .utils import (
+        BRIGHT_BLUE,
+        BRIGHT_GREEN,
+        BRIGHT_MAGENTA,
+        BRIGHT_RED,
+        BRIGHT_WHITE,
+        BRIGHT_YELLOW,
+        RESET,
+        esperar_enter,
+        limpiar_consola,
+    )
+
+    from .errores import (
+        ERR_TAMANO_MUESTRA,
+        ERR_FORMATO_OBSERVACIONES,
+        ERR_NUMERO_OBSERVACIONES,
+        ERR_OBSERVACIONES_INSUFICIENTES,
+        ERR_VARIANZA_NULA,
+        ERR_TAMANO_VENTANA,
+        ERR_NUMERO_ENTERO,
+        ERR_PORCENTAJE_CONFIANZA,
+        ERR_NUMERO,
+        ERR_DESV_ESTANDAR_POBLACIONAL,
+        ERR_APROXIMACION_NORMAL,
+        ERR_OPCION_NO_VALIDA,
+        mostrar_error,
+        mostrar_error_especial,
+    )
+
+_SUBMODULOS = {
+    "BRIGHT_BLUE": ".utils",
+    "BRIGHT_GREEN": ".utils",
+    "BRIGHT_MAGENTA": ".utils",
+    "BRIGHT_RED": ".utils",
+    "BRIGHT_WHITE": ".utils",
+    "BRIGHT_YELLOW": ".utils",
+    "RESET": ".utils",
+    "esperar_enter": ".utils",
+    "limpiar_consola": ".utils",
+    "ERR_TAMANO_MUESTRA": ".errores",
+    "ERR_FORMATO_OBSERVACIONES": ".errores",
+    "ERR_NUMERO_OBSERVACIONES": ".errores",
+    "ERR_OBSERVACIONES_INSUFICIENTES": ".errores",
+    "ERR_VARIANZA_NULA": ".errores",
+    "ERR_TAMANO_VENTANA": ".errores",
+    "ERR_NUMERO_ENTERO": ".errores",
+    "ERR_PORCENTAJE_CONFIANZA": ".errores",
+    "ERR_NUMERO": ".errores",
+    "ERR_DESV_ESTANDAR_POBLACIONAL": ".errores",
+    "ERR_APROXIMACION_NORMAL": ".errores",
+    "ERR_OPCION_NO_VALIDA": ".errores",
+    "mostrar_error": ".errores",
+    "mostrar_error_especial": ".errores",
+}
 
 __all__ = [
     "BRIGHT_BLUE",
@@ -37,6 +75,9 @@ __all__ = [
     "ERR_TAMANO_MUESTRA",
     "ERR_FORMATO_OBSERVACIONES",
     "ERR_NUMERO_OBSERVACIONES",
+    "ERR_OBSERVACIONES_INSUFICIENTES",
+    "ERR_VARIANZA_NULA",
+    "ERR_TAMANO_VENTANA",
     "ERR_NUMERO_ENTERO",
     "ERR_PORCENTAJE_CONFIANZA",
     "ERR_NUMERO",
@@ -46,3 +87,16 @@ __all__ = [
     "mostrar_error",
     "mostrar_error_especial",
 ]
+
+def __getattr__(nombre: str):
+    submodulo = _SUBMODULOS.get(nombre)
+    if submodulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+    valor = getattr(importlib.import_module(submodulo, __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
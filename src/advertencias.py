@@ -1,6 +1,6 @@
 """
-En este módulo se define la única advertencia de que
-se muestra en la calculadora.
+En este módulo se definen las advertencias que se muestran en la
+calculadora.
 """
 from .utils import (
     BRIGHT_YELLOW,
@@ -19,3 +19,10 @@ def ad_porcentaje_confianza(porcentaje_confianza: int):
             f"{BRIGHT_YELLOW}>> ADVERTENCIA{RESET} "
             f"Un nivel de confianza del 100% genera un intervalo demasiado amplio y poco útil. "
             f"Se recomienda usar 90%, 95% o 99%")
+
+
+def ad_aproximacion_normal(metodo: str):
+    print(
+        f"{BRIGHT_YELLOW}>> ADVERTENCIA{RESET} "
+        f"Los datos no cumplen con las condiciones de normalidad: np >= 5 y n(1-p) >= 5. "
+        f"En su lugar se usa el intervalo de {metodo}, que no las necesita")
@@ -20,6 +20,12 @@ ERR_FORMATO_OBSERVACIONES = "El formato de las observaciones no es correcto"
 
 ERR_NUMERO_OBSERVACIONES = "El número de observaciones no coincide con el tamaño de la muestra"
 
+ERR_OBSERVACIONES_INSUFICIENTES = "Se necesitan al menos dos observaciones para estimar la varianza"
+
+ERR_VARIANZA_NULA = "La varianza muestral es cero y el intervalo dividiría entre ella"
+
+ERR_TAMANO_VENTANA = "La serie tiene menos observaciones que el tamaño de la ventana"
+
 ERR_NUMERO_ENTERO = "Debe ser un número entero"
 
 ERR_PORCENTAJE_CONFIANZA = "Debe ser un número entero mayor que cero y menor o igual a 100"
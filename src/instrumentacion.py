@@ -0,0 +1,223 @@
+"""
+En este módulo se define la instrumentación por fases: tramos con
+nombre que miden cuánto tarda cada parte de un flujo (análisis de la
+muestra, validaciones, momentos, valores críticos y gráfica) y que se
+exportan como JSON con el número de mediciones y un histograma de
+latencias por tramo.
+
+Está desactivada por defecto; entonces ``tramo`` devuelve siempre el
+mismo objeto vacío y no se toma el tiempo ni se guarda nada. Se activa
+con ``activar_instrumentacion`` o con la variable de entorno
+``CALCULADORA_INSTRUMENTACION``, cuyo valor es el archivo JSON donde
+se escribe el resumen al terminar el programa.
+
+Los histogramas usan cubetas de potencias de dos en microsegundos: la
+cubeta ``k`` cuenta las mediciones de menos de 2ᵏ µs (y al menos
+2ᵏ⁻¹ µs), así que cada medición se registra en tiempo constante.
+
+Ejemplo::
+
+    with tramo("media.analisis"):
+        muestra = Muestra.desde_texto(texto)
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+__all__ = [
+    "activar_instrumentacion",
+    "exportar_instrumentacion",
+    "guardar_instrumentacion",
+    "instrumentacion_activa",
+    "limpiar_instrumentacion",
+    "tramo",
+]
+
+# Cubetas del histograma: de < 1 µs hasta < 2³⁵ µs (unas 9.5 horas)
+_CUBETAS = 36
+
+class _Estadisticas:
+    """Mediciones acumuladas de un tramo."""
+    __slots__ = ("conteo", "errores", "total", "minimo", "maximo", "cubetas")
+
+    def __init__(self) -> None:
+        self.conteo = 0
+        self.errores = 0
+        self.total = 0
+        self.minimo = 0
+        self.maximo = 0
+        self.cubetas = [0] * _CUBETAS
+
+
+class _TramoNulo:
+    """Tramo que no mide nada; se usa mientras está desactivada."""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion) -> bool:
+        return False
+
+
+class _Tramo:
+    """Tramo que mide el tiempo entre la entrada y la salida."""
+    __slots__ = ("_nombre", "_inicio")
+
+    def __init__(self, nombre: str) -> None:
+        self._nombre = nombre
+        self._inicio = 0
+
+    def __enter__(self):
+        self._inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, tipo, *excepcion) -> bool:
+        _registrar(self._nombre, time.perf_counter_ns() - self._inicio, tipo is not None)
+        return False
+
+
+_TRAMO_NULO = _TramoNulo()
+
+_candado = threading.Lock()
+_tramos: dict[str, _Estadisticas] = {}
+_activa = False
+_ruta_salida: Path | None = None
+
+def _registrar(nombre: str, duracion: int, error: bool) -> None:
+    cubeta = min((duracion // 1000).bit_length(), _CUBETAS - 1)
+    with _candado:
+        estadisticas = _tramos.get(nombre)
+        if estadisticas is None:
+            estadisticas = _tramos[nombre] = _Estadisticas()
+            estadisticas.minimo = duracion
+
+        estadisticas.conteo += 1
+        estadisticas.errores += error
+        estadisticas.total += duracion
+        estadisticas.minimo = min(estadisticas.minimo, duracion)
+        estadisticas.maximo = max(estadisticas.maximo, duracion)
+        estadisticas.cubetas[cubeta] += 1
+
+
+def tramo(nombre: str):
+    """
+    Crea un tramo para usar con ``with`` alrededor de una fase.
+
+    :param nombre: Nombre del tramo, por ejemplo ``"media.analisis"``.
+    :type nombre: str
+    :return: Administrador de contexto que registra la duración de
+    la fase (y si terminó con una excepción) si la instrumentación
+    está activa, o un objeto que no hace nada si no.
+    """
+    if not _activa:
+        return _TRAMO_NULO
+
+    return _Tramo(nombre)
+
+
+def activar_instrumentacion(activa: bool = True, ruta_salida: str | os.PathLike | None = None) -> None:
+    """
+    Activa o desactiva la instrumentación. Las mediciones ya
+    registradas se conservan.
+
+    :param activa: Si se deben medir los tramos.
+    :type activa: bool
+    :param ruta_salida: Archivo JSON donde se guarda el resumen al
+    terminar el programa, si se indica.
+    :type ruta_salida: str | os.PathLike | None
+    """
+    global _activa, _ruta_salida
+
+    _activa = activa
+    if ruta_salida is not None:
+        _ruta_salida = Path(ruta_salida)
+
+
+def instrumentacion_activa() -> bool:
+    """
+    :return: Si la instrumentación está activa.
+    :rtype: bool
+    """
+    return _activa
+
+
+def exportar_instrumentacion() -> dict:
+    """
+    Resume las mediciones de cada tramo.
+
+    :return: Diccionario serializable a JSON con, por tramo, el
+    número de mediciones, cuántas terminaron con una excepción, el
+    tiempo total, mínimo, medio y máximo en milisegundos y el
+    histograma (solo las cubetas con mediciones, cada una con su
+    límite superior en microsegundos).
+    :rtype: dict
+    """
+    with _candado:
+        copias = {
+            nombre: (
+                estadisticas.conteo,
+                estadisticas.errores,
+                estadisticas.total,
+                estadisticas.minimo,
+                estadisticas.maximo,
+                list(estadisticas.cubetas),
+            )
+            for nombre, estadisticas in _tramos.items()
+        }
+
+    tramos = {}
+    for nombre in sorted(copias):
+        conteo, errores, total, minimo, maximo, cubetas = copias[nombre]
+        tramos[nombre] = {
+            "conteo": conteo,
+            "errores": errores,
+            "total_ms": total / 1e6,
+            "minimo_ms": minimo / 1e6,
+            "media_ms": total / conteo / 1e6,
+            "maximo_ms": maximo / 1e6,
+            "histograma": [
+                {"hasta_us": 1 << cubeta, "conteo": cantidad}
+                for cubeta, cantidad in enumerate(cubetas)
+                if cantidad
+            ],
+        }
+
+    return {"activa": _activa, "tramos": tramos}
+
+
+def guardar_instrumentacion(ruta: str | os.PathLike) -> Path:
+    """
+    Escribe el resumen de ``exportar_instrumentacion`` en un archivo
+    JSON.
+
+    :param ruta: Archivo de destino.
+    :type ruta: str | os.PathLike
+    :return: Ruta del archivo escrito.
+    :rtype: Path
+    """
+    ruta = Path(ruta)
+    ruta.write_text(
+        json.dumps(exportar_instrumentacion(), ensure_ascii=False, indent=2),
+        encoding="utf-8",
+    )
+    return ruta
+
+
+def limpiar_instrumentacion() -> None:
+    """Descarta todas las mediciones registradas."""
+    with _candado:
+        _tramos.clear()
+
+
+@atexit.register
+def _guardar_al_salir() -> None:
+    if _ruta_salida is not None and _tramos:
+        guardar_instrumentacion(_ruta_salida)
+
+
+if os.environ.get("CALCULADORA_INSTRUMENTACION"):
+    activar_instrumentacion(True, os.environ["CALCULADORA_INSTRUMENTACION"])
@@ -0,0 +1,290 @@
+"""
+En este módulo se define la línea de comandos no interactiva de la
+calculadora. Cada parámetro se calcula con un subcomando y sus
+opciones, o bien se procesa un archivo de trabajos (CSV o JSONL) y se
+escribe un resultado JSON por línea.
+
+Uso:
+    py main.py media --muestra "2.1 3.4 1.9" -c 95
+    py main.py proporcion -x 40 -n 100 -c 90
+    py main.py proporcion -x 2 -n 300 -c 95 --metodo clopper_pearson
+    py main.py varianza --archivo datos.csv --columna peso -c 95
+    py main.py lote trabajos.jsonl --salida resultados.jsonl -p 4 --reporte
+    py main.py servidor --puerto 8000
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TextIO
+
+from .services.ejecutor import TAMANO_FRAGMENTO, ReporteLote, mapear_trabajos
+from .services.trabajos import METODOS_PROPORCION, a_json, ejecutar_trabajo_seguro
+from .servidor import TIEMPO_LIMITE
+
+__all__ = [
+    "ejecutar",
+    "leer_trabajos",
+]
+
+def _agregar_confianza(subcomando: argparse.ArgumentParser) -> None:
+    subcomando.add_argument(
+        "-c", "--porcentaje-confianza",
+        required=True,
+        help="Porcentaje de confianza (1-100)",
+    )
+
+
+def _agregar_muestra(subcomando: argparse.ArgumentParser, sufijo: str = "") -> None:
+    guion = sufijo.replace("_", "-")
+    origen = subcomando.add_mutually_exclusive_group(required=True)
+    origen.add_argument(
+        f"--muestra{guion}",
+        help="Observaciones separadas por espacios (x₁ x₂ ... xₙ)",
+    )
+    origen.add_argument(
+        f"--archivo{guion}",
+        help="Archivo de texto, CSV o TSV con las observaciones (se lee por bloques)",
+    )
+    subcomando.add_argument(
+        f"--columna{guion}",
+        help="Índice o encabezado de la columna del archivo (por defecto la primera)",
+    )
+    subcomando.add_argument(
+        f"--tamano-muestra{guion}",
+        help="Tamaño de la muestra; si se da debe coincidir con las observaciones",
+    )
+
+
+def _agregar_exitos(subcomando: argparse.ArgumentParser, sufijo: str = "") -> None:
+    guion = sufijo.replace("_", "-")
+    subcomando.add_argument(f"--numero-exitos{guion}", required=True, help="Número de éxitos (X)")
+    subcomando.add_argument(f"--tamano-muestra{guion}", required=True, help="Tamaño de la muestra (n)")
+
+
+def _crear_analizador() -> argparse.ArgumentParser:
+    analizador = argparse.ArgumentParser(
+        prog="main.py",
+        description="Calcula intervalos de confianza sin el menú interactivo.",
+    )
+    subcomandos = analizador.add_subparsers(dest="parametro", required=True)
+
+    media = subcomandos.add_parser("media", help="Media poblacional (μ)")
+    _agregar_muestra(media)
+    media.add_argument("--desv-estandar-poblacional", help="σ, si se conoce")
+    _agregar_confianza(media)
+
+    dif_medias = subcomandos.add_parser("dif_medias", help="Diferencia de medias (μ₁ - μ₂)")
+    _agregar_muestra(dif_medias, "_1")
+    _agregar_muestra(dif_medias, "_2")
+    dif_medias.add_argument("--desv-estandar-poblacional-1", help="σ₁, si se conoce")
+    dif_medias.add_argument("--desv-estandar-poblacional-2", help="σ₂, si se conoce")
+    dif_medias.add_argument(
+        "--varianzas",
+        choices=("iguales", "diferentes", "desconocidas"),
+        default="desconocidas",
+        help="Si las varianzas poblacionales son iguales (por defecto se decide con σ₁²/σ₂²)",
+    )
+    _agregar_confianza(dif_medias)
+
+    proporcion = subcomandos.add_parser("proporcion", help="Proporción (p)")
+    proporcion.add_argument("-x", "--numero-exitos", required=True, help="Número de éxitos (X)")
+    proporcion.add_argument("-n", "--tamano-muestra", required=True, help="Tamaño de la muestra (n)")
+    proporcion.add_argument(
+        "--metodo",
+        choices=METODOS_PROPORCION["proporcion"],
+        help="Por defecto normal (caso 7) si se cumplen sus condiciones y wilson si no",
+    )
+    _agregar_confianza(proporcion)
+
+    dif_proporciones = subcomandos.add_parser(
+        "dif_proporciones", help="Diferencia de proporciones (p₁ - p₂)"
+    )
+    _agregar_exitos(dif_proporciones, "_1")
+    _agregar_exitos(dif_proporciones, "_2")
+    dif_proporciones.add_argument(
+        "--metodo",
+        choices=METODOS_PROPORCION["dif_proporciones"],
+        help="Por defecto normal (caso 8) si se cumplen sus condiciones y newcombe si no",
+    )
+    _agregar_confianza(dif_proporciones)
+
+    varianza = subcomandos.add_parser("varianza", help="Varianza poblacional (σ²)")
+    _agregar_muestra(varianza)
+    _agregar_confianza(varianza)
+
+    coc_varianzas = subcomandos.add_parser(
+        "coc_varianzas", help="Cociente de varianzas (σ₁²/σ₂²)"
+    )
+    _agregar_muestra(coc_varianzas, "_1")
+    _agregar_muestra(coc_varianzas, "_2")
+    _agregar_confianza(coc_varianzas)
+
+    lote = subcomandos.add_parser(
+        "lote", help="Procesa un archivo de trabajos CSV o JSONL ('-' para JSONL en stdin)"
+    )
+    lote.add_argument("archivo", help="Archivo .csv o .jsonl con un trabajo por fila")
+    lote.add_argument("--salida", help="Archivo JSONL de resultados (por defecto stdout)")
+    lote.add_argument(
+        "-p", "--procesos",
+        type=int,
+        default=1,
+        help="Procesos que reparten los trabajos (por defecto 1)",
+    )
+    lote.add_argument(
+        "--tamano-fragmento",
+        type=int,
+        default=TAMANO_FRAGMENTO,
+        help=f"Trabajos que se envían juntos a cada proceso (por defecto {TAMANO_FRAGMENTO})",
+    )
+    lote.add_argument(
+        "--reporte",
+        action="store_true",
+        help="Escribe en stderr el número de trabajos, errores y trabajos por segundo",
+    )
+
+    servidor = subcomandos.add_parser("servidor", help="Inicia el servicio HTTP/JSON local")
+    servidor.add_argument("--anfitrion", default="127.0.0.1", help="Dirección (por defecto 127.0.0.1)")
+    servidor.add_argument("--puerto", type=int, default=8000, help="Puerto (por defecto 8000)")
+    servidor.add_argument(
+        "-p", "--procesos",
+        type=int,
+        help="Procesos que calculan los intervalos (por defecto uno por núcleo)",
+    )
+    servidor.add_argument(
+        "--tiempo-limite",
+        type=float,
+        default=TIEMPO_LIMITE,
+        help=f"Segundos máximos por solicitud (por defecto {TIEMPO_LIMITE:g})",
+    )
+
+    return analizador
+
+
+def leer_trabajos(flujo: TextIO, formato: str) -> Iterator[dict | ValueError]:
+    """
+    Lee los trabajos de un archivo uno por uno, sin cargarlo completo
+    en memoria.
+
+    En CSV los encabezados son las claves del trabajo y las celdas
+    vacías se ignoran. En JSONL cada línea no vacía es un objeto; las
+    líneas que no lo son se entregan como ``ValueError`` para que el
+    lote continúe.
+
+    :param flujo: Archivo de texto abierto.
+    :type flujo: TextIO
+    :param formato: ``csv`` o ``jsonl``.
+    :type formato: str
+    :return: Iterador de trabajos.
+    :rtype: Iterator[dict | ValueError]
+    """
+    if formato == "csv":
+        for fila in csv.DictReader(flujo):
+            yield {clave: valor for clave, valor in fila.items() if valor not in (None, "")}
+
+        return
+
+    for numero, linea in enumerate(flujo, start=1):
+        if not linea.strip():
+            continue
+
+        try:
+            trabajo = json.loads(linea)
+        except json.JSONDecodeError as error:
+            yield ValueError(f"Línea {numero}: JSON no válido ({error.msg})")
+            continue
+
+        if not isinstance(trabajo, dict):
+            yield ValueError(f"Línea {numero}: el trabajo debe ser un objeto JSON")
+            continue
+
+        yield trabajo
+
+
+def _procesar_lote(
+        entrada: TextIO,
+        formato: str,
+        salida: TextIO,
+        procesos: int,
+        tamano_fragmento: int,
+    ) -> ReporteLote:
+    inicio = time.perf_counter()
+    trabajos = leer_trabajos(entrada, formato)
+    errores = 0
+    indice = -1
+    for indice, resultado in enumerate(mapear_trabajos(trabajos, procesos, tamano_fragmento)):
+        errores += "error" in resultado
+        salida.write(a_json({"indice": indice, **resultado}))
+        salida.write("\n")
+
+    segundos = time.perf_counter() - inicio
+    return ReporteLote(indice + 1, errores, segundos, procesos, tamano_fragmento)
+
+
+def _lote(opciones: argparse.Namespace) -> int:
+    archivo = opciones.archivo
+    formato = "csv" if archivo.lower().endswith(".csv") else "jsonl"
+    datos = (opciones.procesos, opciones.tamano_fragmento)
+    salida = open(opciones.salida, "w", encoding="utf-8") if opciones.salida else sys.stdout
+    try:
+        if archivo == "-":
+            reporte = _procesar_lote(sys.stdin, formato, salida, *datos)
+        else:
+            with Path(archivo).open(encoding="utf-8", newline="") as entrada:
+                reporte = _procesar_lote(entrada, formato, salida, *datos)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+
+    if opciones.reporte:
+        print(reporte, file=sys.stderr)
+
+    return 1 if reporte.errores else 0
+
+
+def _servidor(opciones: argparse.Namespace) -> int:
+    import asyncio
+
+    from .servidor import servir
+
+    try:
+        asyncio.run(servir(
+            opciones.anfitrion,
+            opciones.puerto,
+            opciones.procesos,
+            opciones.tiempo_limite,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+    return 0
+
+
+def ejecutar(argumentos: list[str] | None = None) -> int:
+    """
+    Ejecuta la línea de comandos.
+
+    :param argumentos: Argumentos sin el nombre del programa (por
+    defecto ``sys.argv[1:]``).
+    :type argumentos: list[str] | None
+    :return: Código de salida: 0 si todos los trabajos terminaron bien
+    y 1 si alguno tuvo un error.
+    :rtype: int
+    """
+    opciones = _crear_analizador().parse_args(argumentos)
+    if opciones.parametro == "lote":
+        return _lote(opciones)
+
+    if opciones.parametro == "servidor":
+        return _servidor(opciones)
+
+    trabajo = {
+        clave: valor for clave, valor in vars(opciones).items() if valor is not None
+    }
+    resultado = ejecutar_trabajo_seguro(trabajo)
+    print(a_json(resultado))
+    return 1 if "error" in resultado else 0
+
@@ -0,0 +1,245 @@
+"""
+En este módulo se define la muestra que recorre la calculadora desde
+la entrada del usuario hasta el cálculo del intervalo de confianza.
+
+La muestra se analiza una sola vez y se guarda en un búfer contiguo de
+``float64`` que comparten los validadores y las funciones de cálculo.
+El texto que escribe el usuario se valida y se convierte en el mismo
+recorrido: los caracteres se revisan con una tabla, las observaciones
+se separan una vez y se convierten juntas; solo si algo falla se busca
+la posición de la primera observación inválida para reportarla.
+
+Las muestras guardadas en disco (``.npy`` o binario crudo) se mapean
+en memoria y no se copian: los momentos se calculan recorriendo el
+mapeo por bloques, así que pueden ser más grandes que la memoria.
+"""
+import os
+import re
+
+import numpy as np
+
+from .errores import ERR_FORMATO_OBSERVACIONES
+from .services.momentos import AcumuladorMomentos
+
+__all__ = [
+    "ErrorFormatoMuestra",
+    "Muestra",
+]
+
+# Caracteres que pueden aparecer en el texto de una muestra: dígitos,
+# punto, exponente, signos y espacios. Así se descartan nan, inf, los
+# guiones bajos y cualquier carácter no ASCII antes de convertir
+_PERMITIDOS = np.zeros(256, dtype=bool)
+_PERMITIDOS[np.frombuffer(b"0123456789.eE+- \t\n\r\v\f", dtype=np.uint8)] = True
+
+# Una observación es cualquier secuencia sin espacios ASCII, para que
+# un espacio no ASCII (como el de no separación) cuente como error
+_OBSERVACION = re.compile(r"[^ \t\n\r\v\f]+")
+
+class ErrorFormatoMuestra(ValueError):
+    """
+    Error de formato en el texto de una muestra, con la ubicación de
+    la primera observación inválida.
+    """
+    def __init__(self, token: str, posicion: int, indice: int) -> None:
+        """
+        :param token: Observación inválida.
+        :type token: str
+        :param posicion: Posición (desde 1) de su primer carácter.
+        :type posicion: int
+        :param indice: Número (desde 1) de la observación.
+        :type indice: int
+        """
+        super().__init__(
+            f"{ERR_FORMATO_OBSERVACIONES}: '{token}' en la posición {posicion} "
+            f"(observación {indice})"
+        )
+        self.token = token
+        self.posicion = posicion
+        self.indice = indice
+
+
+def _es_observacion(token: str) -> bool:
+    if not token.isascii() or not _PERMITIDOS[np.frombuffer(token.encode("ascii"), dtype=np.uint8)].all():
+        return False
+
+    try:
+        return bool(np.isfinite(float(token)))
+    except ValueError:
+        return False
+
+
+def _ubicar_error(texto: str) -> ErrorFormatoMuestra:
+    """
+    Recorre las observaciones del texto y construye el error de la
+    primera que no es un número válido. Solo se usa cuando el análisis
+    rápido ya falló.
+    """
+    for indice, coincidencia in enumerate(_OBSERVACION.finditer(texto), start=1):
+        if not _es_observacion(coincidencia.group()):
+            return ErrorFormatoMuestra(coincidencia.group(), coincidencia.start() + 1, indice)
+
+    return ErrorFormatoMuestra(texto.strip(), 1, 1)
+
+
+class Muestra:
+    """
+    Muestra de observaciones respaldada por un búfer contiguo de
+    ``float64`` de solo lectura.
+    """
+    __slots__ = ("_datos", "_momentos")
+
+    def __init__(self, datos) -> None:
+        """
+        :param datos: Observaciones de la muestra.
+        :type datos: ArrayLike
+        """
+        datos = np.ascontiguousarray(datos, dtype=np.float64).reshape(-1)
+        datos.flags.writeable = False
+        self._datos = datos
+        self._momentos = None
+
+    @classmethod
+    def desde_texto(cls, texto: str) -> "Muestra":
+        """
+        Construye una muestra a partir de las observaciones separadas
+        por espacios (x₁ x₂ ... xₙ) que escribe el usuario.
+
+        Acepta números con signo y en notación científica (``-1.5``,
+        ``2e-3``) separados por cualquier cantidad de espacios.
+
+        :param texto: Las observaciones de la muestra.
+        :type texto: str
+        :return: La muestra analizada.
+        :rtype: Muestra
+        :raises ErrorFormatoMuestra: Si alguna observación no es un
+        número finito o la muestra está vacía.
+        """
+        try:
+            crudo = texto.encode("ascii")
+        except UnicodeEncodeError:
+            raise _ubicar_error(texto) from None
+
+        if not _PERMITIDOS[np.frombuffer(crudo, dtype=np.uint8)].all():
+            raise _ubicar_error(texto)
+
+        observaciones = crudo.split()
+        if not observaciones:
+            raise ValueError(ERR_FORMATO_OBSERVACIONES)
+
+        try:
+            datos = np.array(observaciones, dtype=np.float64)
+        except ValueError:
+            raise _ubicar_error(texto) from None
+
+        # Los números demasiado grandes (1e400) se convierten en inf
+        if not np.isfinite(datos).all():
+            raise _ubicar_error(texto)
+
+        datos.flags.writeable = False
+        return cls._sin_copia(datos)
+
+    @classmethod
+    def _sin_copia(cls, arreglo: np.ndarray) -> "Muestra":
+        if arreglo.dtype.kind not in "fiu":
+            raise ValueError("Las observaciones deben ser numéricas")
+
+        if arreglo.ndim != 1:
+            raise ValueError("La muestra debe tener una sola dimensión")
+
+        muestra = cls.__new__(cls)
+        muestra._datos = arreglo
+        muestra._momentos = None
+        return muestra
+
+    @classmethod
+    def desde_npy(cls, ruta: str | os.PathLike, columna: int | None = None) -> "Muestra":
+        """
+        Mapea en memoria un arreglo ``.npy`` sin cargarlo ni copiarlo.
+
+        :param ruta: Ruta del archivo ``.npy``.
+        :type ruta: str | os.PathLike
+        :param columna: Columna a usar si el arreglo tiene dos
+        dimensiones; se toma como una vista con saltos (strided).
+        :type columna: int | None
+        :return: La muestra respaldada por el mapeo.
+        :rtype: Muestra
+        """
+        arreglo = np.load(ruta, mmap_mode="r")
+        if columna is not None:
+            arreglo = arreglo[:, columna]
+
+        return cls._sin_copia(arreglo)
+
+    @classmethod
+    def desde_binario(
+            cls,
+            ruta: str | os.PathLike,
+            tipo: str = "<f8",
+            desplazamiento: int = 0,
+        ) -> "Muestra":
+        """
+        Mapea en memoria un archivo binario crudo de observaciones.
+
+        :param ruta: Ruta del archivo.
+        :type ruta: str | os.PathLike
+        :param tipo: Tipo de dato de NumPy de cada observación (por
+        defecto ``float64`` little-endian).
+        :type tipo: str
+        :param desplazamiento: Bytes a saltar al inicio del archivo.
+        :type desplazamiento: int
+        :return: La muestra respaldada por el mapeo.
+        :rtype: Muestra
+        """
+        return cls._sin_copia(np.memmap(ruta, dtype=tipo, mode="r", offset=desplazamiento))
+
+    @classmethod
+    def desde(cls, muestra: "Muestra | str") -> "Muestra":
+        """
+        Devuelve la misma muestra o la construye si se recibe el
+        texto de las observaciones.
+
+        :param muestra: Una muestra, el texto de sus observaciones o
+        un arreglo (los mapeos en memoria no se copian).
+        :type muestra: Muestra | str
+        :return: La muestra.
+        :rtype: Muestra
+        """
+        if isinstance(muestra, cls):
+            return muestra
+
+        if isinstance(muestra, str):
+            return cls.desde_texto(muestra)
+
+        # Un mapeo en memoria se usa tal cual para no leerlo completo
+        if isinstance(muestra, np.memmap):
+            return cls._sin_copia(muestra.reshape(-1))
+
+        return cls(muestra)
+
+    @property
+    def datos(self) -> np.ndarray:
+        """
+        Búfer de solo lectura con las observaciones; en las muestras
+        mapeadas es el mapeo con su tipo de dato original.
+        """
+        return self._datos
+
+    def momentos(self) -> AcumuladorMomentos:
+        """
+        Calcula una sola vez los momentos de la muestra y los guarda
+        para las siguientes consultas.
+
+        :return: Acumulador con n, X̄ y M2 de la muestra.
+        :rtype: AcumuladorMomentos
+        """
+        if self._momentos is None:
+            self._momentos = AcumuladorMomentos.desde_arreglo(self._datos)
+
+        return self._momentos
+
+    def __len__(self) -> int:
+        return self._datos.shape[0]
+
+    def __repr__(self) -> str:
+        return f"Muestra(n={len(self)})"
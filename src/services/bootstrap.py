@@ -0,0 +1,316 @@
+"""
+En este módulo se definen los intervalos de confianza bootstrap
+(percentil, básico y BCa) para la media, la diferencia de medias, la
+varianza y el cociente de varianzas, para cuando las condiciones de
+los casos cerrados (normalidad, muestras grandes) no se cumplen.
+
+Las réplicas se generan por bloques de ``REPLICAS_POR_BLOQUE`` con una
+semilla propia derivada de ``np.random.SeedSequence``, y cada bloque
+se remuestrea en fragmentos vectorizados (una matriz de índices por
+fragmento) cuyo tamaño se ajusta al presupuesto de memoria. Como las
+réplicas de un bloque no dependen de cómo se fragmente ni de qué
+proceso lo calcule, el resultado con la misma semilla es el mismo con
+cualquier presupuesto de memoria y cualquier número de procesos.
+
+La aceleración del método BCa se estima con *jackknife*, cuyas
+réplicas se obtienen en forma cerrada (quitando cada observación de
+la suma y de M2) en lugar de recalcular n estadísticos.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.errores import ERR_OBSERVACIONES_INSUFICIENTES, ERR_PORCENTAJE_CONFIANZA
+
+from ..muestra import Muestra
+from .valores_criticos import cuantil_normal
+
+__all__ = [
+    "ESTADISTICOS",
+    "MEMORIA_BOOTSTRAP",
+    "METODOS",
+    "REPLICAS_POR_BLOQUE",
+    "intervalo_bootstrap",
+    "replicas_bootstrap",
+]
+
+ESTADISTICOS = ("media", "dif_medias", "varianza", "coc_varianzas")
+METODOS = ("percentil", "basico", "bca")
+
+REPLICAS_POR_BLOQUE = 1024
+MEMORIA_BOOTSTRAP = 64 << 20
+
+# Bytes por observación remuestreada: el índice (int64) y el valor
+# (float64)
+_BYTES_POR_OBSERVACION = 16
+
+_DOS_MUESTRAS = ("dif_medias", "coc_varianzas")
+
+# Muestras de cada proceso del grupo; se envían una sola vez al
+# iniciar el proceso en lugar de con cada bloque
+_muestras_proceso: tuple[np.ndarray, ...] = ()
+
+def _estadistico(estadistico: str, muestras: tuple[np.ndarray, ...], eje=None):
+    if estadistico == "media":
+        return muestras[0].mean(axis=eje)
+
+    if estadistico == "varianza":
+        return muestras[0].var(axis=eje, ddof=1)
+
+    if estadistico == "dif_medias":
+        return muestras[0].mean(axis=eje) - muestras[1].mean(axis=eje)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return muestras[0].var(axis=eje, ddof=1) / muestras[1].var(axis=eje, ddof=1)
+
+
+def _replicas_bloque(
+        muestras: tuple[np.ndarray, ...],
+        estadistico: str,
+        semilla: np.random.SeedSequence,
+        replicas: int,
+        memoria_maxima: int,
+    ) -> np.ndarray:
+    # Un generador por muestra para que los índices de cada una no
+    # dependan del tamaño de los fragmentos
+    generadores = [np.random.default_rng(hija) for hija in semilla.spawn(len(muestras))]
+    mayor = max(datos.shape[0] for datos in muestras)
+    filas = max(1, min(replicas, memoria_maxima // (_BYTES_POR_OBSERVACION * mayor)))
+
+    resultado = np.empty(replicas, dtype=np.float64)
+    for inicio in range(0, replicas, filas):
+        cantidad = min(filas, replicas - inicio)
+        remuestras = tuple(
+            datos[generador.integers(0, datos.shape[0], size=(cantidad, datos.shape[0]), dtype=np.int64)]
+            for datos, generador in zip(muestras, generadores)
+        )
+        resultado[inicio:inicio + cantidad] = _estadistico(estadistico, remuestras, eje=1)
+
+    return resultado
+
+
+def _preparar_proceso(muestras: tuple[np.ndarray, ...]) -> None:
+    global _muestras_proceso
+    _muestras_proceso = muestras
+
+
+def _replicas_bloque_proceso(*argumentos) -> np.ndarray:
+    return _replicas_bloque(_muestras_proceso, *argumentos)
+
+
+def _muestras(estadistico: str, muestra_1, muestra_2) -> tuple[np.ndarray, ...]:
+    if estadistico not in ESTADISTICOS:
+        raise ValueError(f"Estadístico no válido: {estadistico} (usa {', '.join(ESTADISTICOS)})")
+
+    entradas = (muestra_1, muestra_2) if estadistico in _DOS_MUESTRAS else (muestra_1,)
+    if estadistico in _DOS_MUESTRAS and muestra_2 is None:
+        raise ValueError(f"El estadístico {estadistico} necesita dos muestras")
+
+    muestras = tuple(
+        np.asarray(Muestra.desde(entrada).datos, dtype=np.float64) for entrada in entradas
+    )
+    for datos in muestras:
+        if datos.shape[0] < 2:
+            raise ValueError(ERR_OBSERVACIONES_INSUFICIENTES)
+
+    return muestras
+
+
+def replicas_bootstrap(
+        estadistico: str,
+        muestra_1,
+        muestra_2=None,
+        replicas: int = 10_000,
+        semilla: int | None = None,
+        procesos: int | None = 1,
+        memoria_maxima: int = MEMORIA_BOOTSTRAP,
+    ) -> np.ndarray:
+    """
+    Calcula el estadístico en ``replicas`` remuestreos con reemplazo.
+
+    :param estadistico: ``"media"``, ``"dif_medias"``, ``"varianza"``
+    o ``"coc_varianzas"``.
+    :type estadistico: str
+    :param muestra_1: Una muestra, el texto de sus observaciones o un
+    arreglo.
+    :type muestra_1: Muestra | str | ArrayLike
+    :param muestra_2: La segunda muestra de los estadísticos de dos
+    muestras.
+    :type muestra_2: Muestra | str | ArrayLike | None
+    :param replicas: Número de remuestreos (B).
+    :type replicas: int
+    :param semilla: Semilla para reproducir el resultado.
+    :type semilla: int | None
+    :param procesos: Procesos entre los que se reparten los bloques;
+    ``None`` usa uno por núcleo.
+    :type procesos: int | None
+    :param memoria_maxima: Bytes máximos de cada fragmento de
+    remuestreo (por proceso).
+    :type memoria_maxima: int
+    :return: Los B valores del estadístico, en orden de bloque.
+    :rtype: np.ndarray
+    """
+    muestras = _muestras(estadistico, muestra_1, muestra_2)
+    if replicas < 1:
+        raise ValueError("El número de réplicas debe ser mayor o igual a 1")
+
+    procesos = procesos or os.cpu_count() or 1
+    if procesos < 1:
+        raise ValueError("El número de procesos debe ser mayor o igual a 1")
+
+    bloques = math.ceil(replicas / REPLICAS_POR_BLOQUE)
+    semillas = np.random.SeedSequence(semilla).spawn(bloques)
+    tamanos = [
+        min(REPLICAS_POR_BLOQUE, replicas - indice * REPLICAS_POR_BLOQUE) for indice in range(bloques)
+    ]
+    argumentos = [estadistico] * bloques, semillas, tamanos, [memoria_maxima] * bloques
+
+    if procesos == 1 or bloques == 1:
+        resultados = [_replicas_bloque(muestras, *bloque) for bloque in zip(*argumentos)]
+    else:
+        with ProcessPoolExecutor(
+                max_workers=min(procesos, bloques),
+                initializer=_preparar_proceso,
+                initargs=(muestras,),
+            ) as ejecutor:
+            resultados = list(ejecutor.map(_replicas_bloque_proceso, *argumentos))
+
+    return np.concatenate(resultados)
+
+
+def _jackknife(estadistico: str, muestras: tuple[np.ndarray, ...]) -> np.ndarray:
+    """
+    Valores del estadístico quitando una observación a la vez (de
+    cualquiera de las muestras), calculados en O(n).
+    """
+    medias = [datos.mean() for datos in muestras]
+    varianzas = [datos.var(ddof=1) for datos in muestras]
+
+    def sin_una(indice: int) -> tuple[np.ndarray, np.ndarray]:
+        datos = muestras[indice]
+        n = datos.shape[0]
+        medias_sin = (medias[indice] * n - datos) / (n - 1)
+        m2_sin = varianzas[indice] * (n - 1) - (datos - medias[indice]) ** 2 * n / (n - 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return medias_sin, np.maximum(m2_sin, 0.0) / (n - 2)
+
+    if estadistico == "media":
+        return sin_una(0)[0]
+
+    if estadistico == "varianza":
+        return sin_una(0)[1]
+
+    medias_1, varianzas_1 = sin_una(0)
+    medias_2, varianzas_2 = sin_una(1)
+    if estadistico == "dif_medias":
+        return np.concatenate((medias_1 - medias[1], medias[0] - medias_2))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.concatenate((varianzas_1 / varianzas[1], varianzas[0] / varianzas_2))
+
+
+def _distribucion_normal(valor: float) -> float:
+    return 0.5 * math.erfc(-valor / math.sqrt(2))
+
+
+def _probabilidades_bca(
+        estimador: float,
+        valores: np.ndarray,
+        jackknife: np.ndarray,
+        alpha: float,
+    ) -> tuple[float, float]:
+    replicas = valores.shape[0]
+
+    # Sesgo: fracción de réplicas por debajo del estimador (los
+    # empates cuentan la mitad), acotada para que Φ⁻¹ sea finita
+    fraccion = (np.count_nonzero(valores < estimador) + 0.5 * np.count_nonzero(valores == estimador)) / replicas
+    fraccion = min(max(fraccion, 1 / (replicas + 1)), replicas / (replicas + 1))
+    sesgo = cuantil_normal(fraccion)
+
+    diferencias = jackknife.mean() - jackknife
+    denominador = 6 * np.sum(diferencias ** 2) ** 1.5
+    aceleracion = float(np.sum(diferencias ** 3) / denominador) if denominador > 0 else 0.0
+    if not math.isfinite(aceleracion):
+        aceleracion = 0.0
+
+    probabilidades = []
+    for probabilidad in (alpha / 2, 1 - alpha / 2):
+        z = sesgo + cuantil_normal(probabilidad)
+        probabilidades.append(_distribucion_normal(sesgo + z / (1 - aceleracion * z)))
+
+    return probabilidades[0], probabilidades[1]
+
+
+def intervalo_bootstrap(
+        estadistico: str,
+        muestra_1,
+        muestra_2=None,
+        porcentaje_confianza: int = 95,
+        metodo: str = "percentil",
+        replicas: int = 10_000,
+        semilla: int | None = None,
+        procesos: int | None = 1,
+        memoria_maxima: int = MEMORIA_BOOTSTRAP,
+    ) -> tuple[float, float, float, float]:
+    """
+    Calcula un intervalo de confianza bootstrap.
+
+    :param estadistico: ``"media"``, ``"dif_medias"``, ``"varianza"``
+    o ``"coc_varianzas"``.
+    :type estadistico: str
+    :param muestra_1: Una muestra, el texto de sus observaciones o un
+    arreglo.
+    :type muestra_1: Muestra | str | ArrayLike
+    :param muestra_2: La segunda muestra de los estadísticos de dos
+    muestras.
+    :type muestra_2: Muestra | str | ArrayLike | None
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :param metodo: ``"percentil"``, ``"basico"`` o ``"bca"``.
+    :type metodo: str
+    :param replicas: Número de remuestreos (B).
+    :type replicas: int
+    :param semilla: Semilla para reproducir el resultado.
+    :type semilla: int | None
+    :param procesos: Procesos entre los que se reparten los bloques;
+    ``None`` usa uno por núcleo.
+    :type procesos: int | None
+    :param memoria_maxima: Bytes máximos de cada fragmento de
+    remuestreo (por proceso).
+    :type memoria_maxima: int
+    :return: Límite inferior y superior del intervalo, estimador
+    puntual de la muestra original y error estándar bootstrap.
+    :rtype: tuple[float, float, float, float]
+    """
+    if metodo not in METODOS:
+        raise ValueError(f"Método no válido: {metodo} (usa {', '.join(METODOS)})")
+
+    if not 0 < porcentaje_confianza < 100:
+        raise ValueError(ERR_PORCENTAJE_CONFIANZA)
+
+    muestras = _muestras(estadistico, muestra_1, muestra_2)
+    estimador = float(_estadistico(estadistico, muestras))
+    valores = replicas_bootstrap(
+        estadistico,
+        muestras[0],
+        muestras[1] if len(muestras) == 2 else None,
+        replicas,
+        semilla,
+        procesos,
+        memoria_maxima,
+    )
+    alpha = 1 - porcentaje_confianza / 100
+
+    if metodo == "bca":
+        probabilidades = _probabilidades_bca(estimador, valores, _jackknife(estadistico, muestras), alpha)
+    else:
+        probabilidades = (alpha / 2, 1 - alpha / 2)
+
+    inferior, superior = np.quantile(valores, probabilidades)
+    if metodo == "basico":
+        inferior, superior = 2 * estimador - superior, 2 * estimador - inferior
+
+    return float(inferior), float(superior), estimador, float(valores.std(ddof=1))
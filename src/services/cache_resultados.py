@@ -0,0 +1,387 @@
+"""
+En este módulo se define la caché de resultados de los intervalos de
+confianza, para no recalcular las combinaciones de caso, muestra y
+porcentaje de confianza que se piden una y otra vez.
+
+La clave de cada resultado es el SHA-256 de los argumentos en forma
+canónica: las muestras se reducen a los bytes de sus observaciones en
+``float64`` (``"1 2 3"`` y ``"1.0  2  3"`` son la misma muestra), los
+números a ``float64`` y los momentos a (n, X̄, M2). También entran el
+nombre del caso y el backend de valores críticos.
+
+Hay dos niveles:
+
+- Memoria: caché LRU acotada por número de entradas.
+- Disco (opcional): un archivo JSON por resultado en un directorio, que
+  pueden compartir varios procesos; se recorta a un número máximo de
+  archivos quitando los usados hace más tiempo.
+
+Ambos niveles descartan los resultados con más antigüedad que el
+tiempo de vida (TTL), si se configura. Se configura con
+``configurar_cache_resultados`` o con las variables de entorno
+``CALCULADORA_CACHE_RESULTADOS`` (entradas en memoria, 0 la
+desactiva), ``CALCULADORA_CACHE_RESULTADOS_TTL`` (segundos) y
+``CALCULADORA_CACHE_RESULTADOS_DIR`` (directorio del nivel en disco).
+
+Las funciones ``intervalo_caso_*`` de este módulo tienen la misma firma
+y resultado que las de ``calculos`` y pasan por la caché.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from src.muestra import Muestra
+
+from . import calculos
+from .momentos import TAMANO_BLOQUE, AcumuladorMomentos
+from .valores_criticos import backend_actual
+
+__all__ = [
+    "TAMANO_CACHE_DISCO",
+    "TAMANO_CACHE_RESULTADOS",
+    "configurar_cache_resultados",
+    "envolver",
+    "estadisticas_cache_resultados",
+    "intervalo_caso_1",
+    "intervalo_caso_2",
+    "intervalo_caso_3",
+    "intervalo_caso_4",
+    "intervalo_caso_5",
+    "intervalo_caso_6",
+    "intervalo_caso_7",
+    "intervalo_caso_8",
+    "intervalo_caso_9",
+    "intervalo_caso_10",
+    "limpiar_cache_resultados",
+]
+
+TAMANO_CACHE_RESULTADOS = 1024
+TAMANO_CACHE_DISCO = 65536
+
+# Cada cuántas escrituras se revisa si el directorio excede su tamaño
+_ESCRITURAS_POR_RECORTE = 128
+
+def _entorno_numero(nombre: str, tipo: type, predeterminado):
+    try:
+        return tipo(os.environ[nombre])
+    except (KeyError, ValueError):
+        return predeterminado
+
+
+_candado = threading.Lock()
+_cache: OrderedDict[str, tuple[float | None, tuple]] = OrderedDict()
+_tamano = max(_entorno_numero("CALCULADORA_CACHE_RESULTADOS", int, TAMANO_CACHE_RESULTADOS), 0)
+_ttl: float | None = _entorno_numero("CALCULADORA_CACHE_RESULTADOS_TTL", float, None)
+_directorio: Path | None = (
+    Path(os.environ["CALCULADORA_CACHE_RESULTADOS_DIR"])
+    if os.environ.get("CALCULADORA_CACHE_RESULTADOS_DIR")
+    else None
+)
+_tamano_disco = TAMANO_CACHE_DISCO
+_escrituras_disco = 0
+_contadores = {
+    "aciertos_memoria": 0,
+    "aciertos_disco": 0,
+    "fallos": 0,
+    "expirados": 0,
+    "desalojados": 0,
+}
+
+def _actualizar_hash(resumen, valor):
+    """
+    Agrega un argumento en forma canónica al resumen.
+
+    :return: El argumento que debe recibir la función; el texto de
+    una muestra se analiza aquí para no hacerlo dos veces.
+    """
+    if isinstance(valor, str):
+        valor = Muestra.desde_texto(valor)
+
+    if isinstance(valor, Muestra):
+        datos = valor.datos
+        resumen.update(b"M" + struct.pack("<q", datos.shape[0]))
+        for inicio in range(0, datos.shape[0], TAMANO_BLOQUE):
+            bloque = np.ascontiguousarray(datos[inicio:inicio + TAMANO_BLOQUE], dtype="<f8")
+            resumen.update(bloque.data)
+    elif isinstance(valor, AcumuladorMomentos):
+        resumen.update(b"A" + struct.pack("<qdd", valor.conteo, valor.media, valor.m2))
+    elif isinstance(valor, (bool, np.bool_)):
+        resumen.update(b"B" + struct.pack("<?", bool(valor)))
+    else:
+        resumen.update(b"F" + struct.pack("<d", float(valor)))
+
+    return valor
+
+
+def _clave(nombre: str, argumentos: tuple) -> tuple[str, tuple]:
+    resumen = hashlib.sha256(f"{nombre}|{backend_actual()}".encode())
+    argumentos = tuple(_actualizar_hash(resumen, argumento) for argumento in argumentos)
+    return resumen.hexdigest(), argumentos
+
+
+def _ruta_disco(clave: str) -> Path:
+    return _directorio / clave[:2] / f"{clave}.json"
+
+
+def _leer_disco(clave: str, construir=tuple) -> tuple | None:
+    if _directorio is None:
+        return None
+
+    ruta = _ruta_disco(clave)
+    try:
+        contenido = json.loads(ruta.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if contenido.get("expira") is not None and contenido["expira"] <= time.time():
+        with _candado:
+            _contadores["expirados"] += 1
+
+        ruta.unlink(missing_ok=True)
+        return None
+
+    # Se actualiza la fecha de uso para que el recorte quite primero
+    # los resultados que no se han pedido en más tiempo
+    try:
+        os.utime(ruta)
+    except OSError:
+        pass
+
+    try:
+        return construir(contenido["valor"])
+    except TypeError:
+        # Archivo escrito con otro número de campos: se recalcula
+        return None
+
+
+def _recortar_disco() -> None:
+    archivos = []
+    for ruta in _directorio.glob("*/*.json"):
+        try:
+            archivos.append((ruta.stat().st_mtime, ruta))
+        except OSError:
+            continue
+
+    exceso = len(archivos) - _tamano_disco
+    if exceso > 0:
+        archivos.sort()
+        for _, ruta in archivos[:exceso]:
+            ruta.unlink(missing_ok=True)
+
+
+def _escribir_disco(clave: str, valor: tuple) -> None:
+    global _escrituras_disco
+    if _directorio is None:
+        return
+
+    ruta = _ruta_disco(clave)
+    contenido = {
+        "expira": time.time() + _ttl if _ttl is not None else None,
+        "valor": [v.item() if hasattr(v, "item") else v for v in valor],
+    }
+    try:
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        # Se escribe en un temporal y se renombra para que otro proceso
+        # nunca lea un archivo a medias
+        descriptor, temporal = tempfile.mkstemp(dir=ruta.parent, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as archivo:
+            json.dump(contenido, archivo)
+
+        os.replace(temporal, ruta)
+    except OSError:
+        return
+
+    with _candado:
+        _escrituras_disco += 1
+        recortar = _escrituras_disco % _ESCRITURAS_POR_RECORTE == 0
+
+    if recortar:
+        _recortar_disco()
+
+
+def _buscar_memoria(clave: str) -> tuple | None:
+    """Busca un resultado en la caché LRU. Debe llamarse con el candado tomado."""
+    entrada = _cache.get(clave)
+    if entrada is None:
+        return None
+
+    expira, valor = entrada
+    if expira is not None and expira <= time.monotonic():
+        del _cache[clave]
+        _contadores["expirados"] += 1
+        return None
+
+    _cache.move_to_end(clave)
+    _contadores["aciertos_memoria"] += 1
+    return valor
+
+
+def _guardar_memoria(clave: str, valor: tuple) -> None:
+    """Guarda un resultado en la caché LRU. Debe llamarse con el candado tomado."""
+    if _tamano == 0:
+        return
+
+    expira = time.monotonic() + _ttl if _ttl is not None else None
+    _cache[clave] = (expira, valor)
+    _cache.move_to_end(clave)
+    while len(_cache) > _tamano:
+        _cache.popitem(last=False)
+        _contadores["desalojados"] += 1
+
+
+def envolver(funcion):
+    """
+    Envuelve una función de cálculo para que sus resultados pasen por
+    la caché.
+
+    :param funcion: Función ``intervalo_caso_*``.
+    :type funcion: Callable[..., tuple]
+    :return: Función con la misma firma y resultado. Los argumentos
+    nombrados y los omitidos (con su valor por defecto) se ordenan
+    según la firma antes de calcular la clave, así que la misma
+    llamada escrita de otra forma comparte resultado. Los resultados
+    leídos del disco se reconstruyen como el registro que anota la
+    función en su tipo de retorno.
+    :rtype: Callable[..., tuple]
+    """
+    nombre = f"{funcion.__module__}.{funcion.__qualname__}"
+    tipo = funcion.__annotations__.get("return")
+    construir = tipo._make if hasattr(tipo, "_make") else tuple
+    firma = inspect.signature(funcion)
+
+    @functools.wraps(funcion)
+    def envoltura(*argumentos, **nombrados):
+        if _tamano == 0 and _directorio is None:
+            return funcion(*argumentos, **nombrados)
+
+        ligados = firma.bind(*argumentos, **nombrados)
+        ligados.apply_defaults()
+        clave, argumentos = _clave(nombre, ligados.args)
+        with _candado:
+            valor = _buscar_memoria(clave)
+
+        if valor is not None:
+            return valor
+
+        valor = _leer_disco(clave, construir)
+        with _candado:
+            if valor is not None:
+                _contadores["aciertos_disco"] += 1
+                _guardar_memoria(clave, valor)
+                return valor
+
+            _contadores["fallos"] += 1
+
+        valor = funcion(*argumentos)
+        with _candado:
+            _guardar_memoria(clave, valor)
+
+        _escribir_disco(clave, valor)
+        return valor
+
+    return envoltura
+
+
+intervalo_caso_1 = envolver(calculos.intervalo_caso_1)
+intervalo_caso_2 = envolver(calculos.intervalo_caso_2)
+intervalo_caso_3 = envolver(calculos.intervalo_caso_3)
+intervalo_caso_4 = envolver(calculos.intervalo_caso_4)
+intervalo_caso_5 = envolver(calculos.intervalo_caso_5)
+intervalo_caso_6 = envolver(calculos.intervalo_caso_6)
+intervalo_caso_7 = envolver(calculos.intervalo_caso_7)
+intervalo_caso_8 = envolver(calculos.intervalo_caso_8)
+intervalo_caso_9 = envolver(calculos.intervalo_caso_9)
+intervalo_caso_10 = envolver(calculos.intervalo_caso_10)
+
+def estadisticas_cache_resultados() -> dict[str, int | float]:
+    """
+    Devuelve los contadores de la caché de resultados.
+
+    :return: Aciertos en memoria y en disco, fallos, expirados,
+    desalojados, tasa de aciertos, entradas en memoria y capacidad.
+    :rtype: dict[str, int | float]
+    """
+    with _candado:
+        estadisticas = dict(_contadores)
+        estadisticas["entradas_cache"] = len(_cache)
+        estadisticas["capacidad_cache"] = _tamano
+
+    aciertos = estadisticas["aciertos_memoria"] + estadisticas["aciertos_disco"]
+    consultas = aciertos + estadisticas["fallos"]
+    estadisticas["tasa_aciertos"] = aciertos / consultas if consultas else 0.0
+    return estadisticas
+
+
+def limpiar_cache_resultados(disco: bool = False) -> None:
+    """
+    Vacía la caché en memoria y reinicia los contadores.
+
+    :param disco: Si también se borran los resultados en disco.
+    :type disco: bool
+    """
+    with _candado:
+        _cache.clear()
+        for nombre in _contadores:
+            _contadores[nombre] = 0
+
+    if disco and _directorio is not None:
+        for ruta in _directorio.glob("*/*.json"):
+            ruta.unlink(missing_ok=True)
+
+
+_SIN_CAMBIO = object()
+
+def configurar_cache_resultados(
+        tamano: int | None = None,
+        ttl: float | None = _SIN_CAMBIO,
+        directorio: str | os.PathLike | None = _SIN_CAMBIO,
+        tamano_disco: int | None = None,
+    ) -> None:
+    """
+    Cambia la configuración de la caché de resultados; los argumentos
+    que no se dan conservan su valor.
+
+    :param tamano: Número máximo de resultados en memoria (0 la
+    desactiva).
+    :type tamano: int | None
+    :param ttl: Segundos de vida de cada resultado (``None`` para que
+    no expiren).
+    :type ttl: float | None
+    :param directorio: Directorio del nivel en disco (``None`` para
+    desactivarlo).
+    :type directorio: str | os.PathLike | None
+    :param tamano_disco: Número máximo de resultados en disco.
+    :type tamano_disco: int | None
+    """
+    global _tamano, _ttl, _directorio, _tamano_disco
+    if tamano is not None and tamano < 0:
+        raise ValueError("El tamaño de la caché debe ser mayor o igual a cero")
+
+    if ttl is not _SIN_CAMBIO and ttl is not None and ttl <= 0:
+        raise ValueError("El tiempo de vida debe ser mayor que cero")
+
+    with _candado:
+        if tamano is not None:
+            _tamano = tamano
+            while len(_cache) > _tamano:
+                _cache.popitem(last=False)
+                _contadores["desalojados"] += 1
+
+        if ttl is not _SIN_CAMBIO:
+            _ttl = ttl
+
+        if directorio is not _SIN_CAMBIO:
+            _directorio = Path(directorio) if directorio is not None else None
+
+        if tamano_disco is not None:
+            _tamano_disco = tamano_disco
@@ -1,15 +1,33 @@
 """
 En este módulo se definen las funciones necesarias para calcular
 al intervalo de confianza dependiendo del parámetro que se desea
-estimar.
+estimar. Cada función devuelve el registro con nombre de
+``resultados`` que le corresponde.
 """
 import math
 
-from scipy.stats import (
-    norm,
-    t,
-    f,
-    chi2,  
+from src.instrumentacion import tramo
+from src.muestra import Muestra
+
+from .momentos import AcumuladorMomentos
+from .resultados import (
+    ResultadoCaso1,
+    ResultadoCaso2,
+    ResultadoCaso3,
+    ResultadoCaso4,
+    ResultadoCaso5,
+    ResultadoCaso6,
+    ResultadoCaso7,
+    ResultadoCaso8,
+    ResultadoCaso9,
+    ResultadoCaso10,
+    ResultadoClopperPearson,
+)
+from .valores_criticos import (
+    cuantil_chi2,
+    cuantil_f,
+    cuantil_normal,
+    cuantil_t,
 )
 
 __all__ = [
@@ -23,47 +41,55 @@ __all__ = [
     "intervalo_caso_8",
     "intervalo_caso_9",
     "intervalo_caso_10",
+    "intervalo_agresti_coull",
+    "intervalo_clopper_pearson",
+    "intervalo_newcombe",
+    "intervalo_wilson",
 ]
 
-def _calcular_media(muestra: str) -> float:
+def _obtener_momentos(muestra: Muestra | AcumuladorMomentos | str) -> AcumuladorMomentos:
+    """
+    Obtiene los momentos de una muestra; si ya se recibe un
+    acumulador (por ejemplo, el de un archivo leído por bloques) se
+    usa tal cual.
+
+    :param muestra: Una muestra válida o sus momentos acumulados.
+    :type muestra: Muestra | AcumuladorMomentos | str
+    :return: Acumulador con n, X̄ y M2 de la muestra.
+    :rtype: AcumuladorMomentos
+    """
+    if isinstance(muestra, AcumuladorMomentos):
+        return muestra
+
+    with tramo("calculos.momentos"):
+        return Muestra.desde(muestra).momentos()
+
+
+def _calcular_media(momentos: AcumuladorMomentos) -> float:
     """
     Calcula la media muestral (X̄) de una muestra válida. 
     
-    :param muestra: Una muestra válida.
-    :type muestra: str
+    :param momentos: Momentos acumulados de una muestra válida.
+    :type momentos: AcumuladorMomentos
     :return: Media muestral (X̄) redondeada a cuatro decimales.
     :rtype: float
     """
-    numeros = muestra.split()
-    numeros_float = [float(numero) for numero in numeros]
-    media = sum(numeros_float) / len(numeros_float)
+    media = momentos.media
     media_round = round(media, 4)
     return media_round
 
 
-def _calcular_varianza_muestral(
-        tamano_muestra: int,
-        muestra: str,
-        media_muestral: float,
-    ) -> float:
+def _calcular_varianza_muestral(momentos: AcumuladorMomentos) -> float:
     """
-    Calcula la varianza muestral (𝑠²) de una muestra válida.
+    Calcula la varianza muestral (𝑠²) de una muestra válida a partir
+    de sus momentos acumulados en una sola pasada.
     
-    :param tamano_muestra: Tamaño de la muestra (n).
-    :type tamano_muestra: int
-    :param muestra: Una muestra válida.
-    :type muestra: str
-    :param media_muestral: Media muestral (X̄).
-    :type media_muestral: float
+    :param momentos: Momentos acumulados de una muestra válida.
+    :type momentos: AcumuladorMomentos
     :return: Varianza muestral (𝑠²) redondeada a cuatro decimales.
     :rtype: float
     """
-    numeros = muestra.split()
-    suma = 0
-    for i in range(tamano_muestra):
-        suma = round(suma + ((float(numeros[i]) - media_muestral) ** 2), 4)
-
-    varianza_muestral = (1 / (tamano_muestra - 1)) * suma
+    varianza_muestral = momentos.varianza_muestral
     varianza_muestral_round = round(varianza_muestral, 4)
     return varianza_muestral_round
 
@@ -166,8 +192,9 @@ def _calcular_valor_critico_normal_estandar(porcentaje_confianza: int) -> float:
     :rtype: float
     """
     alpha = 1 - (porcentaje_confianza / 100)
-    valor_critico_Z = norm.ppf(1 - round(alpha / 2, 4))
-    valor_critico_Z_round = round(valor_critico_Z, 4) # type: ignore
+    with tramo("calculos.valor_critico"):
+        valor_critico_Z = cuantil_normal(1 - round(alpha / 2, 4))
+    valor_critico_Z_round = round(valor_critico_Z, 4)
     return valor_critico_Z_round
 
 
@@ -198,8 +225,9 @@ def _calcular_valor_critico_t_student(
     if caso_intervalo == 6:
         grados_libertad_nuevos = grados_libertad - 2
     
-    valor_critico_t = t.ppf(1 - round(alpha / 2, 4), grados_libertad_nuevos)
-    valor_critico_t_round = round(valor_critico_t, 4) # type: ignore 
+    with tramo("calculos.valor_critico"):
+        valor_critico_t = cuantil_t(1 - round(alpha / 2, 4), grados_libertad_nuevos)
+    valor_critico_t_round = round(valor_critico_t, 4)
     return valor_critico_t_round
 
 
@@ -225,10 +253,11 @@ def _calcular_valor_critico_f(
     alpha = 1 - (porcentaje_confianza / 100)
     grados_libertad_1 = tamano_muestra_1 - 1
     grados_libertad_2 = tamano_muestra_2 - 1
-    f_superior = f.ppf(1 - (alpha / 2), grados_libertad_1, grados_libertad_2)
-    f_inferior = f.ppf(alpha / 2, grados_libertad_1, grados_libertad_2)
-    f_superior_round = round(f_superior, 4) # type: ignore
-    f_inferior_round = round(f_inferior, 4) # type: ignore
+    with tramo("calculos.valor_critico"):
+        f_superior = cuantil_f(1 - (alpha / 2), grados_libertad_1, grados_libertad_2)
+        f_inferior = cuantil_f(alpha / 2, grados_libertad_1, grados_libertad_2)
+    f_superior_round = round(f_superior, 4)
+    f_inferior_round = round(f_inferior, 4)
     return f_superior_round, f_inferior_round
 
 
@@ -250,19 +279,38 @@ def _calcular_valor_critico_chi_cuadrada(
     """
     alpha = 1 - (porcentaje_confianza / 100)
     grados_libertad = tamano_muestra - 1
-    chi2_superior = chi2.ppf(1 - (alpha / 2), grados_libertad)
-    chi2_inferior = chi2.ppf(alpha / 2, grados_libertad)
-    chi2_superior_round = round(chi2_superior, 4) # type: ignore
-    chi2_inferior_round = round(chi2_inferior, 4) # type: ignore
+    with tramo("calculos.valor_critico"):
+        chi2_superior = cuantil_chi2(1 - (alpha / 2), grados_libertad)
+        chi2_inferior = cuantil_chi2(alpha / 2, grados_libertad)
+    chi2_superior_round = round(chi2_superior, 4)
+    chi2_inferior_round = round(chi2_inferior, 4)
     return chi2_superior_round, chi2_inferior_round
 
 
+def _limites_wilson(numero_exitos: int, tamano_muestra: int, valor_critico_Z: float) -> tuple[float, float]:
+    """
+    Calcula los límites del intervalo de Wilson (puntaje) con la
+    proporción exacta X / n.
+
+    :return: Límite inferior y superior del intervalo.
+    :rtype: tuple[float, float]
+    """
+    proporcion = numero_exitos / tamano_muestra
+    cuadrado_Z = valor_critico_Z ** 2
+    denominador = 1 + cuadrado_Z / tamano_muestra
+    centro = (proporcion + cuadrado_Z / (2 * tamano_muestra)) / denominador
+    margen = (valor_critico_Z / denominador) * math.sqrt(
+        proporcion * (1 - proporcion) / tamano_muestra + cuadrado_Z / (4 * tamano_muestra ** 2)
+    )
+    return max(centro - margen, 0.0), min(centro + margen, 1.0)
+
+
 def intervalo_caso_1(
         tamano_muestra: int,
-        muestra: str,
+        muestra: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
         desv_estandar_poblacional: float,
-    ) -> tuple[float, float, float]:
+    ) -> ResultadoCaso1:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Una media poblacional (μ).
@@ -272,34 +320,35 @@ def intervalo_caso_1(
     
     :param tamano_muestra: Tamaño de una muestra (n).
     :type tamano_muestra: int
-    :param muestra: Una muestra válida.
-    :type muestra: str
+    :param muestra: Una muestra válida o sus momentos acumulados.
+    :type muestra: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
     :param desv_estandar_poblacional: Desviación estándar
     poblacional (σ).
     :type desv_estandar_poblacional: float
-    :return: Límite superior e inferior del intervalo y la media
+    :return: Límite inferior y superior del intervalo y la media
     muestral (X̄).
-    :rtype: tuple[float, float, float]
+    :rtype: ResultadoCaso1
     """
     # datos necesarios
-    media_muestral = _calcular_media(muestra)
+    momentos = _obtener_momentos(muestra)
+    media_muestral = _calcular_media(momentos)
     valor_critico_Z = _calcular_valor_critico_normal_estandar(porcentaje_confianza)
     
     # intervalos
     multiplicacion = valor_critico_Z * (desv_estandar_poblacional / math.sqrt(tamano_muestra))
     intervalo_l = media_muestral - multiplicacion
     intervalo_u = media_muestral + multiplicacion
-    return intervalo_l, intervalo_u, media_muestral
+    return ResultadoCaso1(intervalo_l, intervalo_u, media_muestral)
 
 
 def intervalo_caso_2(
         tamano_muestra: int,
-        muestra: str,
+        muestra: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float, float]:
+    ) -> ResultadoCaso2:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Una media poblacional (μ).
@@ -309,29 +358,26 @@ def intervalo_caso_2(
     
     :param tamano_muestra: Tamaño de una muestra (n).
     :type tamano_muestra: int
-    :param muestra: Una muestra válida.
-    :type muestra: str
+    :param muestra: Una muestra válida o sus momentos acumulados.
+    :type muestra: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, media
+    :return: Límite inferior y superior del intervalo, media
     muestral (X̄) y la desviación estándar muestral (𝑠).
-    :rtype: tuple[float, float, float, float]
+    :rtype: ResultadoCaso2
     """
     # datos necesarios
-    media_muestral = _calcular_media(muestra)
+    momentos = _obtener_momentos(muestra)
+    media_muestral = _calcular_media(momentos)
     valor_critico_t = _calcular_valor_critico_t_student(porcentaje_confianza, tamano_muestra, 2)
-    desv_estandar_muestral = math.sqrt(_calcular_varianza_muestral(
-        tamano_muestra,
-        muestra,
-        media_muestral,
-    ))
+    desv_estandar_muestral = math.sqrt(_calcular_varianza_muestral(momentos))
     
     # intervalos
     multiplicacion = valor_critico_t * (desv_estandar_muestral / math.sqrt(tamano_muestra))
     intervalo_l = media_muestral - multiplicacion
     intervalo_u = media_muestral + multiplicacion
-    return intervalo_l, intervalo_u, media_muestral, desv_estandar_muestral
+    return ResultadoCaso2(intervalo_l, intervalo_u, media_muestral, desv_estandar_muestral)
 
 
 def intervalo_caso_3(
@@ -339,10 +385,10 @@ def intervalo_caso_3(
         tamano_muestra_2: int,
         desv_estandar_poblacional_1: float,
         desv_estandar_poblacional_2: float,
-        muestra_1: str,
-        muestra_2: str,
+        muestra_1: Muestra | AcumuladorMomentos | str,
+        muestra_2: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float]:
+    ) -> ResultadoCaso3:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -363,20 +409,22 @@ def intervalo_caso_3(
     de una segunda muestra (σ₂).
     :type desv_estandar_poblacional_2: float
     :param muestra_1: Una primera muestra válida.
-    :type muestra_1: str
+    :type muestra_1: Muestra | AcumuladorMomentos | str
     :param muestra_2: Una segunda muestra válida.
-    :type muestra_2: str
+    :type muestra_2: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo y la
+    :return: Límite inferior y superior del intervalo y la
     diferencia de medias
     mustrales (X̄₁ - X̄₂).
-    :rtype: tuple[float, float, float]
+    :rtype: ResultadoCaso3
     """
     # datos necesarios
-    media_muestral_1 = _calcular_media(muestra_1)
-    media_muestral_2 = _calcular_media(muestra_2)
+    momentos_1 = _obtener_momentos(muestra_1)
+    momentos_2 = _obtener_momentos(muestra_2)
+    media_muestral_1 = _calcular_media(momentos_1)
+    media_muestral_2 = _calcular_media(momentos_2)
     valor_critico_Z = _calcular_valor_critico_normal_estandar(porcentaje_confianza)
     division_1 = (desv_estandar_poblacional_1 ** 2) / tamano_muestra_1
     division_2 = (desv_estandar_poblacional_2 ** 2) / tamano_muestra_2
@@ -385,16 +433,16 @@ def intervalo_caso_3(
     # intervalos
     intervalo_l = (media_muestral_1 - media_muestral_2) - (valor_critico_Z * raiz)
     intervalo_u = (media_muestral_1 - media_muestral_2) + (valor_critico_Z * raiz)
-    return intervalo_l, intervalo_u, media_muestral_1 - media_muestral_2
+    return ResultadoCaso3(intervalo_l, intervalo_u, media_muestral_1 - media_muestral_2)
 
 
 def intervalo_caso_4(
         tamano_muestra_1: int,
         tamano_muestra_2: int,
-        muestra_1: str,
-        muestra_2: str,
+        muestra_1: Muestra | AcumuladorMomentos | str,
+        muestra_2: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float, float]:
+    ) -> ResultadoCaso4:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -409,31 +457,25 @@ def intervalo_caso_4(
     :param tamano_muestra_2: Tamaño de una segunda muestra (n₂).
     :type tamano_muestra_2: int
     :param muestra_1: Una primera muestra válida.
-    :type muestra_1: str
+    :type muestra_1: Muestra | AcumuladorMomentos | str
     :param muestra_2: Una segunda muestra válida.
-    :type muestra_2: str
+    :type muestra_2: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, diferencia de
+    :return: Límite inferior y superior del intervalo, diferencia de
     medias muestrales (X̄₁ - X̄₂), y el valor crítico de la
     distribución normal estándar (Z).
-    :rtype: tuple[float, float, float, float]
+    :rtype: ResultadoCaso4
     """
     # datos necesarios
-    media_muestral_1 = _calcular_media(muestra_1)
-    media_muestral_2 = _calcular_media(muestra_2)
+    momentos_1 = _obtener_momentos(muestra_1)
+    momentos_2 = _obtener_momentos(muestra_2)
+    media_muestral_1 = _calcular_media(momentos_1)
+    media_muestral_2 = _calcular_media(momentos_2)
     valor_critico_Z = _calcular_valor_critico_normal_estandar(porcentaje_confianza)
-    varianza_muestral_1 = _calcular_varianza_muestral(
-        tamano_muestra_1,
-        muestra_1,
-        media_muestral_1,
-    )
-    varianza_muestral_2 = _calcular_varianza_muestral(
-        tamano_muestra_1,
-        muestra_2,
-        media_muestral_2,
-    )
+    varianza_muestral_1 = _calcular_varianza_muestral(momentos_1)
+    varianza_muestral_2 = _calcular_varianza_muestral(momentos_2)
 
     # intervalos
     raiz = math.sqrt(
@@ -441,7 +483,7 @@ def intervalo_caso_4(
     )
     intervalo_l = (media_muestral_1 - media_muestral_2) - (valor_critico_Z * raiz)
     intervalo_u = (media_muestral_1 - media_muestral_2) + (valor_critico_Z * raiz)
-    return (
+    return ResultadoCaso4(
         intervalo_l,
         intervalo_u,
         round(media_muestral_1 - media_muestral_2, 2),
@@ -452,10 +494,10 @@ def intervalo_caso_4(
 def intervalo_caso_5(
         tamano_muestra_1: int,
         tamano_muestra_2: int,
-        muestra_1: str,
-        muestra_2: str,
+        muestra_1: Muestra | AcumuladorMomentos | str,
+        muestra_2: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float, float, float]:
+    ) -> ResultadoCaso5:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -470,30 +512,24 @@ def intervalo_caso_5(
     :param tamano_muestra_2: Tamaño de una segunda muestra (n₂).
     :type tamano_muestra_2: int
     :param muestra_1: Una primera muestra válida.
-    :type muestra_1: str
+    :type muestra_1: Muestra | AcumuladorMomentos | str
     :param muestra_2: Una segunda muestra válida.
-    :type muestra_2: str
+    :type muestra_2: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, diferencia de
+    :return: Límite inferior y superior del intervalo, diferencia de
     medias mustrales (X̄₁ - X̄₂), valor crítico de la distribución t y
     los grados de libertad efectivos (ν).
-    :rtype: tuple[float, float, float, float, float]
+    :rtype: ResultadoCaso5
     """
     # datos necesarios
-    media_muestral_1 = _calcular_media(muestra_1)
-    media_muestral_2 = _calcular_media(muestra_2)
-    varianza_muestral_1 = _calcular_varianza_muestral(
-        tamano_muestra_1,
-        muestra_1,
-        media_muestral_1,
-    )
-    varianza_muestral_2 = _calcular_varianza_muestral(
-        tamano_muestra_2,
-        muestra_2,
-        media_muestral_2,
-    )
+    momentos_1 = _obtener_momentos(muestra_1)
+    momentos_2 = _obtener_momentos(muestra_2)
+    media_muestral_1 = _calcular_media(momentos_1)
+    media_muestral_2 = _calcular_media(momentos_2)
+    varianza_muestral_1 = _calcular_varianza_muestral(momentos_1)
+    varianza_muestral_2 = _calcular_varianza_muestral(momentos_2)
     grados_libertad_efectivos = _calcular_grados_libertad_efectivos(
         varianza_muestral_1,
         varianza_muestral_2,
@@ -512,7 +548,7 @@ def intervalo_caso_5(
     )
     intervalo_l = (media_muestral_1 - media_muestral_2) - (valor_critico_t * raiz)
     intervalo_u = (media_muestral_1 - media_muestral_2) + (valor_critico_t * raiz)
-    return (
+    return ResultadoCaso5(
         intervalo_l,
         intervalo_u,
         media_muestral_1 - media_muestral_2,
@@ -524,10 +560,10 @@ def intervalo_caso_5(
 def intervalo_caso_6(
         tamano_muestra_1: int,
         tamano_muestra_2: int,
-        muestra_1: str,
-        muestra_2: str,
+        muestra_1: Muestra | AcumuladorMomentos | str,
+        muestra_2: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float, float, float]:
+    ) -> ResultadoCaso6:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -542,30 +578,24 @@ def intervalo_caso_6(
     :param tamano_muestra_2: Tamaño de una segunda muestra (n₂).
     :type tamano_muestra_2: int
     :param muestra_1: Una primera muestra válida.
-    :type muestra_1: str
+    :type muestra_1: Muestra | AcumuladorMomentos | str
     :param muestra_2: Una segunda muestra válida.
-    :type muestra_2: str
+    :type muestra_2: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, diferencia de
+    :return: Límite inferior y superior del intervalo, diferencia de
     medias muestrales (X̄₁ - X̄₂), valor crítico de la distribución t y
     los grados de libertad para la distribución.
-    :rtype: tuple[float, float, float, float, float]
+    :rtype: ResultadoCaso6
     """
     # datos necesarios
-    media_muestral_1 = _calcular_media(muestra_1)
-    media_muestral_2 = _calcular_media(muestra_2)
-    varianza_muestral_1 = _calcular_varianza_muestral(
-        tamano_muestra_1,
-        muestra_1,
-        media_muestral_1,
-    )
-    varianza_muestral_2 = _calcular_varianza_muestral(
-        tamano_muestra_2,
-        muestra_2,
-        media_muestral_2,
-    )
+    momentos_1 = _obtener_momentos(muestra_1)
+    momentos_2 = _obtener_momentos(muestra_2)
+    media_muestral_1 = _calcular_media(momentos_1)
+    media_muestral_2 = _calcular_media(momentos_2)
+    varianza_muestral_1 = _calcular_varianza_muestral(momentos_1)
+    varianza_muestral_2 = _calcular_varianza_muestral(momentos_2)
     desv_estandar_combinada = _calcular_desviacion_estandar_combinada(
         varianza_muestral_1,
         varianza_muestral_2,
@@ -584,7 +614,7 @@ def intervalo_caso_6(
     parte_2 = valor_critico_t * desv_estandar_combinada * raiz
     intervalo_l = parte_1 - parte_2
     intervalo_u = parte_1 + parte_2
-    return (
+    return ResultadoCaso6(
         intervalo_l,
         intervalo_u,
         media_muestral_1 - media_muestral_2,
@@ -597,7 +627,7 @@ def intervalo_caso_7(
         numero_exitos: int,
         tamano_muestra: int,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float, float]:
+    ) -> ResultadoCaso7:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Proporción poblacional (𝑃).
@@ -611,10 +641,10 @@ def intervalo_caso_7(
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, proporción
+    :return: Límite inferior y superior del intervalo, proporción
     muestral (𝑝) y el valor crítico de la distribución
     normal estándar (Z).
-    :rtype: tuple[float, float, float, float]
+    :rtype: ResultadoCaso7
     """
     # datos necesarios
     proporcion_muestral = _calcular_proporcion_muestral(numero_exitos, tamano_muestra)
@@ -624,7 +654,109 @@ def intervalo_caso_7(
     raiz = math.sqrt((proporcion_muestral * (1 - proporcion_muestral)) / tamano_muestra)
     intervalo_l = proporcion_muestral - (valor_critico_Z * raiz)
     intervalo_u = proporcion_muestral + (valor_critico_Z * raiz)
-    return intervalo_l, intervalo_u, proporcion_muestral, valor_critico_Z
+    return ResultadoCaso7(intervalo_l, intervalo_u, proporcion_muestral, valor_critico_Z)
+
+
+def intervalo_wilson(
+        numero_exitos: int,
+        tamano_muestra: int,
+        porcentaje_confianza: int,
+    ) -> ResultadoCaso7:
+    """
+    Calcula el intervalo de puntaje de Wilson para la proporción
+    poblacional (𝑃). A diferencia del caso 7 no necesita np ≥ 5 ni
+    n(1-p) ≥ 5 y nunca se sale de [0, 1].
+
+    :param numero_exitos: Número de exitos (X) de la muestra.
+    :type numero_exitos: int
+    :param tamano_muestra: Tamaño de una muestra (n).
+    :type tamano_muestra: int
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :return: Límite inferior y superior del intervalo, proporción
+    muestral (𝑝) y el valor crítico de la distribución
+    normal estándar (Z).
+    :rtype: ResultadoCaso7
+    """
+    proporcion_muestral = _calcular_proporcion_muestral(numero_exitos, tamano_muestra)
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(porcentaje_confianza)
+    intervalo_l, intervalo_u = _limites_wilson(numero_exitos, tamano_muestra, valor_critico_Z)
+    return ResultadoCaso7(intervalo_l, intervalo_u, proporcion_muestral, valor_critico_Z)
+
+
+def intervalo_agresti_coull(
+        numero_exitos: int,
+        tamano_muestra: int,
+        porcentaje_confianza: int,
+    ) -> ResultadoCaso7:
+    """
+    Calcula el intervalo de Agresti-Coull para la proporción
+    poblacional (𝑃): el intervalo del caso 7 con X + Z²/2 éxitos en
+    n + Z² ensayos, recortado a [0, 1].
+
+    :param numero_exitos: Número de exitos (X) de la muestra.
+    :type numero_exitos: int
+    :param tamano_muestra: Tamaño de una muestra (n).
+    :type tamano_muestra: int
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :return: Límite inferior y superior del intervalo, proporción
+    muestral (𝑝) y el valor crítico de la distribución
+    normal estándar (Z).
+    :rtype: ResultadoCaso7
+    """
+    proporcion_muestral = _calcular_proporcion_muestral(numero_exitos, tamano_muestra)
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(porcentaje_confianza)
+
+    tamano_ajustado = tamano_muestra + valor_critico_Z ** 2
+    proporcion_ajustada = (numero_exitos + valor_critico_Z ** 2 / 2) / tamano_ajustado
+    raiz = math.sqrt(proporcion_ajustada * (1 - proporcion_ajustada) / tamano_ajustado)
+    intervalo_l = max(proporcion_ajustada - valor_critico_Z * raiz, 0.0)
+    intervalo_u = min(proporcion_ajustada + valor_critico_Z * raiz, 1.0)
+    return ResultadoCaso7(intervalo_l, intervalo_u, proporcion_muestral, valor_critico_Z)
+
+
+def intervalo_clopper_pearson(
+        numero_exitos: int,
+        tamano_muestra: int,
+        porcentaje_confianza: int,
+    ) -> ResultadoClopperPearson:
+    """
+    Calcula el intervalo exacto de Clopper-Pearson para la proporción
+    poblacional (𝑃), a partir de los cuantiles de la distribución
+    beta expresados con la distribución F.
+
+    :param numero_exitos: Número de exitos (X) de la muestra.
+    :type numero_exitos: int
+    :param tamano_muestra: Tamaño de una muestra (n).
+    :type tamano_muestra: int
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :return: Límite inferior y superior del intervalo y proporción
+    muestral (𝑝).
+    :rtype: ResultadoClopperPearson
+    """
+    proporcion_muestral = _calcular_proporcion_muestral(numero_exitos, tamano_muestra)
+    alpha = 1 - (porcentaje_confianza / 100)
+    fracasos = tamano_muestra - numero_exitos
+
+    # Beta(X, n - X + 1) y Beta(X + 1, n - X) en términos de F
+    intervalo_l = 0.0
+    if numero_exitos > 0:
+        f_inferior = cuantil_f(alpha / 2, 2 * numero_exitos, 2 * (fracasos + 1))
+        intervalo_l = numero_exitos * f_inferior / (fracasos + 1 + numero_exitos * f_inferior)
+
+    intervalo_u = 1.0
+    if fracasos > 0:
+        f_superior = cuantil_f(1 - alpha / 2, 2 * (numero_exitos + 1), 2 * fracasos)
+        intervalo_u = (
+            (numero_exitos + 1) * f_superior / (fracasos + (numero_exitos + 1) * f_superior)
+        )
+
+    return ResultadoClopperPearson(intervalo_l, intervalo_u, proporcion_muestral)
 
 
 def intervalo_caso_8(
@@ -633,7 +765,7 @@ def intervalo_caso_8(
         tamano_muestra_1: int,
         tamano_muestra_2: int,
         porcentaje_confianza: int
-    ) -> tuple[float, float, float, float]:
+    ) -> ResultadoCaso8:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de proporciones
@@ -656,10 +788,10 @@ def intervalo_caso_8(
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, diferencia de
+    :return: Límite inferior y superior del intervalo, diferencia de
     proporciones muestrales (𝑝₁ - 𝑝₂), y el valor crítico de la
     distribución normal estándar (Z).
-    :rtype: tuple[float, float, float, float]
+    :rtype: ResultadoCaso8
     """
     # datos necesarios
     proporcion_muestral_1 = _calcular_proporcion_muestral(numero_exitos_1, tamano_muestra_1)
@@ -672,7 +804,7 @@ def intervalo_caso_8(
     raiz = math.sqrt(division_1 + division_2)
     intervalo_l = (proporcion_muestral_1 - proporcion_muestral_2) - (valor_critico_Z * raiz)
     intervalo_u = (proporcion_muestral_1 - proporcion_muestral_2) + (valor_critico_Z * raiz)
-    return (
+    return ResultadoCaso8(
         intervalo_l,
         intervalo_u,
         proporcion_muestral_1 - proporcion_muestral_2,
@@ -680,11 +812,60 @@ def intervalo_caso_8(
     )
 
 
+def intervalo_newcombe(
+        numero_exitos_1: int,
+        numero_exitos_2: int,
+        tamano_muestra_1: int,
+        tamano_muestra_2: int,
+        porcentaje_confianza: int,
+    ) -> ResultadoCaso8:
+    """
+    Calcula el intervalo de Newcombe (híbrido de puntajes de Wilson)
+    para la diferencia de proporciones poblacionales (𝑃₁ - 𝑃₂). A
+    diferencia del caso 8 no necesita que las muestras cumplan las
+    condiciones de normalidad.
+
+    :param numero_exitos_1: Número de exitos de una primera
+    muestra (X₁).
+    :type numero_exitos_1: int
+    :param numero_exitos_2: Número de exitos de una segunda
+    muestra (X₂).
+    :type numero_exitos_2: int
+    :param tamano_muestra_1: Tamaño de una primera muestra (n₁).
+    :type tamano_muestra_1: int
+    :param tamano_muestra_2: Tamaño de una segunda muestra (n₂).
+    :type tamano_muestra_2: int
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :return: Límite inferior y superior del intervalo, diferencia de
+    proporciones muestrales (𝑝₁ - 𝑝₂), y el valor crítico de la
+    distribución normal estándar (Z).
+    :rtype: ResultadoCaso8
+    """
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(porcentaje_confianza)
+    proporcion_1 = numero_exitos_1 / tamano_muestra_1
+    proporcion_2 = numero_exitos_2 / tamano_muestra_2
+    inferior_1, superior_1 = _limites_wilson(numero_exitos_1, tamano_muestra_1, valor_critico_Z)
+    inferior_2, superior_2 = _limites_wilson(numero_exitos_2, tamano_muestra_2, valor_critico_Z)
+
+    diferencia = proporcion_1 - proporcion_2
+    intervalo_l = diferencia - math.hypot(proporcion_1 - inferior_1, superior_2 - proporcion_2)
+    intervalo_u = diferencia + math.hypot(superior_1 - proporcion_1, proporcion_2 - inferior_2)
+    return ResultadoCaso8(
+        intervalo_l,
+        intervalo_u,
+        _calcular_proporcion_muestral(numero_exitos_1, tamano_muestra_1)
+        - _calcular_proporcion_muestral(numero_exitos_2, tamano_muestra_2),
+        valor_critico_Z,
+    )
+
+
 def intervalo_caso_9(
         tamano_muestra: int,
-        muestra: str,
+        muestra: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, float, float]:
+    ) -> ResultadoCaso9:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Varianza poblacional (σ²).
@@ -693,36 +874,36 @@ def intervalo_caso_9(
     
     :param tamano_muestra: Tamaño de una muestra (n).
     :type tamano_muestra: int
-    :param muestra: Una muestra válida.
-    :type muestra: str
+    :param muestra: Una muestra válida o sus momentos acumulados.
+    :type muestra: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, varianza
+    :return: Límite inferior y superior del intervalo, varianza
     muestral (𝑠²) y los grados de libertad para la distribución.
-    :rtype: tuple[float, float, float, float]
+    :rtype: ResultadoCaso9
     """
     # datos necesarios
-    media_muestral = _calcular_media(muestra)
-    varianza_muestral = _calcular_varianza_muestral(tamano_muestra, muestra, media_muestral)
+    momentos = _obtener_momentos(muestra)
+    varianza_muestral = _calcular_varianza_muestral(momentos)
     chi2_superior, chi2_inferior = _calcular_valor_critico_chi_cuadrada(
-        porcentaje_confianza,
         tamano_muestra,
+        porcentaje_confianza,
     )
     
     # intervalos
     intervalo_l = (varianza_muestral * (tamano_muestra - 1)) / chi2_superior
     intervalo_u = (varianza_muestral * (tamano_muestra - 1)) / chi2_inferior
-    return intervalo_l, intervalo_u, varianza_muestral, tamano_muestra - 1
+    return ResultadoCaso9(intervalo_l, intervalo_u, varianza_muestral, tamano_muestra - 1)
 
 
 def intervalo_caso_10(
         tamano_muestra_1: int,
         tamano_muestra_2: int,
-        muestra_1: str,
-        muestra_2: str,
+        muestra_1: Muestra | AcumuladorMomentos | str,
+        muestra_2: Muestra | AcumuladorMomentos | str,
         porcentaje_confianza: int,
-    ) -> tuple[float, float, bool, float, float, float]:
+    ) -> ResultadoCaso10:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Cociente de varianzas
@@ -736,29 +917,21 @@ def intervalo_caso_10(
     :param tamano_muestra_2: Tamaño de una segunda muestra (n₂).
     :type tamano_muestra_2: int
     :param muestra_1: Una primera muestra válida.
-    :type muestra_1: str
+    :type muestra_1: Muestra | AcumuladorMomentos | str
     :param muestra_2: Una segunda muestra válida.
-    :type muestra_2: str
+    :type muestra_2: Muestra | AcumuladorMomentos | str
     :param porcentaje_confianza: Porcentaje de confianza para un
     intervalo de confianza.
     :type porcentaje_confianza: int
-    :return: Límite superior e inferior del intervalo, estatus de
+    :return: Límite inferior y superior del intervalo, estatus de
     la varianza muestral, grados de libertad x3 para la distribución.
-    :rtype: tuple[float, float, str, float, float, float]
+    :rtype: ResultadoCaso10
     """
     # datos necesarios
-    media_muestral_1 = _calcular_media(muestra_1)
-    media_muestral_2 = _calcular_media(muestra_2)
-    varianza_muestral_1 = _calcular_varianza_muestral(
-        tamano_muestra_1,
-        muestra_1,
-        media_muestral_1,
-    )
-    varianza_muestral_2 = _calcular_varianza_muestral(
-        tamano_muestra_2,
-        muestra_2,
-        media_muestral_2,
-    ) 
+    momentos_1 = _obtener_momentos(muestra_1)
+    momentos_2 = _obtener_momentos(muestra_2)
+    varianza_muestral_1 = _calcular_varianza_muestral(momentos_1)
+    varianza_muestral_2 = _calcular_varianza_muestral(momentos_2)
     f_superior, f_inferior = _calcular_valor_critico_f(
         tamano_muestra_1,
         tamano_muestra_2,
@@ -773,7 +946,7 @@ def intervalo_caso_10(
     else:
         varianzas_son_iguales = False
 
-    return (
+    return ResultadoCaso10(
         intervalo_l,
         intervalo_u,
         varianzas_son_iguales,
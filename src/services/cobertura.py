@@ -0,0 +1,410 @@
+"""
+En este módulo se define el simulador de cobertura: para una
+configuración (caso, tamaños de muestra, distribución de la población
+y sus parámetros) se generan R muestras, se calcula el intervalo de
+cada una con las funciones por lotes y se cuenta cuántos intervalos
+contienen al parámetro verdadero. Sirve para comprobar la cobertura
+real de cada caso (por ejemplo, los grados de libertad de Welch del
+caso 5 o la Z de muestras grandes del caso 4) fuera de sus supuestos.
+
+Las réplicas se simulan por bloques de ``REPLICAS_POR_BLOQUE`` con
+una semilla propia derivada de ``np.random.SeedSequence``, así que el
+resultado con la misma semilla es el mismo con cualquier número de
+procesos. Dentro de un bloque las muestras se generan en matrices de
+(réplicas, n) cuyo tamaño se ajusta al presupuesto de memoria y se
+reducen a sus momentos. Con población normal no se generan las
+observaciones: X̄ y (n - 1)𝑠²/σ² se obtienen directamente de sus
+distribuciones (normal y χ² independientes), y en las proporciones
+el número de éxitos sale de la binomial, así que el costo no depende
+de n.
+
+Los momentos se redondean a cuatro decimales antes de llamar a las
+funciones por lotes, igual que en el cálculo escalar.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from src.errores import (
+    ERR_OBSERVACIONES_INSUFICIENTES,
+    ERR_PORCENTAJE_CONFIANZA,
+    ERR_TAMANO_MUESTRA,
+)
+
+from . import lotes
+
+__all__ = [
+    "CASOS_COBERTURA",
+    "DISTRIBUCIONES_POBLACION",
+    "MEMORIA_SIMULACION",
+    "REPLICAS_POR_BLOQUE",
+    "ConfiguracionCobertura",
+    "ResultadoCobertura",
+    "simular_cobertura",
+    "simular_coberturas",
+]
+
+REPLICAS_POR_BLOQUE = 1 << 16
+MEMORIA_SIMULACION = 64 << 20
+
+# Generadores de observaciones estandarizadas (media 0 y varianza 1)
+_ESTANDARIZADAS = {
+    "normal": lambda generador, forma: generador.standard_normal(forma),
+    "uniforme": lambda generador, forma: (generador.random(forma) - 0.5) * math.sqrt(12),
+    "exponencial": lambda generador, forma: generador.standard_exponential(forma) - 1,
+    "lognormal": lambda generador, forma: (
+        (np.exp(generador.standard_normal(forma)) - math.exp(0.5))
+        / math.sqrt((math.e - 1) * math.e)
+    ),
+    "t5": lambda generador, forma: generador.standard_t(5, forma) / math.sqrt(5 / 3),
+}
+
+DISTRIBUCIONES_POBLACION = tuple(_ESTANDARIZADAS)
+
+# Casos que se pueden simular y función por lotes de cada uno; los
+# métodos de proporciones se simulan igual que los casos 7 y 8
+_FUNCIONES = {
+    1: lotes.intervalo_caso_1_lote,
+    2: lotes.intervalo_caso_2_lote,
+    3: lotes.intervalo_caso_3_lote,
+    4: lotes.intervalo_caso_4_lote,
+    5: lotes.intervalo_caso_5_lote,
+    6: lotes.intervalo_caso_6_lote,
+    7: lotes.intervalo_caso_7_lote,
+    8: lotes.intervalo_caso_8_lote,
+    9: lotes.intervalo_caso_9_lote,
+    10: lotes.intervalo_caso_10_lote,
+    "wilson": lotes.intervalo_wilson_lote,
+    "agresti_coull": lotes.intervalo_agresti_coull_lote,
+    "clopper_pearson": lotes.intervalo_clopper_pearson_lote,
+    "newcombe": lotes.intervalo_newcombe_lote,
+}
+
+CASOS_COBERTURA = tuple(_FUNCIONES)
+
+_PROPORCION = (7, "wilson", "agresti_coull", "clopper_pearson")
+_DIF_PROPORCIONES = (8, "newcombe")
+_DOS_MUESTRAS = (3, 4, 5, 6, 10)
+_CON_VARIANZA = (2, 4, 5, 6, 9, 10)
+
+class ConfiguracionCobertura(NamedTuple):
+    """
+    Configuración de una simulación. Los campos de la segunda muestra
+    solo se usan en los casos de dos muestras y los de proporción solo
+    en los de proporciones; ``tamano_muestra_2`` en 0 toma el valor
+    de ``tamano_muestra_1``.
+    """
+    caso: int | str
+    tamano_muestra_1: int
+    tamano_muestra_2: int = 0
+    porcentaje_confianza: int = 95
+    distribucion: str = "normal"
+    media_1: float = 0.0
+    media_2: float = 0.0
+    desv_estandar_1: float = 1.0
+    desv_estandar_2: float = 1.0
+    proporcion_1: float = 0.5
+    proporcion_2: float = 0.5
+
+
+class ResultadoCobertura(NamedTuple):
+    """Cobertura empírica de una configuración."""
+    configuracion: ConfiguracionCobertura
+    replicas: int
+    validas: int
+    cobertura: float
+    error_estandar: float
+    por_debajo: float
+    por_encima: float
+    ancho_medio: float
+
+
+def _validar(configuracion: ConfiguracionCobertura) -> ConfiguracionCobertura:
+    if configuracion.caso not in _FUNCIONES:
+        raise ValueError(f"Caso no válido: {configuracion.caso}")
+
+    if configuracion.distribucion not in _ESTANDARIZADAS:
+        raise ValueError(
+            f"Distribución no válida: {configuracion.distribucion} "
+            f"(usa {', '.join(DISTRIBUCIONES_POBLACION)})"
+        )
+
+    if not 0 < configuracion.porcentaje_confianza < 100:
+        raise ValueError(ERR_PORCENTAJE_CONFIANZA)
+
+    if configuracion.tamano_muestra_2 == 0:
+        configuracion = configuracion._replace(tamano_muestra_2=configuracion.tamano_muestra_1)
+
+    tamanos = (configuracion.tamano_muestra_1, configuracion.tamano_muestra_2)
+    if min(tamanos) < 1:
+        raise ValueError(ERR_TAMANO_MUESTRA)
+
+    if configuracion.caso in _CON_VARIANZA and min(tamanos) < 2:
+        raise ValueError(ERR_OBSERVACIONES_INSUFICIENTES)
+
+    return configuracion
+
+
+def _parametro(configuracion: ConfiguracionCobertura) -> float:
+    """Valor verdadero del parámetro que estima el caso."""
+    caso = configuracion.caso
+    if caso in (1, 2):
+        return configuracion.media_1
+
+    if caso in (3, 4, 5, 6):
+        return configuracion.media_1 - configuracion.media_2
+
+    if caso in _PROPORCION:
+        return configuracion.proporcion_1
+
+    if caso in _DIF_PROPORCIONES:
+        return configuracion.proporcion_1 - configuracion.proporcion_2
+
+    if caso == 9:
+        return configuracion.desv_estandar_1 ** 2
+
+    return configuracion.desv_estandar_1 ** 2 / configuracion.desv_estandar_2 ** 2
+
+
+def _momentos(
+        generador: np.random.Generator,
+        distribucion: str,
+        tamano_muestra: int,
+        media: float,
+        desv_estandar: float,
+        replicas: int,
+        memoria_maxima: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Medias y varianzas muestrales de ``replicas`` muestras de tamaño
+    n, redondeadas a cuatro decimales.
+    """
+    if distribucion == "normal":
+        medias = media + desv_estandar / math.sqrt(tamano_muestra) * generador.standard_normal(replicas)
+        if tamano_muestra > 1:
+            grados_libertad = tamano_muestra - 1
+            varianzas = desv_estandar ** 2 * generador.chisquare(grados_libertad, replicas) / grados_libertad
+        else:
+            varianzas = np.full(replicas, np.nan)
+
+        return np.round(medias, 4), np.round(varianzas, 4)
+
+    medias = np.empty(replicas)
+    varianzas = np.empty(replicas)
+    filas = max(1, min(replicas, memoria_maxima // (8 * tamano_muestra)))
+    for inicio in range(0, replicas, filas):
+        cantidad = min(filas, replicas - inicio)
+        observaciones = _ESTANDARIZADAS[distribucion](generador, (cantidad, tamano_muestra))
+        observaciones *= desv_estandar
+        observaciones += media
+        medias[inicio:inicio + cantidad] = observaciones.mean(axis=1)
+        if tamano_muestra > 1:
+            varianzas[inicio:inicio + cantidad] = observaciones.var(axis=1, ddof=1)
+        else:
+            varianzas[inicio:inicio + cantidad] = np.nan
+
+    return np.round(medias, 4), np.round(varianzas, 4)
+
+
+def _intervalos(
+        configuracion: ConfiguracionCobertura,
+        semilla: np.random.SeedSequence,
+        replicas: int,
+        memoria_maxima: int,
+    ):
+    # Un generador por muestra para que la primera muestra de un caso
+    # de dos muestras no dependa de la segunda
+    generador_1, generador_2 = (np.random.default_rng(hija) for hija in semilla.spawn(2))
+    n1 = configuracion.tamano_muestra_1
+    n2 = configuracion.tamano_muestra_2
+    confianza = configuracion.porcentaje_confianza
+    caso = configuracion.caso
+    funcion = _FUNCIONES[caso]
+
+    if caso in _PROPORCION:
+        exitos = generador_1.binomial(n1, configuracion.proporcion_1, replicas)
+        return funcion(exitos, n1, confianza)
+
+    if caso in _DIF_PROPORCIONES:
+        exitos_1 = generador_1.binomial(n1, configuracion.proporcion_1, replicas)
+        exitos_2 = generador_2.binomial(n2, configuracion.proporcion_2, replicas)
+        return funcion(exitos_1, exitos_2, n1, n2, confianza)
+
+    distribucion = configuracion.distribucion
+    medias_1, varianzas_1 = _momentos(
+        generador_1,
+        distribucion,
+        n1,
+        configuracion.media_1,
+        configuracion.desv_estandar_1,
+        replicas,
+        memoria_maxima,
+    )
+    if caso not in _DOS_MUESTRAS:
+        if caso == 1:
+            return funcion(n1, medias_1, confianza, configuracion.desv_estandar_1)
+
+        if caso == 2:
+            return funcion(n1, medias_1, varianzas_1, confianza)
+
+        return funcion(n1, varianzas_1, confianza)
+
+    medias_2, varianzas_2 = _momentos(
+        generador_2,
+        distribucion,
+        n2,
+        configuracion.media_2,
+        configuracion.desv_estandar_2,
+        replicas,
+        memoria_maxima,
+    )
+    if caso == 3:
+        return funcion(
+            n1,
+            n2,
+            configuracion.desv_estandar_1,
+            configuracion.desv_estandar_2,
+            medias_1,
+            medias_2,
+            confianza,
+        )
+
+    if caso == 10:
+        return funcion(n1, n2, varianzas_1, varianzas_2, confianza)
+
+    return funcion(n1, n2, medias_1, medias_2, varianzas_1, varianzas_2, confianza)
+
+
+def _simular_bloque(
+        configuracion: ConfiguracionCobertura,
+        semilla: np.random.SeedSequence,
+        replicas: int,
+        memoria_maxima: int,
+    ) -> tuple[int, int, int, float]:
+    """
+    :return: Intervalos válidos (con límites finitos), intervalos
+    con el parámetro por debajo del límite inferior y por encima del
+    superior, y suma de los anchos de los válidos.
+    """
+    resultado = _intervalos(configuracion, semilla, replicas, memoria_maxima)
+    inferior = np.asarray(resultado.limite_inferior, dtype=np.float64)
+    superior = np.asarray(resultado.limite_superior, dtype=np.float64)
+    validos = np.isfinite(inferior) & np.isfinite(superior)
+    inferior = inferior[validos]
+    superior = superior[validos]
+
+    parametro = _parametro(configuracion)
+    return (
+        int(inferior.shape[0]),
+        int(np.count_nonzero(parametro < inferior)),
+        int(np.count_nonzero(parametro > superior)),
+        float(np.sum(superior - inferior)),
+    )
+
+
+def simular_coberturas(
+        configuraciones: Iterable[ConfiguracionCobertura],
+        replicas: int = 100_000,
+        semilla: int | None = None,
+        procesos: int | None = 1,
+        memoria_maxima: int = MEMORIA_SIMULACION,
+    ) -> list[ResultadoCobertura]:
+    """
+    Estima la cobertura de varias configuraciones; los bloques de
+    todas se reparten entre los mismos procesos.
+
+    :param configuraciones: Configuraciones a simular.
+    :type configuraciones: Iterable[ConfiguracionCobertura]
+    :param replicas: Muestras simuladas por configuración (R).
+    :type replicas: int
+    :param semilla: Semilla para reproducir el resultado.
+    :type semilla: int | None
+    :param procesos: Procesos entre los que se reparten los bloques;
+    ``None`` usa uno por núcleo.
+    :type procesos: int | None
+    :param memoria_maxima: Bytes máximos de cada matriz de
+    observaciones (por proceso).
+    :type memoria_maxima: int
+    :return: Un resultado por configuración, en el mismo orden.
+    :rtype: list[ResultadoCobertura]
+    """
+    configuraciones = [_validar(configuracion) for configuracion in configuraciones]
+    if replicas < 1:
+        raise ValueError("El número de réplicas debe ser mayor o igual a 1")
+
+    procesos = procesos or os.cpu_count() or 1
+    if procesos < 1:
+        raise ValueError("El número de procesos debe ser mayor o igual a 1")
+
+    bloques = math.ceil(replicas / REPLICAS_POR_BLOQUE)
+    tamanos = [
+        min(REPLICAS_POR_BLOQUE, replicas - indice * REPLICAS_POR_BLOQUE) for indice in range(bloques)
+    ]
+    tareas = [
+        (configuracion, semilla_bloque, tamano, memoria_maxima)
+        for configuracion, semilla_configuracion in zip(
+            configuraciones,
+            np.random.SeedSequence(semilla).spawn(len(configuraciones)),
+        )
+        for semilla_bloque, tamano in zip(semilla_configuracion.spawn(bloques), tamanos)
+    ]
+
+    if procesos == 1 or len(tareas) == 1:
+        conteos = [_simular_bloque(*tarea) for tarea in tareas]
+    else:
+        with ProcessPoolExecutor(max_workers=min(procesos, len(tareas))) as ejecutor:
+            conteos = list(ejecutor.map(_simular_bloque, *zip(*tareas)))
+
+    resultados = []
+    for indice, configuracion in enumerate(configuraciones):
+        validas, por_debajo, por_encima, anchos = np.sum(
+            conteos[indice * bloques:(indice + 1) * bloques], axis=0
+        )
+        validas = int(validas)
+        cobertura = (validas - por_debajo - por_encima) / validas if validas else math.nan
+        resultados.append(ResultadoCobertura(
+            configuracion,
+            replicas,
+            validas,
+            float(cobertura),
+            math.sqrt(cobertura * (1 - cobertura) / validas) if validas else math.nan,
+            float(por_debajo / validas) if validas else math.nan,
+            float(por_encima / validas) if validas else math.nan,
+            float(anchos / validas) if validas else math.nan,
+        ))
+
+    return resultados
+
+
+def simular_cobertura(
+        configuracion: ConfiguracionCobertura,
+        replicas: int = 100_000,
+        semilla: int | None = None,
+        procesos: int | None = 1,
+        memoria_maxima: int = MEMORIA_SIMULACION,
+    ) -> ResultadoCobertura:
+    """
+    Estima la cobertura real de una configuración.
+
+    :param configuracion: Caso, tamaños, distribución y parámetros.
+    :type configuracion: ConfiguracionCobertura
+    :param replicas: Muestras simuladas (R).
+    :type replicas: int
+    :param semilla: Semilla para reproducir el resultado.
+    :type semilla: int | None
+    :param procesos: Procesos entre los que se reparten los bloques;
+    ``None`` usa uno por núcleo.
+    :type procesos: int | None
+    :param memoria_maxima: Bytes máximos de cada matriz de
+    observaciones (por proceso).
+    :type memoria_maxima: int
+    :return: Réplicas, intervalos válidos, cobertura empírica y su
+    error estándar, proporción de intervalos que quedan por encima
+    del parámetro (``por_debajo``: el parámetro es menor que el
+    límite inferior) o por debajo (``por_encima``) y ancho medio.
+    :rtype: ResultadoCobertura
+    """
+    return simular_coberturas([configuracion], replicas, semilla, procesos, memoria_maxima)[0]
@@ -0,0 +1,349 @@
+"""
+En este módulo se definen los inversos de las funciones de
+distribución (cuantiles) de las distribuciones normal estándar (Z),
+t de Student, Chi-cuadrada (χ²) y de Fisher (F) usando solo la
+biblioteca estándar, para no tener que importar scipy.
+
+- Normal: ``statistics.NormalDist.inv_cdf`` (algoritmo AS241 de
+  Wichura), con error relativo del orden de 1e-16.
+- t, χ² y F: método de Newton con salvaguarda de bisección sobre la
+  función de distribución, que se evalúa con la función beta o gamma
+  incompleta regularizada (fracciones continuas de Lentz y serie de
+  potencias). La iteración se detiene cuando el paso relativo es
+  menor a 1e-15, así que el error queda dominado por la evaluación
+  de la función de distribución: contra scipy el error relativo es
+  menor a 1e-9 para probabilidades en [1e-10, 1 - 1e-10] y grados de
+  libertad entre 0.5 y 1e5, y menor a 1e-8 hasta 1e6 grados de
+  libertad (la pérdida viene de restar ``lgamma`` de números grandes).
+
+Las colas se resuelven por separado (se usa la función de
+supervivencia cuando la probabilidad es mayor a 0.5) para no perder
+precisión en los cuantiles superiores.
+"""
+import math
+from statistics import NormalDist
+
+__all__ = [
+    "cuantil_chi2",
+    "cuantil_f",
+    "cuantil_normal",
+    "cuantil_t",
+]
+
+_EPSILON = 1e-16
+_MINIMO = 1e-300
+_MAX_ITERACIONES = 200_000
+_MAX_ITERACIONES_NEWTON = 200
+_TOLERANCIA_NEWTON = 1e-15
+
+_NORMAL_ESTANDAR = NormalDist()
+
+def _fraccion_continua_beta(a: float, b: float, x: float) -> float:
+    """
+    Evalúa la fracción continua de la función beta incompleta con el
+    método modificado de Lentz.
+    """
+    qab = a + b
+    qap = a + 1
+    qam = a - 1
+    c = 1.0
+    d = 1 - qab * x / qap
+    if abs(d) < _MINIMO:
+        d = _MINIMO
+
+    d = 1 / d
+    h = d
+    for m in range(1, _MAX_ITERACIONES):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1 + aa * d
+        if abs(d) < _MINIMO:
+            d = _MINIMO
+
+        c = 1 + aa / c
+        if abs(c) < _MINIMO:
+            c = _MINIMO
+
+        d = 1 / d
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1 + aa * d
+        if abs(d) < _MINIMO:
+            d = _MINIMO
+
+        c = 1 + aa / c
+        if abs(c) < _MINIMO:
+            c = _MINIMO
+
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _EPSILON:
+            break
+
+    return h
+
+
+def _beta_regularizada(a: float, b: float, x: float, y: float) -> float:
+    """
+    Función beta incompleta regularizada Iₓ(a, b).
+
+    :param y: Complemento 1 - x calculado por quien llama sin
+    cancelación.
+    """
+    if x <= 0:
+        return 0.0
+
+    if y <= 0:
+        return 1.0
+
+    logaritmo = (
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        + a * math.log(x) + b * math.log(y)
+    )
+    prefactor = math.exp(logaritmo)
+    if x < (a + 1) / (a + b + 2):
+        return prefactor * _fraccion_continua_beta(a, b, x) / a
+
+    return 1 - prefactor * _fraccion_continua_beta(b, a, y) / b
+
+
+def _gamma_regularizadas(a: float, x: float) -> tuple[float, float]:
+    """
+    Funciones gamma incompletas regularizadas inferior P(a, x) y
+    superior Q(a, x).
+    """
+    if x <= 0:
+        return 0.0, 1.0
+
+    prefactor = math.exp(-x + a * math.log(x) - math.lgamma(a))
+    if x < a + 1:
+        ap = a
+        termino = 1 / a
+        suma = termino
+        for _ in range(_MAX_ITERACIONES):
+            ap += 1
+            termino *= x / ap
+            suma += termino
+            if abs(termino) < abs(suma) * _EPSILON:
+                break
+
+        inferior = suma * prefactor
+        return inferior, 1 - inferior
+
+    b = x + 1 - a
+    c = 1 / _MINIMO
+    d = 1 / b
+    h = d
+    for i in range(1, _MAX_ITERACIONES):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        if abs(d) < _MINIMO:
+            d = _MINIMO
+
+        c = b + an / c
+        if abs(c) < _MINIMO:
+            c = _MINIMO
+
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _EPSILON:
+            break
+
+    superior = prefactor * h
+    return 1 - superior, superior
+
+
+def _resolver(funcion, derivada, objetivo: float, inicial: float, creciente: bool) -> float:
+    """
+    Resuelve ``funcion(x) = objetivo`` en [0, ∞) con el método de
+    Newton. El intervalo que encierra la raíz se va acotando y, si un
+    paso de Newton sale de él, se usa bisección (geométrica cuando el
+    intervalo abarca varios órdenes de magnitud).
+
+    :param creciente: Si ``funcion`` es creciente o decreciente.
+    :return: Raíz aproximada.
+    :rtype: float
+    """
+    inferior = 0.0
+    superior = math.inf
+    x = max(inicial, _MINIMO)
+    for _ in range(_MAX_ITERACIONES_NEWTON):
+        diferencia = funcion(x) - objetivo
+        if diferencia == 0:
+            return x
+
+        if (diferencia > 0) == creciente:
+            superior = x
+        else:
+            inferior = x
+
+        pendiente = derivada(x)
+        siguiente = x - diferencia / pendiente if pendiente != 0 else math.nan
+        if not (inferior < siguiente < superior):
+            if math.isinf(superior):
+                siguiente = 2 * x + 1
+            elif inferior > 0 and superior / inferior > 4:
+                siguiente = math.sqrt(inferior * superior)
+            else:
+                siguiente = (inferior + superior) / 2
+
+        if abs(siguiente - x) <= _TOLERANCIA_NEWTON * abs(siguiente):
+            return siguiente
+
+        x = siguiente
+
+    return x
+
+
+def _validar_probabilidad(probabilidad: float) -> None:
+    if not 0 < probabilidad < 1:
+        raise ValueError("La probabilidad debe estar entre 0 y 1")
+
+
+def cuantil_normal(probabilidad: float) -> float:
+    """
+    Cuantil de la distribución normal estándar (Z).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    _validar_probabilidad(probabilidad)
+    return _NORMAL_ESTANDAR.inv_cdf(probabilidad)
+
+
+def cuantil_t(probabilidad: float, grados_libertad: float) -> float:
+    """
+    Cuantil de la distribución t (t de Student).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad: Grados de libertad (ν).
+    :type grados_libertad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    _validar_probabilidad(probabilidad)
+    nu = float(grados_libertad)
+    if probabilidad == 0.5:
+        return 0.0
+
+    cola = min(probabilidad, 1 - probabilidad)
+    signo = 1.0 if probabilidad > 0.5 else -1.0
+
+    # Soluciones cerradas para uno y dos grados de libertad
+    if nu == 1:
+        return signo / math.tan(math.pi * cola)
+
+    if nu == 2:
+        return signo * (1 - 2 * cola) / math.sqrt(2 * cola * (1 - cola))
+
+    log_constante = (
+        math.lgamma((nu + 1) / 2) - math.lgamma(nu / 2) - 0.5 * math.log(nu * math.pi)
+    )
+
+    def supervivencia(valor: float) -> float:
+        cuadrado = valor * valor
+        return 0.5 * _beta_regularizada(
+            nu / 2,
+            0.5,
+            nu / (nu + cuadrado),
+            cuadrado / (nu + cuadrado),
+        )
+
+    def densidad_negativa(valor: float) -> float:
+        return -math.exp(log_constante - (nu + 1) / 2 * math.log1p(valor * valor / nu))
+
+    # Aproximación inicial de Cornish-Fisher a partir de Z
+    z = -_NORMAL_ESTANDAR.inv_cdf(cola)
+    inicial = (
+        z
+        + (z ** 3 + z) / (4 * nu)
+        + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * nu ** 2)
+    )
+    valor = _resolver(supervivencia, densidad_negativa, cola, inicial, False)
+    return signo * valor
+
+
+def cuantil_chi2(probabilidad: float, grados_libertad: float) -> float:
+    """
+    Cuantil de la distribución Chi-cuadrada (χ²).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad: Grados de libertad.
+    :type grados_libertad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    _validar_probabilidad(probabilidad)
+    k = float(grados_libertad)
+    a = k / 2
+    log_constante = -a * math.log(2) - math.lgamma(a)
+    usar_inferior = probabilidad <= 0.5
+    objetivo = probabilidad if usar_inferior else 1 - probabilidad
+
+    def funcion(valor: float) -> float:
+        inferior, superior = _gamma_regularizadas(a, valor / 2)
+        return inferior if usar_inferior else superior
+
+    def derivada(valor: float) -> float:
+        densidad = math.exp(log_constante + (a - 1) * math.log(valor) - valor / 2)
+        return densidad if usar_inferior else -densidad
+
+    # Aproximación inicial de Wilson-Hilferty
+    z = _NORMAL_ESTANDAR.inv_cdf(probabilidad)
+    inicial = k * (1 - 2 / (9 * k) + z * math.sqrt(2 / (9 * k))) ** 3
+    if inicial <= 0:
+        inicial = (probabilidad * a * math.exp(math.lgamma(a) + a * math.log(2))) ** (1 / a)
+
+    return _resolver(funcion, derivada, objetivo, inicial, usar_inferior)
+
+
+def cuantil_f(probabilidad: float, grados_libertad_1: float, grados_libertad_2: float) -> float:
+    """
+    Cuantil de la distribución de Fisher (F).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad_1: Grados de libertad del numerador.
+    :type grados_libertad_1: float
+    :param grados_libertad_2: Grados de libertad del denominador.
+    :type grados_libertad_2: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    _validar_probabilidad(probabilidad)
+    d1 = float(grados_libertad_1)
+    d2 = float(grados_libertad_2)
+    log_constante = (
+        0.5 * (d1 * math.log(d1) + d2 * math.log(d2))
+        - (math.lgamma(d1 / 2) + math.lgamma(d2 / 2) - math.lgamma((d1 + d2) / 2))
+    )
+    usar_inferior = probabilidad <= 0.5
+    objetivo = probabilidad if usar_inferior else 1 - probabilidad
+
+    def funcion(valor: float) -> float:
+        denominador = d1 * valor + d2
+        x = d1 * valor / denominador
+        y = d2 / denominador
+        if usar_inferior:
+            return _beta_regularizada(d1 / 2, d2 / 2, x, y)
+
+        return _beta_regularizada(d2 / 2, d1 / 2, y, x)
+
+    def derivada(valor: float) -> float:
+        densidad = math.exp(
+            log_constante
+            + (d1 / 2 - 1) * math.log(valor)
+            - (d1 + d2) / 2 * math.log(d2 + d1 * valor)
+        )
+        return densidad if usar_inferior else -densidad
+
+    # Aproximación inicial a partir de la χ² del numerador
+    inicial = cuantil_chi2(probabilidad, d1) / d1
+    return _resolver(funcion, derivada, objetivo, inicial, usar_inferior)
@@ -0,0 +1,129 @@
+"""
+En este módulo se define el ejecutor de lotes de trabajos: reparte
+los trabajos (ver ``src.services.trabajos``) entre varios procesos en
+fragmentos de tamaño fijo y devuelve los resultados en el mismo orden
+en que se recibieron.
+
+Los errores de cada trabajo se guardan en su resultado (clave
+``error``) en lugar de imprimirse, así que un trabajo inválido no
+detiene el lote. Los trabajos se consumen por ventanas, de modo que
+un lote leído de un archivo no se tiene que cargar completo.
+"""
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import NamedTuple
+
+from .trabajos import ejecutar_trabajo_seguro
+
+__all__ = [
+    "ReporteLote",
+    "TAMANO_FRAGMENTO",
+    "ejecutar_lote",
+    "mapear_trabajos",
+]
+
+TAMANO_FRAGMENTO = 64
+
+# Fragmentos por proceso que se envían a la vez; mantiene ocupados a
+# los procesos sin leer todo el lote por adelantado
+_FRAGMENTOS_POR_VENTANA = 4
+
+class ReporteLote(NamedTuple):
+    """Resumen del rendimiento de un lote."""
+    trabajos: int
+    errores: int
+    segundos: float
+    procesos: int
+    tamano_fragmento: int
+
+    @property
+    def trabajos_por_segundo(self) -> float:
+        """Trabajos terminados por segundo."""
+        return self.trabajos / self.segundos if self.segundos > 0 else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f">> {self.trabajos} trabajos en {self.segundos:.3f} s "
+            f"({self.trabajos_por_segundo:.1f} trabajos/s, {self.procesos} procesos, "
+            f"fragmentos de {self.tamano_fragmento}); {self.errores} con error"
+        )
+
+
+def _procesos(procesos: int | None) -> int:
+    if procesos is None:
+        return os.cpu_count() or 1
+
+    if procesos < 1:
+        raise ValueError("El número de procesos debe ser mayor o igual a 1")
+
+    return procesos
+
+
+def mapear_trabajos(
+        trabajos: Iterable,
+        procesos: int | None = None,
+        tamano_fragmento: int = TAMANO_FRAGMENTO,
+    ) -> Iterator[dict]:
+    """
+    Ejecuta los trabajos en paralelo y entrega sus resultados en el
+    orden de entrada conforme terminan.
+
+    :param trabajos: Trabajos a ejecutar; también se aceptan
+    excepciones (trabajos que no se pudieron leer).
+    :type trabajos: Iterable[dict | Exception]
+    :param procesos: Número de procesos; por defecto uno por núcleo.
+    Con un solo proceso los trabajos se ejecutan en el proceso actual.
+    :type procesos: int | None
+    :param tamano_fragmento: Trabajos que se envían juntos a un
+    proceso.
+    :type tamano_fragmento: int
+    :return: Iterador de resultados.
+    :rtype: Iterator[dict]
+    """
+    procesos = _procesos(procesos)
+    if tamano_fragmento < 1:
+        raise ValueError("El tamaño del fragmento debe ser mayor o igual a 1")
+
+    if procesos == 1:
+        yield from map(ejecutar_trabajo_seguro, trabajos)
+        return
+
+    iterador = iter(trabajos)
+    tamano_ventana = procesos * tamano_fragmento * _FRAGMENTOS_POR_VENTANA
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        while ventana := list(islice(iterador, tamano_ventana)):
+            yield from ejecutor.map(
+                ejecutar_trabajo_seguro,
+                ventana,
+                chunksize=tamano_fragmento,
+            )
+
+
+def ejecutar_lote(
+        trabajos: Iterable,
+        procesos: int | None = None,
+        tamano_fragmento: int = TAMANO_FRAGMENTO,
+    ) -> tuple[list[dict], ReporteLote]:
+    """
+    Ejecuta un lote de trabajos en paralelo y mide su rendimiento.
+
+    :param trabajos: Trabajos a ejecutar.
+    :type trabajos: Iterable[dict | Exception]
+    :param procesos: Número de procesos; por defecto uno por núcleo.
+    :type procesos: int | None
+    :param tamano_fragmento: Trabajos que se envían juntos a un
+    proceso.
+    :type tamano_fragmento: int
+    :return: Resultados en el orden de entrada y el reporte del lote.
+    :rtype: tuple[list[dict], ReporteLote]
+    """
+    procesos = _procesos(procesos)
+    inicio = time.perf_counter()
+    resultados = list(mapear_trabajos(trabajos, procesos, tamano_fragmento))
+    segundos = time.perf_counter() - inicio
+    errores = sum("error" in resultado for resultado in resultados)
+    reporte = ReporteLote(len(resultados), errores, segundos, procesos, tamano_fragmento)
+    return resultados, reporte
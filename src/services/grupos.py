@@ -0,0 +1,183 @@
+"""
+En este módulo se definen los intervalos de confianza por grupo: a
+partir de un arreglo de claves y uno de valores (una observación por
+elemento) se calcula el intervalo de cada grupo sin separar las
+muestras ni llamar una vez por grupo a ``intervalo_caso_*``.
+
+Las claves se factorizan a índices 0..g-1 (con ``np.bincount``
+directamente si son enteros pequeños no negativos, o con
+``np.unique`` si no), los conteos, medias y varianzas de todos los
+grupos se acumulan con ``np.bincount`` ponderado y los intervalos
+salen de las funciones por lotes. La varianza se acumula en una
+segunda pasada sobre las desviaciones respecto a la media de cada
+grupo, que no pierde precisión como la fórmula de Σx².
+"""
+import numpy as np
+
+from src.errores import ERR_NUMERO_OBSERVACIONES
+
+from .lotes import intervalo_caso_1_lote, intervalo_caso_2_lote, intervalo_caso_7_lote
+
+__all__ = [
+    "factorizar_claves",
+    "intervalos_media_por_grupo",
+    "intervalos_proporcion_por_grupo",
+    "momentos_por_grupo",
+]
+
+# Las claves enteras no negativas menores que este límite (o que el
+# número de observaciones, si es mayor) se usan directamente como
+# índices de ``np.bincount`` sin ordenar
+_LIMITE_CLAVES_DIRECTAS = 1 << 20
+
+def _arreglos_pareados(claves, valores) -> tuple[np.ndarray, np.ndarray]:
+    claves = np.asarray(claves).reshape(-1)
+    valores = np.asarray(valores, dtype=np.float64).reshape(-1)
+    if claves.shape[0] != valores.shape[0]:
+        raise ValueError(ERR_NUMERO_OBSERVACIONES)
+
+    return claves, valores
+
+
+def factorizar_claves(claves) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Asigna a cada clave distinta un índice de grupo consecutivo.
+
+    :param claves: Clave del grupo de cada observación.
+    :type claves: ArrayLike
+    :return: Claves distintas (ordenadas) e índice de grupo de cada
+    observación.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    claves = np.asarray(claves).reshape(-1)
+    if claves.dtype.kind in "iub" and claves.shape[0]:
+        minimo = int(claves.min())
+        maximo = int(claves.max())
+        if minimo >= 0 and maximo < max(_LIMITE_CLAVES_DIRECTAS, claves.shape[0]):
+            # Tabla densa de claves presentes: sin ordenar, O(n + max).
+            # Las claves booleanas se pasan a enteros para que indexen
+            # por posición y no como máscara
+            posiciones = claves.astype(np.intp, copy=False)
+            presentes = np.bincount(posiciones, minlength=maximo + 1) > 0
+            claves_unicas = np.flatnonzero(presentes).astype(claves.dtype, copy=False)
+            indices = np.cumsum(presentes) - 1
+            return claves_unicas, indices[posiciones]
+
+    return np.unique(claves, return_inverse=True)
+
+
+def momentos_por_grupo(claves, valores) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calcula el tamaño, la media y la varianza muestral de cada grupo.
+
+    :param claves: Clave del grupo de cada observación.
+    :type claves: ArrayLike
+    :param valores: Observaciones.
+    :type valores: ArrayLike
+    :return: Claves distintas, tamaños (n), medias (X̄) y varianzas
+    muestrales (𝑠², ``nan`` en los grupos de una observación), sin
+    redondear.
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+    """
+    claves, valores = _arreglos_pareados(claves, valores)
+    claves_unicas, indices = factorizar_claves(claves)
+    grupos = claves_unicas.shape[0]
+
+    conteos = np.bincount(indices, minlength=grupos)
+    medias = np.bincount(indices, weights=valores, minlength=grupos) / conteos
+    desviaciones = valores - medias[indices]
+    m2 = np.bincount(indices, weights=desviaciones * desviaciones, minlength=grupos)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        varianzas = np.where(conteos > 1, m2 / (conteos - 1), np.nan)
+
+    return claves_unicas, conteos, medias, varianzas
+
+
+def intervalos_media_por_grupo(
+        claves,
+        valores,
+        porcentaje_confianza: int = 95,
+        desv_estandar_poblacional: float | None = None,
+    ) -> tuple[np.ndarray, ...]:
+    """
+    Intervalo para la media poblacional (μ) de cada grupo: caso 1 si
+    se conoce σ y caso 2 si no.
+
+    :param claves: Clave del grupo de cada observación.
+    :type claves: ArrayLike
+    :param valores: Observaciones.
+    :type valores: ArrayLike
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :param desv_estandar_poblacional: Desviación estándar
+    poblacional (σ), si se conoce.
+    :type desv_estandar_poblacional: float | None
+    :return: Claves distintas y tamaños de los grupos seguidos de los
+    mismos arreglos que ``intervalo_caso_1_lote`` o
+    ``intervalo_caso_2_lote``. En el caso 2 los grupos de una sola
+    observación quedan en ``nan``.
+    :rtype: tuple[np.ndarray, ...]
+    """
+    claves_unicas, conteos, medias, varianzas = momentos_por_grupo(claves, valores)
+    medias = np.round(medias, 4)
+    if desv_estandar_poblacional is not None:
+        return (
+            claves_unicas,
+            conteos,
+            *intervalo_caso_1_lote(conteos, medias, porcentaje_confianza, desv_estandar_poblacional),
+        )
+
+    # Con n = 1 no hay grados de libertad para t; esos grupos se
+    # excluyen del cálculo y se dejan en nan
+    validos = conteos > 1
+    resultados = intervalo_caso_2_lote(
+        conteos[validos],
+        medias[validos],
+        np.round(varianzas[validos], 4),
+        porcentaje_confianza,
+    )
+    completos = []
+    for resultado in resultados:
+        arreglo = np.full(conteos.shape[0], np.nan)
+        arreglo[validos] = resultado
+        completos.append(arreglo)
+
+    completos[2][~validos] = medias[~validos]
+    return claves_unicas, conteos, *completos
+
+
+def intervalos_proporcion_por_grupo(
+        claves,
+        exitos,
+        porcentaje_confianza: int = 95,
+    ) -> tuple[np.ndarray, ...]:
+    """
+    Intervalo para la proporción poblacional (𝑃) de cada grupo
+    (caso 7).
+
+    :param claves: Clave del grupo de cada observación.
+    :type claves: ArrayLike
+    :param exitos: Si cada observación es un éxito (booleano o 0/1).
+    :type exitos: ArrayLike
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :return: Claves distintas, tamaños (n) y números de éxitos (X)
+    de los grupos seguidos de los mismos arreglos que
+    ``intervalo_caso_7_lote``. Como en el caso escalar, no se
+    comprueba la aproximación normal (np ≥ 5 y n(1-p) ≥ 5).
+    :rtype: tuple[np.ndarray, ...]
+    """
+    claves, exitos = _arreglos_pareados(claves, exitos)
+    claves_unicas, indices = factorizar_claves(claves)
+    grupos = claves_unicas.shape[0]
+
+    conteos = np.bincount(indices, minlength=grupos)
+    numeros_exitos = np.bincount(indices, weights=exitos != 0, minlength=grupos).astype(np.int64)
+    return (
+        claves_unicas,
+        conteos,
+        numeros_exitos,
+        *intervalo_caso_7_lote(numeros_exitos, conteos, porcentaje_confianza),
+    )
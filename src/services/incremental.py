@@ -0,0 +1,165 @@
+"""
+En este módulo se define el estimador incremental para los casos de
+una media (casos 1 y 2) y de una varianza (caso 9), pensado para
+muestras a las que se agregan o quitan pocas observaciones a la vez.
+
+El estimador solo guarda n, X̄ y M2, que se actualizan en O(1) por
+observación (Welford y su inverso), y los intervalos se calculan a
+partir de esos momentos con las mismas funciones de ``calculos``; así
+cada actualización no recorre la muestra completa y el resultado
+coincide con recalcularla, salvo el error de redondeo acumulado.
+Quitar observaciones acumula más error que agregarlas, por lo que en
+series muy largas conviene reiniciar el estimador de vez en cuando
+con ``reiniciar``.
+"""
+import numpy as np
+
+from src.errores import ERR_OBSERVACIONES_INSUFICIENTES, ERR_TAMANO_MUESTRA
+
+from . import calculos
+from .momentos import AcumuladorMomentos
+from .resultados import ResultadoCaso1, ResultadoCaso2, ResultadoCaso9
+
+__all__ = [
+    "EstimadorIncremental",
+]
+
+class EstimadorIncremental:
+    """
+    Intervalos de confianza para una media o una varianza que se
+    actualizan al agregar o quitar observaciones.
+    """
+    __slots__ = ("_momentos",)
+
+    def __init__(self, datos=None) -> None:
+        """
+        :param datos: Observaciones iniciales (opcional).
+        :type datos: ArrayLike | None
+        """
+        self._momentos = AcumuladorMomentos()
+        if datos is not None:
+            self.agregar_varios(datos)
+
+    @property
+    def tamano_muestra(self) -> int:
+        """Número de observaciones actuales (n)."""
+        return self._momentos.conteo
+
+    @property
+    def momentos(self) -> AcumuladorMomentos:
+        """Copia de los momentos actuales."""
+        return self._momentos.copiar()
+
+    def agregar(self, valor: float) -> None:
+        """
+        Agrega una observación en O(1).
+
+        :param valor: Observación a agregar.
+        :type valor: float
+        """
+        self._momentos.agregar(float(valor))
+
+    def quitar(self, valor: float) -> None:
+        """
+        Quita una observación que se había agregado en O(1).
+
+        :param valor: Observación a quitar.
+        :type valor: float
+        """
+        self._momentos.quitar(float(valor))
+
+    def agregar_varios(self, valores) -> None:
+        """
+        Agrega varias observaciones en O(k).
+
+        :param valores: Observaciones a agregar.
+        :type valores: ArrayLike
+        """
+        self._momentos.agregar_bloque(np.asarray(valores, dtype=np.float64).reshape(-1))
+
+    def quitar_varios(self, valores) -> None:
+        """
+        Quita varias observaciones que se habían agregado en O(k).
+
+        :param valores: Observaciones a quitar.
+        :type valores: ArrayLike
+        """
+        self._momentos.descontar(AcumuladorMomentos.desde_arreglo(valores))
+
+    def reiniciar(self, datos=None) -> None:
+        """
+        Descarta los momentos actuales y, si se dan, los recalcula a
+        partir de las observaciones.
+
+        :param datos: Observaciones actuales de la muestra.
+        :type datos: ArrayLike | None
+        """
+        self._momentos = AcumuladorMomentos()
+        if datos is not None:
+            self.agregar_varios(datos)
+
+    def _validar(self, minimo: int) -> None:
+        if self._momentos.conteo < 1:
+            raise ValueError(ERR_TAMANO_MUESTRA)
+
+        if self._momentos.conteo < minimo:
+            raise ValueError(ERR_OBSERVACIONES_INSUFICIENTES)
+
+    def intervalo_media(
+            self,
+            porcentaje_confianza: int,
+            desv_estandar_poblacional: float | None = None,
+        ) -> ResultadoCaso1 | ResultadoCaso2:
+        """
+        Intervalo para la media poblacional (μ) con las observaciones
+        actuales: caso 1 si se conoce σ y caso 2 si no.
+
+        :param porcentaje_confianza: Porcentaje de confianza para un
+        intervalo de confianza.
+        :type porcentaje_confianza: int
+        :param desv_estandar_poblacional: Desviación estándar
+        poblacional (σ), si se conoce.
+        :type desv_estandar_poblacional: float | None
+        :return: El mismo resultado que ``intervalo_caso_1`` o
+        ``intervalo_caso_2``.
+        :rtype: ResultadoCaso1 | ResultadoCaso2
+        """
+        if desv_estandar_poblacional is not None:
+            self._validar(1)
+            return calculos.intervalo_caso_1(
+                self._momentos.conteo,
+                self._momentos,
+                porcentaje_confianza,
+                desv_estandar_poblacional,
+            )
+
+        self._validar(2)
+        return calculos.intervalo_caso_2(
+            self._momentos.conteo,
+            self._momentos,
+            porcentaje_confianza,
+        )
+
+    def intervalo_varianza(self, porcentaje_confianza: int) -> ResultadoCaso9:
+        """
+        Intervalo para la varianza poblacional (σ²) con las
+        observaciones actuales (caso 9).
+
+        :param porcentaje_confianza: Porcentaje de confianza para un
+        intervalo de confianza.
+        :type porcentaje_confianza: int
+        :return: El mismo resultado que ``intervalo_caso_9``.
+        :rtype: ResultadoCaso9
+        """
+        self._validar(2)
+        return calculos.intervalo_caso_9(
+            self._momentos.conteo,
+            self._momentos,
+            porcentaje_confianza,
+        )
+
+    def __len__(self) -> int:
+        return self._momentos.conteo
+
+    def __repr__(self) -> str:
+        return f"EstimadorIncremental(n={self._momentos.conteo})"
@@ -0,0 +1,320 @@
+"""
+En este módulo se define la lectura por bloques de muestras guardadas
+en archivos, para calcular intervalos con muestras demasiado grandes
+para escribirse en la consola.
+
+El archivo nunca se carga completo: cada bloque se convierte a un
+arreglo de ``float64`` y se reduce en un ``AcumuladorMomentos``, así
+que la memoria usada depende del tamaño del bloque y no del archivo.
+Los momentos resultantes se pueden pasar directamente a los casos de
+medias, varianzas y cociente de varianzas en lugar de la muestra.
+
+Formatos:
+
+- Texto (``.txt`` y cualquier otra extensión): observaciones
+  separadas por espacios o saltos de línea, igual que en la consola.
+- CSV (``.csv``) y TSV (``.tsv``): una observación por fila en cada
+  columna elegida; la primera fila se toma como encabezado si no es
+  numérica. Las celdas vacías (o que faltan al final de una fila) se
+  omiten, así que cada columna puede tener un largo distinto.
+- NumPy (``.npy``) y binario crudo de ``float64`` little-endian
+  (``.bin``, ``.f8``): se mapean en memoria y se recorren por bloques
+  sin copiarse; en un ``.npy`` de dos dimensiones cada columna es una
+  vista con saltos.
+"""
+import csv
+import os
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+from src.errores import ERR_FORMATO_OBSERVACIONES
+
+from .momentos import TAMANO_BLOQUE, AcumuladorMomentos
+
+__all__ = [
+    "TAMANO_BLOQUE_TEXTO",
+    "leer_bloques",
+    "leer_momentos",
+    "leer_momentos_columnas",
+]
+
+TAMANO_BLOQUE_TEXTO = 1 << 20
+
+_DELIMITADORES = {
+    ".csv": ",",
+    ".tsv": "\t",
+}
+
+_BINARIOS = (".npy", ".bin", ".f8")
+
+def _a_flotantes(valores, origen: str) -> np.ndarray:
+    try:
+        arreglo = np.asarray(valores, dtype=np.float64)
+    except ValueError:
+        raise ValueError(f"{origen}: {ERR_FORMATO_OBSERVACIONES}") from None
+
+    # numpy acepta "nan" e "inf", que no son observaciones válidas
+    if not np.isfinite(arreglo).all():
+        raise ValueError(f"{origen}: {ERR_FORMATO_OBSERVACIONES}")
+
+    return arreglo
+
+
+def _bloques_texto(archivo, origen: str, tamano_bloque: int) -> Iterator[np.ndarray]:
+    resto = ""
+    while bloque := archivo.read(tamano_bloque):
+        valores = (resto + bloque).split()
+        # Si el bloque no termina en un separador la última observación
+        # puede estar cortada y se completa con el siguiente bloque
+        resto = valores.pop() if valores and not bloque[-1].isspace() else ""
+        if valores:
+            yield _a_flotantes(valores, origen)
+
+    if resto:
+        yield _a_flotantes([resto], origen)
+
+
+def _indices_columnas(
+        encabezados: list[str] | None,
+        columnas: Sequence[int | str],
+        origen: str,
+    ) -> list[int]:
+    indices = []
+    for columna in columnas:
+        if isinstance(columna, int):
+            indices.append(columna)
+        elif encabezados is not None and columna in encabezados:
+            indices.append(encabezados.index(columna))
+        else:
+            raise ValueError(f"{origen}: no existe la columna {columna!r}")
+
+    return indices
+
+
+def _celda(texto: str) -> float:
+    """Convierte una celda; las vacías son NaN (observación faltante)."""
+    texto = texto.strip()
+    if not texto:
+        return np.nan
+
+    # float() acepta guiones bajos, "nan" e "inf", que no son
+    # observaciones válidas
+    valor = float(texto) if "_" not in texto else np.nan
+    if not np.isfinite(valor):
+        raise ValueError(f"could not convert string {texto!r} to float64")
+
+    return valor
+
+
+def _filas_con_vacias(
+        lineas: list[str],
+        delimitador: str,
+        indices: list[int],
+    ) -> np.ndarray:
+    """
+    Convierte las columnas elegidas de un bloque en el que alguna
+    celda está vacía, con NaN en las celdas vacías.
+    """
+    bloque = np.full((len(lineas), len(indices)), np.nan)
+    for fila, campos in enumerate(csv.reader(lineas, delimiter=delimitador, quotechar='"')):
+        for posicion, indice in enumerate(indices):
+            if -len(campos) <= indice < len(campos):
+                bloque[fila, posicion] = _celda(campos[indice])
+
+    return bloque
+
+
+def _bloques_delimitados(
+        archivo,
+        origen: str,
+        delimitador: str,
+        columnas: Sequence[int | str],
+        tamano_bloque: int,
+    ) -> Iterator[np.ndarray]:
+    primera = archivo.readline()
+    campos = [campo.strip().strip('"') for campo in primera.rstrip("\r\n").split(delimitador)]
+    try:
+        # Una fila de datos puede tener celdas vacías
+        [float(campo) for campo in campos if campo]
+        encabezados = None
+        pendientes = [primera]
+    except ValueError:
+        encabezados = campos
+        pendientes = []
+
+    indices = _indices_columnas(encabezados, columnas, origen)
+    linea = 1 if encabezados is None else 2
+    while lineas := pendientes + list(islice(archivo, tamano_bloque)):
+        pendientes = []
+        try:
+            bloque = _a_flotantes(
+                np.loadtxt(
+                    lineas,
+                    dtype=np.float64,
+                    delimiter=delimitador,
+                    usecols=indices,
+                    ndmin=2,
+                    quotechar='"',
+                ),
+                origen,
+            )
+        except ValueError:
+            # loadtxt no acepta celdas vacías; solo entonces se
+            # convierte el bloque celda por celda
+            try:
+                bloque = _filas_con_vacias(lineas, delimitador, indices)
+            except ValueError as error:
+                raise ValueError(
+                    f"{origen} (a partir de la línea {linea}): {ERR_FORMATO_OBSERVACIONES}. {error}"
+                ) from None
+
+        linea += len(lineas)
+        yield bloque
+
+
+def _momentos_mapeados(
+        ruta: Path,
+        columnas: Sequence[int | str],
+        tamano_bloque: int,
+    ) -> tuple[AcumuladorMomentos, ...]:
+    if ruta.suffix.lower() == ".npy":
+        arreglo = np.load(ruta, mmap_mode="r")
+    else:
+        arreglo = np.memmap(ruta, dtype="<f8", mode="r")
+
+    if arreglo.ndim == 1:
+        arreglo = arreglo.reshape(-1, 1)
+
+    acumuladores = []
+    for columna in columnas:
+        if not isinstance(columna, int) or not -arreglo.shape[1] <= columna < arreglo.shape[1]:
+            raise ValueError(f"{ruta}: no existe la columna {columna!r}")
+
+        acumulador = AcumuladorMomentos()
+        vista = arreglo[:, columna]
+        for inicio in range(0, vista.shape[0], tamano_bloque):
+            bloque = vista[inicio:inicio + tamano_bloque]
+            acumulador.agregar_bloque(_a_flotantes(bloque, str(ruta)))
+
+        acumuladores.append(acumulador)
+
+    return tuple(acumuladores)
+
+
+def leer_bloques(
+        ruta: str | os.PathLike,
+        columnas: Sequence[int | str] = (0,),
+        delimitador: str | None = None,
+        tamano_bloque: int | None = None,
+    ) -> Iterator[np.ndarray]:
+    """
+    Lee las observaciones de un archivo en bloques de tamaño fijo.
+
+    :param ruta: Ruta del archivo.
+    :type ruta: str | os.PathLike
+    :param columnas: Índices o encabezados de las columnas a leer
+    (solo en archivos delimitados).
+    :type columnas: Sequence[int | str]
+    :param delimitador: Separador de columnas; por defecto se deduce
+    de la extensión y ``None`` indica texto separado por espacios.
+    :type delimitador: str | None
+    :param tamano_bloque: Filas por bloque en archivos delimitados o
+    caracteres por bloque en archivos de texto.
+    :type tamano_bloque: int | None
+    :return: Iterador de arreglos; en archivos de texto son de una
+    dimensión y en delimitados tienen una columna por cada una de
+    ``columnas``, con NaN en las celdas vacías.
+    :rtype: Iterator[np.ndarray]
+    :raises ValueError: Si alguna observación no es un número finito
+    o si se pide una columna distinta de 0 en un archivo de texto.
+    """
+    ruta = Path(ruta)
+    if delimitador is None:
+        delimitador = _DELIMITADORES.get(ruta.suffix.lower())
+
+    if delimitador is None:
+        for columna in columnas:
+            if columna != 0:
+                raise ValueError(
+                    f"{ruta}: no existe la columna {columna!r} "
+                    "(los archivos de texto tienen una sola muestra)"
+                )
+
+    with ruta.open(encoding="utf-8", newline="" if delimitador else None) as archivo:
+        if delimitador is None:
+            yield from _bloques_texto(archivo, str(ruta), tamano_bloque or TAMANO_BLOQUE_TEXTO)
+        else:
+            yield from _bloques_delimitados(
+                archivo,
+                str(ruta),
+                delimitador,
+                columnas,
+                tamano_bloque or TAMANO_BLOQUE,
+            )
+
+
+def leer_momentos_columnas(
+        ruta: str | os.PathLike,
+        columnas: Sequence[int | str],
+        delimitador: str | None = None,
+        tamano_bloque: int | None = None,
+    ) -> tuple[AcumuladorMomentos, ...]:
+    """
+    Calcula los momentos de varias columnas de un archivo, por
+    ejemplo las dos muestras de un cociente de varianzas. Los archivos
+    delimitados se recorren en una sola pasada.
+
+    :param ruta: Ruta del archivo.
+    :type ruta: str | os.PathLike
+    :param columnas: Índices o encabezados de las columnas.
+    :type columnas: Sequence[int | str]
+    :param delimitador: Separador de columnas.
+    :type delimitador: str | None
+    :param tamano_bloque: Filas por bloque.
+    :type tamano_bloque: int | None
+    :return: Un acumulador por columna.
+    :rtype: tuple[AcumuladorMomentos, ...]
+    """
+    ruta = Path(ruta)
+    if ruta.suffix.lower() in _BINARIOS:
+        return _momentos_mapeados(ruta, columnas, tamano_bloque or TAMANO_BLOQUE)
+
+    acumuladores = tuple(AcumuladorMomentos() for _ in columnas)
+    for bloque in leer_bloques(ruta, columnas, delimitador, tamano_bloque):
+        for indice, acumulador in enumerate(acumuladores):
+            # Un archivo de texto tiene una sola muestra (la columna 0)
+            valores = bloque if bloque.ndim == 1 else bloque[:, indice]
+            faltantes = np.isnan(valores)
+            if faltantes.any():
+                valores = valores[~faltantes]
+
+            acumulador.agregar_bloque(valores)
+
+    return acumuladores
+
+
+def leer_momentos(
+        ruta: str | os.PathLike,
+        columna: int | str = 0,
+        delimitador: str | None = None,
+        tamano_bloque: int | None = None,
+    ) -> AcumuladorMomentos:
+    """
+    Calcula los momentos de la muestra guardada en un archivo.
+
+    :param ruta: Ruta del archivo.
+    :type ruta: str | os.PathLike
+    :param columna: Índice o encabezado de la columna (solo en
+    archivos delimitados).
+    :type columna: int | str
+    :param delimitador: Separador de columnas.
+    :type delimitador: str | None
+    :param tamano_bloque: Filas o caracteres por bloque.
+    :type tamano_bloque: int | None
+    :return: Acumulador con n, X̄ y M2 de la muestra.
+    :rtype: AcumuladorMomentos
+    """
+    return leer_momentos_columnas(ruta, (columna,), delimitador, tamano_bloque)[0]
@@ -0,0 +1,845 @@
+"""
+En este módulo se definen las contrapartes por lotes de las funciones
+``intervalo_caso_*`` del módulo de cálculos.
+
+Cada función recibe arreglos de NumPy (o escalares, que se difunden
+con las reglas de *broadcasting*) con los tamaños de muestra, los
+momentos muestrales ya calculados y los porcentajes de confianza, y
+devuelve arreglos con los límites del intervalo y el estimador
+puntual en una sola llamada vectorizada. Los redondeos intermedios
+son los mismos que usa el cálculo escalar para que ambos caminos
+den el mismo resultado.
+
+Los resultados son los mismos registros de ``resultados`` que
+devuelve el cálculo escalar, con un arreglo en cada campo.
+"""
+import numpy as np
+
+from .resultados import (
+    ResultadoCaso1,
+    ResultadoCaso2,
+    ResultadoCaso3,
+    ResultadoCaso4,
+    ResultadoCaso5,
+    ResultadoCaso6,
+    ResultadoCaso7,
+    ResultadoCaso8,
+    ResultadoCaso9,
+    ResultadoCaso10,
+    ResultadoClopperPearson,
+)
+from .valores_criticos import cuantiles
+
+__all__ = [
+    "intervalo_caso_1_lote",
+    "intervalo_caso_2_lote",
+    "intervalo_caso_3_lote",
+    "intervalo_caso_4_lote",
+    "intervalo_caso_5_lote",
+    "intervalo_caso_6_lote",
+    "intervalo_caso_7_lote",
+    "intervalo_caso_8_lote",
+    "intervalo_caso_9_lote",
+    "intervalo_caso_10_lote",
+    "intervalo_agresti_coull_lote",
+    "intervalo_clopper_pearson_lote",
+    "intervalo_newcombe_lote",
+    "intervalo_wilson_lote",
+]
+
+def _como_arreglos(*valores) -> list[np.ndarray]:
+    """
+    Convierte los valores a arreglos ``float64`` con una forma común.
+
+    :return: Arreglos difundidos a la misma forma.
+    :rtype: list[np.ndarray]
+    """
+    arreglos = [np.asarray(valor, dtype=np.float64) for valor in valores]
+    return np.broadcast_arrays(*arreglos)
+
+
+def _calcular_grados_libertad_efectivos(
+        varianzas_muestrales_1: np.ndarray,
+        varianzas_muestrales_2: np.ndarray,
+        tamanos_muestra_1: np.ndarray,
+        tamanos_muestra_2: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Calcula los grados de libertad efectivos (ν) para cada elemento.
+
+    :return: Grados de libertad efectivos (ν) redondeados a
+    cuatro decimales.
+    :rtype: np.ndarray
+    """
+    cociente_1 = varianzas_muestrales_1 / tamanos_muestra_1
+    cociente_2 = varianzas_muestrales_2 / tamanos_muestra_2
+    numerador = (cociente_1 + cociente_2) ** 2
+    denominador = (
+        (cociente_1 ** 2) / (tamanos_muestra_1 + 1)
+        + (cociente_2 ** 2) / (tamanos_muestra_2 + 1)
+    )
+    return np.round((numerador / denominador) - 2, 4)
+
+
+def _calcular_desviacion_estandar_combinada(
+        varianzas_muestrales_1: np.ndarray,
+        varianzas_muestrales_2: np.ndarray,
+        tamanos_muestra_1: np.ndarray,
+        tamanos_muestra_2: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Calcula la desviación estándar combinada (Sp) para cada elemento.
+
+    :return: Desviación estándar combinada (Sp) redondeada a
+    cuatro decimales.
+    :rtype: np.ndarray
+    """
+    numerador = (
+        (tamanos_muestra_1 - 1) * varianzas_muestrales_1
+        + (tamanos_muestra_2 - 1) * varianzas_muestrales_2
+    )
+    denominador = tamanos_muestra_1 + tamanos_muestra_2 - 2
+    return np.round(np.sqrt(numerador / denominador), 4)
+
+
+def _calcular_valor_critico_normal_estandar(porcentajes_confianza: np.ndarray) -> np.ndarray:
+    """
+    Calcula el valor crítico de la distribución normal estándar (Z).
+
+    :return: Valores críticos redondeados a cuatro decimales.
+    :rtype: np.ndarray
+    """
+    alpha = 1 - (porcentajes_confianza / 100)
+    return np.round(cuantiles("normal", 1 - np.round(alpha / 2, 4)), 4)
+
+
+def _calcular_valor_critico_t_student(
+        porcentajes_confianza: np.ndarray,
+        grados_libertad: np.ndarray,
+    ) -> np.ndarray:
+    """
+    Calcula el valor crítico de la distribución t (t de Student).
+
+    :return: Valores críticos redondeados a cuatro decimales.
+    :rtype: np.ndarray
+    """
+    alpha = 1 - (porcentajes_confianza / 100)
+    return np.round(cuantiles("t", 1 - np.round(alpha / 2, 4), grados_libertad), 4)
+
+
+def _calcular_valor_critico_f(
+        tamanos_muestra_1: np.ndarray,
+        tamanos_muestra_2: np.ndarray,
+        porcentajes_confianza: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula el valor crítico de la distribución de Fisher (F).
+
+    :return: Valores críticos superiores e inferiores redondeados a
+    cuatro decimales.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    alpha = 1 - (porcentajes_confianza / 100)
+    grados_libertad_1 = tamanos_muestra_1 - 1
+    grados_libertad_2 = tamanos_muestra_2 - 1
+    f_superior = cuantiles("f", 1 - (alpha / 2), grados_libertad_1, grados_libertad_2)
+    f_inferior = cuantiles("f", alpha / 2, grados_libertad_1, grados_libertad_2)
+    return np.round(f_superior, 4), np.round(f_inferior, 4)
+
+
+def _calcular_valor_critico_chi_cuadrada(
+        tamanos_muestra: np.ndarray,
+        porcentajes_confianza: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula el valor crítico de la distribución Chi-cuadrada (χ²).
+
+    :return: Valores críticos superiores e inferiores redondeados a
+    cuatro decimales.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    alpha = 1 - (porcentajes_confianza / 100)
+    grados_libertad = tamanos_muestra - 1
+    chi2_superior = cuantiles("chi2", 1 - (alpha / 2), grados_libertad)
+    chi2_inferior = cuantiles("chi2", alpha / 2, grados_libertad)
+    return np.round(chi2_superior, 4), np.round(chi2_inferior, 4)
+
+
+def _limites_wilson(
+        exitos: np.ndarray,
+        n: np.ndarray,
+        valor_critico_Z: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula los límites de los intervalos de Wilson con las
+    proporciones exactas X / n.
+
+    :return: Límites inferiores y superiores de los intervalos.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    proporcion = exitos / n
+    cuadrado_Z = valor_critico_Z ** 2
+    denominador = 1 + cuadrado_Z / n
+    centro = (proporcion + cuadrado_Z / (2 * n)) / denominador
+    margen = (valor_critico_Z / denominador) * np.sqrt(
+        proporcion * (1 - proporcion) / n + cuadrado_Z / (4 * n ** 2)
+    )
+    return np.maximum(centro - margen, 0.0), np.minimum(centro + margen, 1.0)
+
+
+def intervalo_caso_1_lote(
+        tamanos_muestra,
+        medias_muestrales,
+        porcentajes_confianza,
+        desv_estandar_poblacionales,
+    ) -> ResultadoCaso1:
+    """
+    Versión por lotes de ``intervalo_caso_1`` (μ con varianza
+    conocida).
+
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param medias_muestrales: Medias muestrales (X̄).
+    :type medias_muestrales: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :param desv_estandar_poblacionales: Desviaciones estándar
+    poblacionales (σ).
+    :type desv_estandar_poblacionales: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos y las
+    medias muestrales (X̄).
+    :rtype: ResultadoCaso1
+    """
+    n, media, confianza, sigma = _como_arreglos(
+        tamanos_muestra,
+        medias_muestrales,
+        porcentajes_confianza,
+        desv_estandar_poblacionales,
+    )
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+
+    multiplicacion = valor_critico_Z * (sigma / np.sqrt(n))
+    return ResultadoCaso1(media - multiplicacion, media + multiplicacion, media)
+
+
+def intervalo_caso_2_lote(
+        tamanos_muestra,
+        medias_muestrales,
+        varianzas_muestrales,
+        porcentajes_confianza,
+    ) -> ResultadoCaso2:
+    """
+    Versión por lotes de ``intervalo_caso_2`` (μ con varianza
+    desconocida).
+
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param medias_muestrales: Medias muestrales (X̄).
+    :type medias_muestrales: ArrayLike
+    :param varianzas_muestrales: Varianzas muestrales (𝑠²).
+    :type varianzas_muestrales: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    medias muestrales (X̄) y las desviaciones estándar
+    muestrales (𝑠).
+    :rtype: ResultadoCaso2
+    """
+    n, media, varianza, confianza = _como_arreglos(
+        tamanos_muestra,
+        medias_muestrales,
+        varianzas_muestrales,
+        porcentajes_confianza,
+    )
+    valor_critico_t = _calcular_valor_critico_t_student(confianza, n - 1)
+    desv_estandar_muestral = np.sqrt(varianza)
+
+    multiplicacion = valor_critico_t * (desv_estandar_muestral / np.sqrt(n))
+    return ResultadoCaso2(
+        media - multiplicacion,
+        media + multiplicacion,
+        media,
+        desv_estandar_muestral,
+    )
+
+
+def intervalo_caso_3_lote(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        desv_estandar_poblacionales_1,
+        desv_estandar_poblacionales_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso3:
+    """
+    Versión por lotes de ``intervalo_caso_3`` (μ₁ - μ₂ con varianzas
+    conocidas).
+
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param desv_estandar_poblacionales_1: Desviaciones estándar
+    poblacionales de las primeras muestras (σ₁).
+    :type desv_estandar_poblacionales_1: ArrayLike
+    :param desv_estandar_poblacionales_2: Desviaciones estándar
+    poblacionales de las segundas muestras (σ₂).
+    :type desv_estandar_poblacionales_2: ArrayLike
+    :param medias_muestrales_1: Medias de las primeras muestras (X̄₁).
+    :type medias_muestrales_1: ArrayLike
+    :param medias_muestrales_2: Medias de las segundas muestras (X̄₂).
+    :type medias_muestrales_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos y las
+    diferencias de medias muestrales (X̄₁ - X̄₂).
+    :rtype: ResultadoCaso3
+    """
+    n1, n2, sigma1, sigma2, media1, media2, confianza = _como_arreglos(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        desv_estandar_poblacionales_1,
+        desv_estandar_poblacionales_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        porcentajes_confianza,
+    )
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    raiz = np.sqrt((sigma1 ** 2) / n1 + (sigma2 ** 2) / n2)
+
+    diferencia = media1 - media2
+    return ResultadoCaso3(
+        diferencia - valor_critico_Z * raiz,
+        diferencia + valor_critico_Z * raiz,
+        diferencia,
+    )
+
+
+def intervalo_caso_4_lote(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso4:
+    """
+    Versión por lotes de ``intervalo_caso_4`` (μ₁ - μ₂, muestras
+    grandes con varianzas diferentes y desconocidas).
+
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param medias_muestrales_1: Medias de las primeras muestras (X̄₁).
+    :type medias_muestrales_1: ArrayLike
+    :param medias_muestrales_2: Medias de las segundas muestras (X̄₂).
+    :type medias_muestrales_2: ArrayLike
+    :param varianzas_muestrales_1: Varianzas de las primeras
+    muestras (𝑠₁²).
+    :type varianzas_muestrales_1: ArrayLike
+    :param varianzas_muestrales_2: Varianzas de las segundas
+    muestras (𝑠₂²).
+    :type varianzas_muestrales_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    diferencias de medias muestrales (X̄₁ - X̄₂) redondeadas a dos
+    decimales y los valores críticos (Z).
+    :rtype: ResultadoCaso4
+    """
+    n1, n2, media1, media2, varianza1, varianza2, confianza = _como_arreglos(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    )
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    raiz = np.sqrt(varianza1 / n1 + varianza2 / n2)
+
+    diferencia = media1 - media2
+    return ResultadoCaso4(
+        diferencia - valor_critico_Z * raiz,
+        diferencia + valor_critico_Z * raiz,
+        np.round(diferencia, 2),
+        valor_critico_Z,
+    )
+
+
+def intervalo_caso_5_lote(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso5:
+    """
+    Versión por lotes de ``intervalo_caso_5`` (μ₁ - μ₂, muestras
+    chicas con varianzas diferentes y desconocidas).
+
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param medias_muestrales_1: Medias de las primeras muestras (X̄₁).
+    :type medias_muestrales_1: ArrayLike
+    :param medias_muestrales_2: Medias de las segundas muestras (X̄₂).
+    :type medias_muestrales_2: ArrayLike
+    :param varianzas_muestrales_1: Varianzas de las primeras
+    muestras (𝑠₁²).
+    :type varianzas_muestrales_1: ArrayLike
+    :param varianzas_muestrales_2: Varianzas de las segundas
+    muestras (𝑠₂²).
+    :type varianzas_muestrales_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    diferencias de medias muestrales (X̄₁ - X̄₂), los valores críticos
+    de la distribución t y los grados de libertad efectivos (ν).
+    :rtype: ResultadoCaso5
+    """
+    n1, n2, media1, media2, varianza1, varianza2, confianza = _como_arreglos(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    )
+    grados_libertad_efectivos = _calcular_grados_libertad_efectivos(
+        varianza1,
+        varianza2,
+        n1,
+        n2,
+    )
+    valor_critico_t = _calcular_valor_critico_t_student(confianza, grados_libertad_efectivos)
+    raiz = np.sqrt(varianza1 / n1 + varianza2 / n2)
+
+    diferencia = media1 - media2
+    return ResultadoCaso5(
+        diferencia - valor_critico_t * raiz,
+        diferencia + valor_critico_t * raiz,
+        diferencia,
+        valor_critico_t,
+        grados_libertad_efectivos,
+    )
+
+
+def intervalo_caso_6_lote(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso6:
+    """
+    Versión por lotes de ``intervalo_caso_6`` (μ₁ - μ₂ con varianzas
+    iguales y desconocidas).
+
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param medias_muestrales_1: Medias de las primeras muestras (X̄₁).
+    :type medias_muestrales_1: ArrayLike
+    :param medias_muestrales_2: Medias de las segundas muestras (X̄₂).
+    :type medias_muestrales_2: ArrayLike
+    :param varianzas_muestrales_1: Varianzas de las primeras
+    muestras (𝑠₁²).
+    :type varianzas_muestrales_1: ArrayLike
+    :param varianzas_muestrales_2: Varianzas de las segundas
+    muestras (𝑠₂²).
+    :type varianzas_muestrales_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    diferencias de medias muestrales (X̄₁ - X̄₂), los valores críticos
+    de la distribución t y los grados de libertad.
+    :rtype: ResultadoCaso6
+    """
+    n1, n2, media1, media2, varianza1, varianza2, confianza = _como_arreglos(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        medias_muestrales_1,
+        medias_muestrales_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    )
+    desv_estandar_combinada = _calcular_desviacion_estandar_combinada(
+        varianza1,
+        varianza2,
+        n1,
+        n2,
+    )
+    grados_libertad = n1 + n2 - 2
+    valor_critico_t = _calcular_valor_critico_t_student(confianza, grados_libertad)
+    raiz = np.sqrt((1 / n1) + (1 / n2))
+
+    diferencia = media1 - media2
+    margen = valor_critico_t * desv_estandar_combinada * raiz
+    return ResultadoCaso6(
+        diferencia - margen,
+        diferencia + margen,
+        diferencia,
+        valor_critico_t,
+        grados_libertad,
+    )
+
+
+def intervalo_caso_7_lote(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    ) -> ResultadoCaso7:
+    """
+    Versión por lotes de ``intervalo_caso_7`` (proporción
+    poblacional).
+
+    :param numeros_exitos: Números de éxitos (X).
+    :type numeros_exitos: ArrayLike
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    proporciones muestrales (𝑝) y los valores críticos (Z).
+    :rtype: ResultadoCaso7
+    """
+    exitos, n, confianza = _como_arreglos(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    )
+    proporcion_muestral = np.round(exitos / n, 4)
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    raiz = np.sqrt((proporcion_muestral * (1 - proporcion_muestral)) / n)
+
+    return ResultadoCaso7(
+        proporcion_muestral - valor_critico_Z * raiz,
+        proporcion_muestral + valor_critico_Z * raiz,
+        proporcion_muestral,
+        valor_critico_Z,
+    )
+
+
+def intervalo_wilson_lote(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    ) -> ResultadoCaso7:
+    """
+    Versión por lotes de ``intervalo_wilson`` (proporción
+    poblacional, intervalo de puntaje).
+
+    :param numeros_exitos: Números de éxitos (X).
+    :type numeros_exitos: ArrayLike
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    proporciones muestrales (𝑝) y los valores críticos (Z).
+    :rtype: ResultadoCaso7
+    """
+    exitos, n, confianza = _como_arreglos(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    )
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    inferior, superior = _limites_wilson(exitos, n, valor_critico_Z)
+    return ResultadoCaso7(inferior, superior, np.round(exitos / n, 4), valor_critico_Z)
+
+
+def intervalo_agresti_coull_lote(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    ) -> ResultadoCaso7:
+    """
+    Versión por lotes de ``intervalo_agresti_coull`` (proporción
+    poblacional).
+
+    :param numeros_exitos: Números de éxitos (X).
+    :type numeros_exitos: ArrayLike
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    proporciones muestrales (𝑝) y los valores críticos (Z).
+    :rtype: ResultadoCaso7
+    """
+    exitos, n, confianza = _como_arreglos(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    )
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    tamano_ajustado = n + valor_critico_Z ** 2
+    proporcion_ajustada = (exitos + valor_critico_Z ** 2 / 2) / tamano_ajustado
+    raiz = np.sqrt(proporcion_ajustada * (1 - proporcion_ajustada) / tamano_ajustado)
+
+    return ResultadoCaso7(
+        np.maximum(proporcion_ajustada - valor_critico_Z * raiz, 0.0),
+        np.minimum(proporcion_ajustada + valor_critico_Z * raiz, 1.0),
+        np.round(exitos / n, 4),
+        valor_critico_Z,
+    )
+
+
+def intervalo_clopper_pearson_lote(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    ) -> ResultadoClopperPearson:
+    """
+    Versión por lotes de ``intervalo_clopper_pearson`` (proporción
+    poblacional, intervalo exacto). Cada combinación distinta de
+    (X, n, confianza) busca sus cuantiles F una sola vez.
+
+    :param numeros_exitos: Números de éxitos (X).
+    :type numeros_exitos: ArrayLike
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos y las
+    proporciones muestrales (𝑝).
+    :rtype: ResultadoClopperPearson
+    """
+    exitos, n, confianza = _como_arreglos(
+        numeros_exitos,
+        tamanos_muestra,
+        porcentajes_confianza,
+    )
+    alpha = 1 - (confianza / 100)
+    fracasos = n - exitos
+    con_exitos = exitos > 0
+    con_fracasos = fracasos > 0
+
+    # Los grados de libertad de los extremos (X = 0 o X = n) no son
+    # válidos; se sustituyen y el límite se fija en 0 o 1
+    f_inferior = cuantiles(
+        "f",
+        alpha / 2,
+        np.where(con_exitos, 2 * exitos, 1),
+        2 * (fracasos + 1),
+    )
+    f_superior = cuantiles(
+        "f",
+        1 - alpha / 2,
+        2 * (exitos + 1),
+        np.where(con_fracasos, 2 * fracasos, 1),
+    )
+    inferior = np.where(
+        con_exitos,
+        exitos * f_inferior / (fracasos + 1 + exitos * f_inferior),
+        0.0,
+    )
+    superior = np.where(
+        con_fracasos,
+        (exitos + 1) * f_superior / (fracasos + (exitos + 1) * f_superior),
+        1.0,
+    )
+    return ResultadoClopperPearson(inferior, superior, np.round(exitos / n, 4))
+
+
+def intervalo_caso_8_lote(
+        numeros_exitos_1,
+        numeros_exitos_2,
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso8:
+    """
+    Versión por lotes de ``intervalo_caso_8`` (diferencia de
+    proporciones poblacionales).
+
+    :param numeros_exitos_1: Números de éxitos de las primeras
+    muestras (X₁).
+    :type numeros_exitos_1: ArrayLike
+    :param numeros_exitos_2: Números de éxitos de las segundas
+    muestras (X₂).
+    :type numeros_exitos_2: ArrayLike
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    diferencias de proporciones muestrales (𝑝₁ - 𝑝₂) y los valores
+    críticos (Z).
+    :rtype: ResultadoCaso8
+    """
+    exitos1, exitos2, n1, n2, confianza = _como_arreglos(
+        numeros_exitos_1,
+        numeros_exitos_2,
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        porcentajes_confianza,
+    )
+    proporcion_1 = np.round(exitos1 / n1, 4)
+    proporcion_2 = np.round(exitos2 / n2, 4)
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    raiz = np.sqrt(
+        (proporcion_1 * (1 - proporcion_1)) / n1
+        + (proporcion_2 * (1 - proporcion_2)) / n2
+    )
+
+    diferencia = proporcion_1 - proporcion_2
+    return ResultadoCaso8(
+        diferencia - valor_critico_Z * raiz,
+        diferencia + valor_critico_Z * raiz,
+        diferencia,
+        valor_critico_Z,
+    )
+
+
+def intervalo_newcombe_lote(
+        numeros_exitos_1,
+        numeros_exitos_2,
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso8:
+    """
+    Versión por lotes de ``intervalo_newcombe`` (diferencia de
+    proporciones poblacionales, híbrido de puntajes de Wilson).
+
+    :param numeros_exitos_1: Números de éxitos de las primeras
+    muestras (X₁).
+    :type numeros_exitos_1: ArrayLike
+    :param numeros_exitos_2: Números de éxitos de las segundas
+    muestras (X₂).
+    :type numeros_exitos_2: ArrayLike
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    diferencias de proporciones muestrales (𝑝₁ - 𝑝₂) y los valores
+    críticos (Z).
+    :rtype: ResultadoCaso8
+    """
+    exitos1, exitos2, n1, n2, confianza = _como_arreglos(
+        numeros_exitos_1,
+        numeros_exitos_2,
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        porcentajes_confianza,
+    )
+    valor_critico_Z = _calcular_valor_critico_normal_estandar(confianza)
+    proporcion_1 = exitos1 / n1
+    proporcion_2 = exitos2 / n2
+    inferior_1, superior_1 = _limites_wilson(exitos1, n1, valor_critico_Z)
+    inferior_2, superior_2 = _limites_wilson(exitos2, n2, valor_critico_Z)
+
+    diferencia = proporcion_1 - proporcion_2
+    return ResultadoCaso8(
+        diferencia - np.hypot(proporcion_1 - inferior_1, superior_2 - proporcion_2),
+        diferencia + np.hypot(superior_1 - proporcion_1, proporcion_2 - inferior_2),
+        np.round(exitos1 / n1, 4) - np.round(exitos2 / n2, 4),
+        valor_critico_Z,
+    )
+
+
+def intervalo_caso_9_lote(
+        tamanos_muestra,
+        varianzas_muestrales,
+        porcentajes_confianza,
+    ) -> ResultadoCaso9:
+    """
+    Versión por lotes de ``intervalo_caso_9`` (varianza
+    poblacional).
+
+    :param tamanos_muestra: Tamaños de las muestras (n).
+    :type tamanos_muestra: ArrayLike
+    :param varianzas_muestrales: Varianzas muestrales (𝑠²).
+    :type varianzas_muestrales: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, las
+    varianzas muestrales (𝑠²) y los grados de libertad.
+    :rtype: ResultadoCaso9
+    """
+    n, varianza, confianza = _como_arreglos(
+        tamanos_muestra,
+        varianzas_muestrales,
+        porcentajes_confianza,
+    )
+    chi2_superior, chi2_inferior = _calcular_valor_critico_chi_cuadrada(n, confianza)
+
+    numerador = varianza * (n - 1)
+    return ResultadoCaso9(
+        numerador / chi2_superior,
+        numerador / chi2_inferior,
+        varianza,
+        n - 1,
+    )
+
+
+def intervalo_caso_10_lote(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    ) -> ResultadoCaso10:
+    """
+    Versión por lotes de ``intervalo_caso_10`` (cociente de varianzas
+    poblacionales).
+
+    :param tamanos_muestra_1: Tamaños de las primeras muestras (n₁).
+    :type tamanos_muestra_1: ArrayLike
+    :param tamanos_muestra_2: Tamaños de las segundas muestras (n₂).
+    :type tamanos_muestra_2: ArrayLike
+    :param varianzas_muestrales_1: Varianzas de las primeras
+    muestras (𝑠₁²).
+    :type varianzas_muestrales_1: ArrayLike
+    :param varianzas_muestrales_2: Varianzas de las segundas
+    muestras (𝑠₂²).
+    :type varianzas_muestrales_2: ArrayLike
+    :param porcentajes_confianza: Porcentajes de confianza.
+    :type porcentajes_confianza: ArrayLike
+    :return: Límites inferiores y superiores de los intervalos, si
+    cada intervalo contiene al 1, los cocientes de varianzas
+    muestrales redondeados a dos decimales y los grados de libertad
+    de cada muestra.
+    :rtype: ResultadoCaso10
+    """
+    n1, n2, varianza1, varianza2, confianza = _como_arreglos(
+        tamanos_muestra_1,
+        tamanos_muestra_2,
+        varianzas_muestrales_1,
+        varianzas_muestrales_2,
+        porcentajes_confianza,
+    )
+    f_superior, f_inferior = _calcular_valor_critico_f(n1, n2, confianza)
+
+    cociente = varianza1 / varianza2
+    intervalo_l = cociente * (1 / f_superior)
+    intervalo_u = cociente * (1 / f_inferior)
+    varianzas_son_iguales = (intervalo_l <= 1) & (1 <= intervalo_u)
+    return ResultadoCaso10(
+        intervalo_l,
+        intervalo_u,
+        varianzas_son_iguales,
+        np.round(cociente, 2),
+        n1 - 1,
+        n2 - 1,
+    )
@@ -0,0 +1,185 @@
+"""
+En este módulo se define el acumulador de momentos muestrales que
+alimenta los casos de medias y varianzas.
+
+El acumulador guarda el número de observaciones, la media y la suma
+de cuadrados de las desviaciones (M2) y se actualiza en una sola
+pasada, ya sea observación por observación (algoritmo de Welford) o
+por bloques de NumPy que se combinan con la fórmula de Chan et al.
+Así una muestra muy grande se reduce sin tenerla completa en memoria
+y sin redondear en cada iteración.
+"""
+import math
+
+import numpy as np
+
+from src.errores import ERR_OBSERVACIONES_INSUFICIENTES
+
+__all__ = [
+    "AcumuladorMomentos",
+    "TAMANO_BLOQUE",
+]
+
+TAMANO_BLOQUE = 1 << 16
+
+class AcumuladorMomentos:
+    """
+    Acumulador en una sola pasada del número de observaciones (n), la
+    media muestral (X̄) y M2 = Σ(xᵢ - X̄)².
+    """
+    __slots__ = ("conteo", "media", "m2")
+
+    def __init__(self, conteo: int = 0, media: float = 0.0, m2: float = 0.0) -> None:
+        self.conteo = conteo
+        self.media = media
+        self.m2 = m2
+
+    @classmethod
+    def desde_arreglo(cls, datos, tamano_bloque: int = TAMANO_BLOQUE) -> "AcumuladorMomentos":
+        """
+        Reduce un arreglo recorriéndolo en bloques de tamaño fijo.
+
+        :param datos: Observaciones de la muestra.
+        :type datos: ArrayLike
+        :param tamano_bloque: Número de observaciones por bloque.
+        :type tamano_bloque: int
+        :return: Acumulador con los momentos de todo el arreglo.
+        :rtype: AcumuladorMomentos
+        """
+        datos = np.asarray(datos).reshape(-1)
+        acumulador = cls()
+        for inicio in range(0, datos.shape[0], tamano_bloque):
+            acumulador.agregar_bloque(datos[inicio:inicio + tamano_bloque])
+
+        return acumulador
+
+    def agregar(self, valor: float) -> None:
+        """
+        Agrega una observación con el algoritmo de Welford.
+
+        :param valor: Observación a agregar.
+        :type valor: float
+        """
+        self.conteo += 1
+        delta = valor - self.media
+        self.media += delta / self.conteo
+        self.m2 += delta * (valor - self.media)
+
+    def agregar_bloque(self, valores) -> None:
+        """
+        Agrega un bloque de observaciones; los momentos del bloque se
+        calculan con NumPy y se combinan con los acumulados.
+
+        :param valores: Observaciones del bloque.
+        :type valores: ArrayLike
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        conteo = valores.shape[0]
+        if conteo == 0:
+            return
+
+        media = float(valores.mean())
+        desviaciones = valores - media
+        m2 = float(np.dot(desviaciones, desviaciones))
+        self.combinar(AcumuladorMomentos(conteo, media, m2))
+
+    def combinar(self, otro: "AcumuladorMomentos") -> None:
+        """
+        Combina los momentos de otro acumulador con los propios.
+
+        :param otro: Acumulador de un bloque o de otra muestra parcial.
+        :type otro: AcumuladorMomentos
+        """
+        if otro.conteo == 0:
+            return
+
+        if self.conteo == 0:
+            self.conteo, self.media, self.m2 = otro.conteo, otro.media, otro.m2
+            return
+
+        conteo = self.conteo + otro.conteo
+        delta = otro.media - self.media
+        self.media += delta * (otro.conteo / conteo)
+        self.m2 += otro.m2 + (delta ** 2) * (self.conteo * otro.conteo / conteo)
+        self.conteo = conteo
+
+    def quitar(self, valor: float) -> None:
+        """
+        Quita una observación que se había agregado, invirtiendo el
+        paso del algoritmo de Welford.
+
+        :param valor: Observación a quitar.
+        :type valor: float
+        :raises ValueError: Si el acumulador está vacío.
+        """
+        if self.conteo == 0:
+            raise ValueError("No hay observaciones que quitar")
+
+        if self.conteo == 1:
+            self.conteo, self.media, self.m2 = 0, 0.0, 0.0
+            return
+
+        media_anterior = self.media
+        self.conteo -= 1
+        self.media = (media_anterior * (self.conteo + 1) - valor) / self.conteo
+        # El redondeo puede dejar M2 ligeramente negativo
+        self.m2 = max(self.m2 - (valor - media_anterior) * (valor - self.media), 0.0)
+
+    def descontar(self, otro: "AcumuladorMomentos") -> None:
+        """
+        Quita los momentos de un subconjunto de las observaciones
+        acumuladas (inverso de ``combinar``).
+
+        :param otro: Acumulador de las observaciones a quitar.
+        :type otro: AcumuladorMomentos
+        :raises ValueError: Si se quieren quitar más observaciones de
+        las acumuladas.
+        """
+        if otro.conteo == 0:
+            return
+
+        conteo = self.conteo - otro.conteo
+        if conteo < 0:
+            raise ValueError("No hay observaciones que quitar")
+
+        if conteo == 0:
+            self.conteo, self.media, self.m2 = 0, 0.0, 0.0
+            return
+
+        media = (self.media * self.conteo - otro.media * otro.conteo) / conteo
+        delta = otro.media - media
+        m2 = self.m2 - otro.m2 - (delta ** 2) * (conteo * otro.conteo / self.conteo)
+        self.conteo, self.media, self.m2 = conteo, media, max(m2, 0.0)
+
+    def copiar(self) -> "AcumuladorMomentos":
+        """
+        :return: Un acumulador independiente con los mismos momentos.
+        :rtype: AcumuladorMomentos
+        """
+        return AcumuladorMomentos(self.conteo, self.media, self.m2)
+
+    @property
+    def varianza_muestral(self) -> float:
+        """
+        Varianza muestral (𝑠²) con denominador n - 1.
+
+        :raises ValueError: Si hay menos de dos observaciones.
+        """
+        if self.conteo < 2:
+            raise ValueError(ERR_OBSERVACIONES_INSUFICIENTES)
+
+        return self.m2 / (self.conteo - 1)
+
+    @property
+    def desv_estandar_muestral(self) -> float:
+        """Desviación estándar muestral (𝑠)."""
+        return math.sqrt(self.varianza_muestral)
+
+    def __len__(self) -> int:
+        return self.conteo
+
+    def __repr__(self) -> str:
+        return (
+            f"AcumuladorMomentos(conteo={self.conteo}, "
+            f"media={self.media!r}, m2={self.m2!r})"
+        )
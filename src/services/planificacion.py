@@ -0,0 +1,368 @@
+"""
+En este módulo se define el planificador del tamaño de muestra: para
+un caso, un semiancho deseado (el margen de error, la mitad del ancho
+del intervalo) y un porcentaje de confianza se obtiene el menor n, o
+n₁ y n₂ en los casos de dos muestras, con el que el intervalo no es
+más ancho que lo pedido.
+
+Todos los parámetros se difunden con las reglas de *broadcasting*,
+así que una sola llamada resuelve una malla completa de semianchos,
+confianzas y desviaciones estándar. En los casos de una muestra con
+Z (1 y 7) n sale de su fórmula cerrada, n = ⌈(Z / E)² V⌉. En los
+demás el tamaño se busca con una bisección entera vectorizada: en los
+casos con t, χ² y F el valor crítico depende de n, y en los de dos
+muestras con Z redondear n₂ hacia arriba puede dejar cumplir a un n₁
+menor que el de la fórmula, que entonces solo sirve de cota. La cota
+superior se duplica hasta que alcanza el semiancho y luego se parte
+el intervalo a la mitad en todos los elementos pendientes a la vez,
+evaluando el semiancho con las funciones por lotes. Los valores
+críticos son los mismos, redondeados a cuatro decimales, que usa la
+calculadora.
+
+En los casos de dos muestras n₂ = ⌈k n₁⌉, con k la ``razon`` n₂ / n₁.
+En los casos 9 y 10, cuyos intervalos no son simétricos, el semiancho
+es la mitad de su ancho. Los tamaños respetan los mínimos de la
+calculadora: dos observaciones para estimar una varianza, n ≥ 30 en el
+caso 4 y np ≥ 5 y n(1 - p) ≥ 5 en los de proporciones. En los casos 5
+y 6 no se limita n a muestras chicas.
+
+Ejemplo (n para E = 0.5, 1 y 2 con 90, 95 y 99 % de confianza)::
+
+    plan = planificar_tamano_muestra(
+        2, np.array([0.5, 1, 2])[:, None], [90, 95, 99], desv_estandar_1=4
+    )
+    plan.tamano_muestra_1  # arreglo de 3 × 3
+"""
+from typing import NamedTuple
+
+import numpy as np
+
+from src.errores import ERR_DESV_ESTANDAR_POBLACIONAL, ERR_PORCENTAJE_CONFIANZA
+
+from . import lotes
+from .valores_criticos import cuantiles
+
+__all__ = [
+    "CASOS_PLANIFICACION",
+    "TAMANO_MAXIMO",
+    "PlanTamano",
+    "planificar_tamano_muestra",
+]
+
+CASOS_PLANIFICACION = tuple(range(1, 11))
+TAMANO_MAXIMO = 10**9
+
+_FORMULA_CERRADA = (1, 7)
+_DOS_MUESTRAS = (3, 4, 5, 6, 8, 10)
+_CON_VARIANZA = (2, 5, 6, 9, 10)
+_PROPORCIONES = (7, 8)
+
+# Tolerancia relativa al comparar con el semiancho deseado, para que un
+# semiancho exacto no se rechace por el error de redondeo
+_TOLERANCIA = 1e-9
+
+class PlanTamano(NamedTuple):
+    """
+    Tamaños de muestra planificados; ``tamano_muestra_2`` es 0 en los
+    casos de una muestra y ambos son 0 si no se alcanza el semiancho
+    con ``tamano_maximo``.
+    """
+    tamano_muestra_1: np.ndarray
+    tamano_muestra_2: np.ndarray
+    semiancho: np.ndarray
+
+
+def _valor_critico_Z(confianza: np.ndarray) -> np.ndarray:
+    """Valor crítico Z redondeado como en el cálculo por lotes."""
+    alpha = 1 - (confianza / 100)
+    return np.round(cuantiles("normal", 1 - np.round(alpha / 2, 4)), 4)
+
+
+def _techo(valores: np.ndarray) -> np.ndarray:
+    """Techo entero sin el error de redondeo de un valor exacto."""
+    return np.ceil(np.round(valores, 6)).astype(np.int64)
+
+
+def _segundo_tamano(caso: int, n1: np.ndarray, razon: np.ndarray) -> np.ndarray:
+    if caso not in _DOS_MUESTRAS:
+        return np.zeros_like(n1)
+
+    return np.where(n1 > 0, _techo(razon * n1), 0)
+
+
+def _intervalos(
+        caso: int,
+        n1: np.ndarray,
+        n2: np.ndarray,
+        confianza: np.ndarray,
+        desv1: np.ndarray,
+        desv2: np.ndarray,
+        proporcion1: np.ndarray,
+        proporcion2: np.ndarray,
+    ):
+    """
+    Intervalos del caso con esos tamaños, calculados con las funciones
+    por lotes y medias en cero (el ancho no depende de ellas).
+    """
+    if caso == 1:
+        return lotes.intervalo_caso_1_lote(n1, 0, confianza, desv1)
+
+    if caso == 2:
+        return lotes.intervalo_caso_2_lote(n1, 0, desv1 ** 2, confianza)
+
+    if caso == 3:
+        return lotes.intervalo_caso_3_lote(n1, n2, desv1, desv2, 0, 0, confianza)
+
+    if caso in (4, 5, 6):
+        funcion = (
+            lotes.intervalo_caso_4_lote,
+            lotes.intervalo_caso_5_lote,
+            lotes.intervalo_caso_6_lote,
+        )[caso - 4]
+        return funcion(n1, n2, 0, 0, desv1 ** 2, desv2 ** 2, confianza)
+
+    if caso == 7:
+        return lotes.intervalo_caso_7_lote(proporcion1 * n1, n1, confianza)
+
+    if caso == 8:
+        return lotes.intervalo_caso_8_lote(proporcion1 * n1, proporcion2 * n2, n1, n2, confianza)
+
+    if caso == 9:
+        return lotes.intervalo_caso_9_lote(n1, desv1 ** 2, confianza)
+
+    return lotes.intervalo_caso_10_lote(n1, n2, desv1 ** 2, desv2 ** 2, confianza)
+
+
+def _semiancho(*argumentos) -> np.ndarray:
+    """Semiancho de los intervalos de ``_intervalos``."""
+    # Un valor crítico F o χ² que se redondea a cero da un límite infinito
+    with np.errstate(divide="ignore", invalid="ignore"):
+        resultado = _intervalos(*argumentos)
+
+    return (resultado.limite_superior - resultado.limite_inferior) / 2
+
+
+def _variabilidad(
+        caso: int,
+        desv1: np.ndarray,
+        desv2: np.ndarray,
+        proporcion1: np.ndarray,
+        proporcion2: np.ndarray,
+        razon: np.ndarray,
+    ) -> np.ndarray:
+    """
+    V tal que el semiancho con Z es Z √(V / n₁) (con n₂ = k n₁). Es
+    exacta en los casos con Z y una aproximación para los demás.
+    """
+    if caso in (1, 2):
+        return desv1 ** 2
+
+    if caso in (3, 4, 5, 6):
+        return desv1 ** 2 + desv2 ** 2 / razon
+
+    if caso in _PROPORCIONES:
+        # La calculadora redondea la proporción muestral a cuatro decimales
+        p1 = np.round(proporcion1, 4)
+        p2 = np.round(proporcion2, 4)
+        if caso == 7:
+            return p1 * (1 - p1)
+
+        return p1 * (1 - p1) + p2 * (1 - p2) / razon
+
+    # Aproximación normal: Var(𝑠²) ≈ 2σ⁴ / n y Var(ln(𝑠₁² / 𝑠₂²)) ≈ 2 / n₁ + 2 / n₂
+    if caso == 9:
+        return 2 * desv1 ** 4
+
+    return 2 * (desv1 ** 2 / desv2 ** 2) ** 2 * (1 + 1 / razon)
+
+
+def _tamano_minimo(
+        caso: int,
+        proporcion1: np.ndarray,
+        proporcion2: np.ndarray,
+        razon: np.ndarray,
+    ) -> np.ndarray:
+    """Menor n₁ con el que ambas muestras cumplen los mínimos del caso."""
+    if caso in _PROPORCIONES:
+        minimo_1 = _techo(5 / np.minimum(proporcion1, 1 - proporcion1))
+        minimo_2 = _techo(5 / np.minimum(proporcion2, 1 - proporcion2))
+    else:
+        minimo = 30 if caso == 4 else 2 if caso in _CON_VARIANZA else 1
+        minimo_1 = minimo_2 = np.full(razon.shape, minimo, dtype=np.int64)
+
+    if caso not in _DOS_MUESTRAS:
+        return minimo_1
+
+    # ⌈k n₁⌉ ≥ m en cuanto k n₁ > m - 1
+    return np.maximum(minimo_1, np.floor(np.round((minimo_2 - 1) / razon, 6)).astype(np.int64) + 1)
+
+
+def _buscar_minimo(cumple, inferior: np.ndarray, superior: np.ndarray, maximo: int) -> np.ndarray:
+    """
+    Bisección entera vectorizada: el menor n en (inferior, maximo] de
+    cada elemento con ``cumple(indices, n)`` verdadero, suponiendo que
+    deja de fallar a partir de algún n.
+
+    :param cumple: Función que recibe los índices de los elementos y
+    un tamaño por elemento y devuelve si alcanzan el semiancho.
+    :param inferior: Cota que se sabe que no cumple.
+    :type inferior: np.ndarray
+    :param superior: Primer tamaño a probar.
+    :type superior: np.ndarray
+    :param maximo: Tamaño máximo permitido.
+    :type maximo: int
+    :return: Menor tamaño de cada elemento, o 0 si ni ``maximo`` cumple.
+    :rtype: np.ndarray
+    """
+    inferior = inferior.copy()
+    superior = np.minimum(superior, maximo)
+    alcanzable = np.ones(superior.shape, dtype=bool)
+
+    # Se duplica la cota superior de los que no cumplen hasta que cumplan
+    pendientes = np.arange(superior.shape[0])
+    while pendientes.size:
+        fallan = pendientes[~cumple(pendientes, superior[pendientes])]
+        agotados = superior[fallan] >= maximo
+        alcanzable[fallan[agotados]] = False
+        pendientes = fallan[~agotados]
+        inferior[pendientes] = superior[pendientes]
+        superior[pendientes] = np.minimum(superior[pendientes] * 2, maximo)
+
+    # Ahora superior cumple e inferior no; se parte a la mitad
+    pendientes = np.flatnonzero(alcanzable & (superior - inferior > 1))
+    while pendientes.size:
+        medio = (inferior[pendientes] + superior[pendientes]) // 2
+        cumplen = cumple(pendientes, medio)
+        superior[pendientes[cumplen]] = medio[cumplen]
+        inferior[pendientes[~cumplen]] = medio[~cumplen]
+        pendientes = pendientes[superior[pendientes] - inferior[pendientes] > 1]
+
+    return np.where(alcanzable, superior, 0)
+
+
+def planificar_tamano_muestra(
+        caso: int,
+        semiancho,
+        porcentaje_confianza=95,
+        desv_estandar_1=1.0,
+        desv_estandar_2=1.0,
+        proporcion_1=0.5,
+        proporcion_2=0.5,
+        razon=1.0,
+        tamano_maximo: int = TAMANO_MAXIMO,
+    ) -> PlanTamano:
+    """
+    Calcula el menor tamaño de muestra con el que el intervalo del
+    caso tiene a lo más el semiancho pedido. Todos los parámetros,
+    salvo el caso y el tamaño máximo, pueden ser arreglos y se
+    difunden entre sí.
+
+    :param caso: Caso del intervalo, del 1 al 10.
+    :type caso: int
+    :param semiancho: Semiancho deseado (E), en las unidades del
+    parámetro.
+    :type semiancho: ArrayLike
+    :param porcentaje_confianza: Porcentajes de confianza.
+    :type porcentaje_confianza: ArrayLike
+    :param desv_estandar_1: Desviación estándar poblacional (casos 1 y
+    3) o la que se espera en la primera muestra (los demás).
+    :type desv_estandar_1: ArrayLike
+    :param desv_estandar_2: Lo mismo para la segunda muestra.
+    :type desv_estandar_2: ArrayLike
+    :param proporcion_1: Proporción esperada (casos 7 y 8); 0.5 da el
+    tamaño del peor caso.
+    :type proporcion_1: ArrayLike
+    :param proporcion_2: Proporción esperada de la segunda muestra
+    (caso 8).
+    :type proporcion_2: ArrayLike
+    :param razon: Razón n₂ / n₁ en los casos de dos muestras.
+    :type razon: ArrayLike
+    :param tamano_maximo: Mayor n₁ que se considera.
+    :type tamano_maximo: int
+    :return: n₁, n₂ y el semiancho que se obtiene con ellos, con la
+    forma común de los parámetros.
+    :rtype: PlanTamano
+    """
+    if caso not in CASOS_PLANIFICACION:
+        raise ValueError(f"Caso no válido: {caso}")
+
+    objetivo, confianza, desv1, desv2, proporcion1, proporcion2, k = (
+        np.broadcast_arrays(*(
+            np.asarray(valor, dtype=np.float64)
+            for valor in (
+                semiancho,
+                porcentaje_confianza,
+                desv_estandar_1,
+                desv_estandar_2,
+                proporcion_1,
+                proporcion_2,
+                razon,
+            )
+        ))
+    )
+    if not np.all(objetivo > 0):
+        raise ValueError("El semiancho debe ser mayor que cero")
+
+    if not np.all((confianza > 0) & (confianza < 100)):
+        raise ValueError(ERR_PORCENTAJE_CONFIANZA)
+
+    if not np.all((desv1 >= 0) & (desv2 >= 0)):
+        raise ValueError(ERR_DESV_ESTANDAR_POBLACIONAL)
+
+    if caso in _PROPORCIONES and not np.all(
+        (proporcion1 > 0) & (proporcion1 < 1) & (proporcion2 > 0) & (proporcion2 < 1)
+    ):
+        raise ValueError("Las proporciones esperadas deben estar entre 0 y 1")
+
+    if not np.all(k > 0):
+        raise ValueError("La razón entre los tamaños de muestra debe ser mayor que cero")
+
+    forma = objetivo.shape
+    objetivo, confianza, desv1, desv2, proporcion1, proporcion2, k = (
+        arreglo.reshape(-1)
+        for arreglo in (objetivo, confianza, desv1, desv2, proporcion1, proporcion2, k)
+    )
+
+    minimo = _tamano_minimo(caso, proporcion1, proporcion2, k)
+    variabilidad = _variabilidad(caso, desv1, desv2, proporcion1, proporcion2, k)
+    # Con Z el tamaño es exacto; tope en tamano_maximo + 1 (sin solución)
+    estimado = np.maximum(
+        _techo(np.fmin(
+            _valor_critico_Z(confianza) ** 2 * variabilidad / objetivo ** 2,
+            tamano_maximo + 1,
+        )),
+        minimo,
+    )
+    if caso in _FORMULA_CERRADA:
+        n1 = np.where(estimado <= tamano_maximo, estimado, 0)
+    else:
+        def cumple(indices: np.ndarray, n: np.ndarray) -> np.ndarray:
+            semianchos = _semiancho(
+                caso,
+                n,
+                _segundo_tamano(caso, n, k[indices]),
+                confianza[indices],
+                desv1[indices],
+                desv2[indices],
+                proporcion1[indices],
+                proporcion2[indices],
+            )
+            return semianchos <= objetivo[indices] * (1 + _TOLERANCIA)
+
+        n1 = _buscar_minimo(cumple, minimo - 1, estimado, tamano_maximo)
+
+    n2 = _segundo_tamano(caso, n1, k)
+    alcanzado = np.full(n1.shape, np.nan)
+    validos = n1 > 0
+    alcanzado[validos] = _semiancho(
+        caso,
+        n1[validos],
+        n2[validos],
+        confianza[validos],
+        desv1[validos],
+        desv2[validos],
+        proporcion1[validos],
+        proporcion2[validos],
+    )
+
+    return PlanTamano(n1.reshape(forma), n2.reshape(forma), alcanzado.reshape(forma))
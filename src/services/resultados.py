@@ -0,0 +1,195 @@
+"""
+En este módulo se definen los resultados de cada ``intervalo_caso_*``
+como registros inmutables con nombre: tuplas con nombre
+(``NamedTuple``), sin diccionario por instancia, que se siguen
+desempacando igual que las tuplas que devolvían antes las funciones
+de cálculo y cuyos campos se leen por nombre (``resultado.limite_inferior``).
+
+Las funciones por lotes devuelven los mismos registros con un arreglo
+de numpy en cada campo (estructura de arreglos), así que millones de
+resultados ocupan lo que ocupan sus arreglos. Con
+``a_estructurado`` se empaquetan en un solo arreglo estructurado de
+numpy que se puede guardar con ``np.save`` y con
+``desde_estructurado`` se recuperan; ``registros`` recorre un lote
+como registros de números nativos de Python.
+"""
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+__all__ = [
+    "RESULTADO_CASO",
+    "ResultadoCaso1",
+    "ResultadoCaso2",
+    "ResultadoCaso3",
+    "ResultadoCaso4",
+    "ResultadoCaso5",
+    "ResultadoCaso6",
+    "ResultadoCaso7",
+    "ResultadoCaso8",
+    "ResultadoCaso9",
+    "ResultadoCaso10",
+    "ResultadoClopperPearson",
+    "a_estructurado",
+    "desde_estructurado",
+    "registros",
+]
+
+class ResultadoCaso1(NamedTuple):
+    """Intervalo para μ con varianza conocida."""
+    limite_inferior: float
+    limite_superior: float
+    media_muestral: float
+
+
+class ResultadoCaso2(NamedTuple):
+    """Intervalo para μ con varianza desconocida."""
+    limite_inferior: float
+    limite_superior: float
+    media_muestral: float
+    desv_estandar_muestral: float
+
+
+class ResultadoCaso3(NamedTuple):
+    """Intervalo para μ₁ - μ₂ con varianzas conocidas."""
+    limite_inferior: float
+    limite_superior: float
+    dif_medias_muestrales: float
+
+
+class ResultadoCaso4(NamedTuple):
+    """Intervalo para μ₁ - μ₂ con muestras grandes y varianzas desconocidas."""
+    limite_inferior: float
+    limite_superior: float
+    dif_medias_muestrales: float
+    valor_critico_Z: float
+
+
+class ResultadoCaso5(NamedTuple):
+    """Intervalo para μ₁ - μ₂ con muestras chicas y varianzas diferentes."""
+    limite_inferior: float
+    limite_superior: float
+    dif_medias_muestrales: float
+    valor_critico_t: float
+    grados_libertad_efectivos: float
+
+
+class ResultadoCaso6(NamedTuple):
+    """Intervalo para μ₁ - μ₂ con varianzas iguales y desconocidas."""
+    limite_inferior: float
+    limite_superior: float
+    dif_medias_muestrales: float
+    valor_critico_t: float
+    grados_libertad: float
+
+
+class ResultadoCaso7(NamedTuple):
+    """Intervalo para 𝑃 (también Wilson y Agresti-Coull)."""
+    limite_inferior: float
+    limite_superior: float
+    proporcion_muestral: float
+    valor_critico_Z: float
+
+
+class ResultadoClopperPearson(NamedTuple):
+    """Intervalo exacto de Clopper-Pearson para 𝑃."""
+    limite_inferior: float
+    limite_superior: float
+    proporcion_muestral: float
+
+
+class ResultadoCaso8(NamedTuple):
+    """Intervalo para 𝑃₁ - 𝑃₂ (también Newcombe)."""
+    limite_inferior: float
+    limite_superior: float
+    dif_proporciones_muestrales: float
+    valor_critico_Z: float
+
+
+class ResultadoCaso9(NamedTuple):
+    """Intervalo para σ²."""
+    limite_inferior: float
+    limite_superior: float
+    varianza_muestral: float
+    grados_libertad: int
+
+
+class ResultadoCaso10(NamedTuple):
+    """Intervalo para σ₁² / σ₂²."""
+    limite_inferior: float
+    limite_superior: float
+    varianzas_son_iguales: bool
+    cociente_varianzas_muestrales: float
+    grados_libertad_1: int
+    grados_libertad_2: int
+
+
+# Registro que devuelve intervalo_caso_N
+RESULTADO_CASO = {
+    1: ResultadoCaso1,
+    2: ResultadoCaso2,
+    3: ResultadoCaso3,
+    4: ResultadoCaso4,
+    5: ResultadoCaso5,
+    6: ResultadoCaso6,
+    7: ResultadoCaso7,
+    8: ResultadoCaso8,
+    9: ResultadoCaso9,
+    10: ResultadoCaso10,
+}
+
+def a_estructurado(resultado: NamedTuple) -> np.ndarray:
+    """
+    Empaqueta un resultado por lotes en un arreglo estructurado de
+    numpy, con un campo por cada campo del registro.
+
+    :param resultado: Registro con un arreglo (o escalar) por campo,
+    como los que devuelven las funciones ``intervalo_*_lote``.
+    :type resultado: NamedTuple
+    :return: Arreglo estructurado con un elemento por intervalo.
+    :rtype: np.ndarray
+    """
+    columnas = np.broadcast_arrays(*(np.asarray(valor) for valor in resultado))
+    tipo = np.dtype([
+        (campo, columna.dtype)
+        for campo, columna in zip(resultado._fields, columnas)
+    ])
+    estructurado = np.empty(columnas[0].shape, dtype=tipo)
+    for campo, columna in zip(resultado._fields, columnas):
+        estructurado[campo] = columna
+
+    return estructurado
+
+
+def desde_estructurado(tipo: type[NamedTuple], estructurado: np.ndarray) -> NamedTuple:
+    """
+    Recupera un resultado por lotes a partir de su arreglo
+    estructurado.
+
+    :param tipo: Clase del registro, por ejemplo ``ResultadoCaso2``.
+    :type tipo: type[NamedTuple]
+    :param estructurado: Arreglo de ``a_estructurado`` (o leído con
+    ``np.load``).
+    :type estructurado: np.ndarray
+    :return: Registro con un arreglo por campo.
+    :rtype: NamedTuple
+    """
+    if tuple(estructurado.dtype.names or ()) != tipo._fields:
+        raise ValueError(f"Los campos no corresponden a {tipo.__name__}")
+
+    return tipo._make(estructurado[campo] for campo in tipo._fields)
+
+
+def registros(resultado: NamedTuple) -> Iterator[NamedTuple]:
+    """
+    Recorre un resultado por lotes como registros escalares.
+
+    :param resultado: Registro con un arreglo (o escalar) por campo.
+    :type resultado: NamedTuple
+    :return: Un registro del mismo tipo por intervalo, con números
+    nativos de Python.
+    :rtype: Iterator[NamedTuple]
+    """
+    columnas = np.broadcast_arrays(*(np.asarray(valor) for valor in resultado))
+    for fila in zip(*(columna.reshape(-1).tolist() for columna in columnas)):
+        yield resultado._make(fila)
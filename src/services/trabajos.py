@@ -0,0 +1,617 @@
+"""
+En este módulo se definen los trabajos de cálculo no interactivos: un
+diccionario con el parámetro a estimar y sus datos se valida con las
+mismas reglas que el menú de la calculadora, se despacha al
+``intervalo_caso_*`` que corresponde y el resultado se devuelve como
+un diccionario listo para serializarse en JSON.
+
+Claves de un trabajo (las que no aplican se omiten):
+
+- ``parametro``: ``media``, ``dif_medias``, ``proporcion``,
+  ``dif_proporciones``, ``varianza`` o ``coc_varianzas``.
+- ``porcentaje_confianza``: entero entre 1 y 100.
+- ``muestra``, ``muestra_1``, ``muestra_2``: observaciones separadas
+  por espacios o una lista de números.
+- ``archivo``, ``archivo_1``, ``archivo_2``: en lugar de la muestra,
+  ruta de un archivo de texto, CSV o TSV que se lee por bloques (ver
+  ``src.services.ingesta``), con ``columna``, ``columna_1`` y
+  ``columna_2`` (índice o encabezado, por defecto la primera).
+- ``tamano_muestra``, ``tamano_muestra_1``, ``tamano_muestra_2``:
+  opcionales cuando hay muestra; si se dan deben coincidir con el
+  número de observaciones.
+- ``desv_estandar_poblacional``, ``desv_estandar_poblacional_1``,
+  ``desv_estandar_poblacional_2``: si se conocen.
+- ``varianzas`` (diferencia de medias): ``iguales``, ``diferentes`` o
+  ``desconocidas`` (por defecto), igual que la pregunta del menú.
+- ``numero_exitos``, ``numero_exitos_1``, ``numero_exitos_2``.
+- ``metodo`` (proporciones): ``normal`` (casos 7 y 8), ``wilson``,
+  ``agresti_coull`` o ``clopper_pearson`` para una proporción y
+  ``newcombe`` para la diferencia. Si no se da se usa la aproximación
+  normal cuando se cumplen sus condiciones y Wilson o Newcombe cuando
+  no, en lugar de rechazar el trabajo.
+- ``caso``: opcional, número del ``intervalo_caso_*`` a usar en lugar
+  de elegirlo a partir de los datos; si no se da ``parametro`` se
+  deduce del caso.
+- ``id``: opcional, se copia al resultado.
+
+Los valores no finitos del resultado se serializan como ``null`` (ver
+``a_json``) para que la salida sea siempre JSON válido.
+"""
+import json
+import math
+from typing import NamedTuple
+
+from src.errores import (
+    ERR_APROXIMACION_NORMAL,
+    ERR_DESV_ESTANDAR_POBLACIONAL,
+    ERR_FORMATO_OBSERVACIONES,
+    ERR_NUMERO,
+    ERR_NUMERO_ENTERO,
+    ERR_NUMERO_OBSERVACIONES,
+    ERR_OBSERVACIONES_INSUFICIENTES,
+    ERR_OPCION_NO_VALIDA,
+    ERR_PORCENTAJE_CONFIANZA,
+    ERR_TAMANO_MUESTRA,
+    ERR_VARIANZA_NULA,
+)
+from src.muestra import Muestra
+from src.validaciones import (
+    validar_condicion_normalidad_dif_proporciones,
+    validar_condicion_normalidad_proporcion,
+    validar_desviacion_estandar_poblacional,
+    validar_numero_exitos,
+    validar_numero_observaciones,
+    validar_porcentaje_confianza,
+    validar_tamano_muestra,
+)
+
+from . import cache_resultados, calculos
+from .ingesta import leer_momentos, leer_momentos_columnas
+from .momentos import AcumuladorMomentos
+from .resultados import (
+    RESULTADO_CASO,
+    ResultadoCaso7,
+    ResultadoCaso8,
+    ResultadoClopperPearson,
+)
+
+__all__ = [
+    "CAMPOS_CASO",
+    "CAMPOS_METODO",
+    "METODOS_PROPORCION",
+    "PARAMETROS",
+    "PARAMETRO_CASO",
+    "a_json",
+    "ejecutar_trabajo",
+    "ejecutar_trabajo_seguro",
+]
+
+PARAMETROS = (
+    "media",
+    "dif_medias",
+    "proporcion",
+    "dif_proporciones",
+    "varianza",
+    "coc_varianzas",
+)
+
+# Nombre de cada campo del registro que devuelve intervalo_caso_N
+CAMPOS_CASO = {caso: tipo._fields for caso, tipo in RESULTADO_CASO.items()}
+
+# Métodos de los parámetros de proporciones; ``normal`` es el caso
+# 7 u 8 y los demás no necesitan las condiciones de normalidad
+METODOS_PROPORCION = {
+    "proporcion": ("normal", "wilson", "agresti_coull", "clopper_pearson"),
+    "dif_proporciones": ("normal", "newcombe"),
+}
+
+CAMPOS_METODO = {
+    "wilson": ResultadoCaso7._fields,
+    "agresti_coull": ResultadoCaso7._fields,
+    "clopper_pearson": ResultadoClopperPearson._fields,
+    "newcombe": ResultadoCaso8._fields,
+}
+
+_FUNCIONES_METODO = {
+    "wilson": calculos.intervalo_wilson,
+    "agresti_coull": calculos.intervalo_agresti_coull,
+    "clopper_pearson": calculos.intervalo_clopper_pearson,
+    "newcombe": calculos.intervalo_newcombe,
+}
+
+PARAMETRO_CASO = {
+    1: "media",
+    2: "media",
+    3: "dif_medias",
+    4: "dif_medias",
+    5: "dif_medias",
+    6: "dif_medias",
+    7: "proporcion",
+    8: "dif_proporciones",
+    9: "varianza",
+    10: "coc_varianzas",
+}
+
+def _presente(trabajo: dict, clave: str) -> bool:
+    return trabajo.get(clave) not in (None, "")
+
+
+def _entero(trabajo: dict, clave: str) -> int:
+    valor = trabajo.get(clave)
+    if isinstance(valor, bool):
+        raise ValueError(f"{clave}: {ERR_NUMERO_ENTERO}")
+
+    if isinstance(valor, int):
+        return valor
+
+    try:
+        return int(str(valor).strip())
+    except ValueError:
+        raise ValueError(f"{clave}: {ERR_NUMERO_ENTERO}") from None
+
+
+def _numero(trabajo: dict, clave: str) -> float:
+    try:
+        return float(trabajo.get(clave))
+    except (TypeError, ValueError):
+        raise ValueError(f"{clave}: {ERR_NUMERO}") from None
+
+
+def _caso_pedido(trabajo: dict) -> int | None:
+    if not _presente(trabajo, "caso"):
+        return None
+
+    caso = _entero(trabajo, "caso")
+    if caso not in PARAMETRO_CASO:
+        raise ValueError(f"caso: {ERR_OPCION_NO_VALIDA}")
+
+    return caso
+
+
+def _porcentaje_confianza(trabajo: dict) -> int:
+    porcentaje_confianza = _entero(trabajo, "porcentaje_confianza")
+    if not validar_porcentaje_confianza(porcentaje_confianza):
+        raise ValueError(f"porcentaje_confianza: {ERR_PORCENTAJE_CONFIANZA}")
+
+    return porcentaje_confianza
+
+
+def _desv_estandar_poblacional(trabajo: dict, clave: str) -> float:
+    desv_estandar_poblacional = _numero(trabajo, clave)
+    if not validar_desviacion_estandar_poblacional(desv_estandar_poblacional):
+        raise ValueError(f"{clave}: {ERR_DESV_ESTANDAR_POBLACIONAL}")
+
+    return desv_estandar_poblacional
+
+
+def _tamano_muestra(trabajo: dict, clave: str) -> int:
+    tamano_muestra = _entero(trabajo, clave)
+    if not validar_tamano_muestra(tamano_muestra):
+        raise ValueError(f"{clave}: {ERR_TAMANO_MUESTRA}")
+
+    return tamano_muestra
+
+
+def _columna(trabajo: dict, sufijo: str) -> int | str:
+    columna = trabajo.get(f"columna{sufijo}", 0)
+    if isinstance(columna, str) and columna.strip().isdigit():
+        return int(columna)
+
+    return columna
+
+
+def _momentos_archivo(trabajo: dict, sufijo: str) -> AcumuladorMomentos:
+    clave = f"archivo{sufijo}"
+    try:
+        return leer_momentos(trabajo[clave], _columna(trabajo, sufijo))
+    except OSError as error:
+        raise ValueError(f"{clave}: {error.strerror or error}") from None
+
+
+def _muestra(trabajo: dict, sufijo: str = "") -> tuple[int, Muestra | AcumuladorMomentos]:
+    """
+    Valida y construye una muestra del trabajo, o lee sus momentos si
+    se da un archivo.
+
+    :return: Tamaño de la muestra (n) y la muestra o sus momentos.
+    :rtype: tuple[int, Muestra | AcumuladorMomentos]
+    """
+    clave = f"muestra{sufijo}"
+    valor = trabajo.get(clave)
+    if _presente(trabajo, f"archivo{sufijo}"):
+        muestra = _momentos_archivo(trabajo, sufijo)
+    elif isinstance(valor, (Muestra, AcumuladorMomentos)):
+        muestra = valor
+    elif isinstance(valor, str):
+        try:
+            muestra = Muestra.desde_texto(valor)
+        except ValueError as error:
+            raise ValueError(f"{clave}: {error}") from None
+    elif isinstance(valor, (list, tuple)):
+        try:
+            muestra = Muestra(valor)
+        except (TypeError, ValueError):
+            raise ValueError(f"{clave}: {ERR_FORMATO_OBSERVACIONES}") from None
+    else:
+        raise ValueError(f"{clave}: {ERR_FORMATO_OBSERVACIONES}")
+
+    clave_tamano = f"tamano_muestra{sufijo}"
+    if _presente(trabajo, clave_tamano):
+        tamano_muestra = _tamano_muestra(trabajo, clave_tamano)
+        if not validar_numero_observaciones(muestra, tamano_muestra):
+            raise ValueError(f"{clave}: {ERR_NUMERO_OBSERVACIONES}")
+    else:
+        tamano_muestra = len(muestra)
+        if not validar_tamano_muestra(tamano_muestra):
+            raise ValueError(f"{clave}: {ERR_TAMANO_MUESTRA}")
+
+    return tamano_muestra, muestra
+
+
+def _con_varianza(tamano_muestra: int, clave: str) -> None:
+    if tamano_muestra < 2:
+        raise ValueError(f"{clave}: {ERR_OBSERVACIONES_INSUFICIENTES}")
+
+
+def _varianza_nula(muestra: Muestra | AcumuladorMomentos) -> bool:
+    momentos = muestra if isinstance(muestra, AcumuladorMomentos) else muestra.momentos()
+    # Los casos redondean 𝑠² a cuatro decimales antes de dividir entre ella
+    return round(momentos.varianza_muestral, 4) == 0
+
+
+def _validar_denominadores(
+        caso: int,
+        muestra_1: Muestra | AcumuladorMomentos,
+        muestra_2: Muestra | AcumuladorMomentos,
+    ) -> None:
+    """
+    Rechaza las muestras cuyas varianzas dejarían en cero un
+    denominador: 𝑠₂² en el cociente del caso 10, o 𝑠₁² y 𝑠₂² a la vez
+    en los grados de libertad efectivos del caso 5.
+    """
+    if caso == 10 and _varianza_nula(muestra_2):
+        raise ValueError(f"muestra_2: {ERR_VARIANZA_NULA}")
+
+    if caso == 5 and _varianza_nula(muestra_1) and _varianza_nula(muestra_2):
+        raise ValueError(f"muestra_1, muestra_2: {ERR_VARIANZA_NULA}")
+
+
+def _dos_muestras(
+        trabajo: dict,
+    ) -> tuple[int, Muestra | AcumuladorMomentos, int, Muestra | AcumuladorMomentos]:
+    """
+    Valida y construye las dos muestras del trabajo. Si ambas columnas
+    están en el mismo archivo se leen en una sola pasada.
+
+    :return: Tamaño y muestra de la primera y de la segunda muestra.
+    :rtype: tuple[int, Muestra | AcumuladorMomentos, int, Muestra | AcumuladorMomentos]
+    """
+    archivo = trabajo.get("archivo_1")
+    if archivo and archivo == trabajo.get("archivo_2"):
+        try:
+            momentos = leer_momentos_columnas(
+                archivo, (_columna(trabajo, "_1"), _columna(trabajo, "_2"))
+            )
+        except OSError as error:
+            raise ValueError(f"archivo_1: {error.strerror or error}") from None
+
+        trabajo = {**trabajo, "muestra_1": momentos[0], "muestra_2": momentos[1]}
+        trabajo.pop("archivo_1")
+        trabajo.pop("archivo_2")
+
+    return (*_muestra(trabajo, "_1"), *_muestra(trabajo, "_2"))
+
+
+def _exitos(trabajo: dict, sufijo: str = "", incluir_extremos: bool = False) -> tuple[int, int]:
+    """
+    Valida el tamaño de la muestra y el número de éxitos.
+
+    :param incluir_extremos: Si se admiten X = 0 y X = n (métodos
+    distintos de la aproximación normal).
+    :type incluir_extremos: bool
+    :return: Número de éxitos (X) y tamaño de la muestra (n).
+    :rtype: tuple[int, int]
+    """
+    tamano_muestra = _tamano_muestra(trabajo, f"tamano_muestra{sufijo}")
+    numero_exitos = _entero(trabajo, f"numero_exitos{sufijo}")
+    if not validar_numero_exitos(tamano_muestra, numero_exitos, incluir_extremos):
+        if incluir_extremos:
+            rango = f"mayor o igual a 0 y menor o igual a {tamano_muestra}"
+        else:
+            rango = f"mayor o igual a 1 y menor que {tamano_muestra}"
+
+        raise ValueError(f"numero_exitos{sufijo}: Debe ser {rango}")
+
+    return numero_exitos, tamano_muestra
+
+
+def _metodo(trabajo: dict, parametro: str) -> str | None:
+    if not _presente(trabajo, "metodo"):
+        return "normal" if _caso_pedido(trabajo) is not None else None
+
+    metodo = str(trabajo["metodo"]).strip().lower()
+    if metodo not in METODOS_PROPORCION[parametro]:
+        raise ValueError(f"metodo: {ERR_OPCION_NO_VALIDA}")
+
+    return metodo
+
+
+def _resultado(caso: int, valores: NamedTuple, metodo: str | None = None) -> dict:
+    resultado = {"caso": caso}
+    if metodo is not None:
+        resultado["metodo"] = metodo
+
+    for campo, valor in valores._asdict().items():
+        # Los escalares de numpy se convierten a tipos nativos para JSON
+        resultado[campo] = valor.item() if hasattr(valor, "item") else valor
+
+    return resultado
+
+
+def _sin_no_finitos(valor):
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+
+    if isinstance(valor, dict):
+        return {clave: _sin_no_finitos(elemento) for clave, elemento in valor.items()}
+
+    if isinstance(valor, (list, tuple)):
+        return [_sin_no_finitos(elemento) for elemento in valor]
+
+    return valor
+
+
+def a_json(contenido: dict) -> str:
+    """
+    Serializa un resultado (o un error) en JSON estricto: los valores
+    ``NaN`` e infinitos, que JSON no admite, se escriben como ``null``.
+
+    :param contenido: Resultado de un trabajo o cualquier diccionario
+    serializable.
+    :type contenido: dict
+    :return: Texto JSON en una sola línea.
+    :rtype: str
+    """
+    return json.dumps(_sin_no_finitos(contenido), ensure_ascii=False, allow_nan=False)
+
+
+def _media(trabajo: dict) -> dict:
+    tamano_muestra, muestra = _muestra(trabajo)
+    porcentaje_confianza = _porcentaje_confianza(trabajo)
+    caso = _caso_pedido(trabajo)
+    if caso == 1 or (caso is None and _presente(trabajo, "desv_estandar_poblacional")):
+        desv_estandar_poblacional = _desv_estandar_poblacional(trabajo, "desv_estandar_poblacional")
+        return _resultado(1, cache_resultados.intervalo_caso_1(
+            tamano_muestra,
+            muestra,
+            porcentaje_confianza,
+            desv_estandar_poblacional,
+        ))
+
+    _con_varianza(tamano_muestra, "muestra")
+    return _resultado(2, cache_resultados.intervalo_caso_2(tamano_muestra, muestra, porcentaje_confianza))
+
+
+def _dif_medias_diferentes(
+        tamano_muestra_1: int,
+        tamano_muestra_2: int,
+        muestra_1: Muestra | AcumuladorMomentos,
+        muestra_2: Muestra | AcumuladorMomentos,
+        porcentaje_confianza: int,
+    ) -> dict:
+    # Con dos muestras grandes se usa Z (caso 4); en otro caso, t con
+    # los grados de libertad efectivos (caso 5)
+    if tamano_muestra_1 >= 30 and tamano_muestra_2 >= 30:
+        return _resultado(4, cache_resultados.intervalo_caso_4(
+            tamano_muestra_1,
+            tamano_muestra_2,
+            muestra_1,
+            muestra_2,
+            porcentaje_confianza,
+        ))
+
+    _validar_denominadores(5, muestra_1, muestra_2)
+    return _resultado(5, cache_resultados.intervalo_caso_5(
+        tamano_muestra_1,
+        tamano_muestra_2,
+        muestra_1,
+        muestra_2,
+        porcentaje_confianza,
+    ))
+
+
+def _dif_medias(trabajo: dict) -> dict:
+    tamano_muestra_1, muestra_1, tamano_muestra_2, muestra_2 = _dos_muestras(trabajo)
+    porcentaje_confianza = _porcentaje_confianza(trabajo)
+    caso = _caso_pedido(trabajo)
+
+    if caso == 3 or caso is None and (
+        _presente(trabajo, "desv_estandar_poblacional_1")
+        or _presente(trabajo, "desv_estandar_poblacional_2")
+    ):
+        return _resultado(3, cache_resultados.intervalo_caso_3(
+            tamano_muestra_1,
+            tamano_muestra_2,
+            _desv_estandar_poblacional(trabajo, "desv_estandar_poblacional_1"),
+            _desv_estandar_poblacional(trabajo, "desv_estandar_poblacional_2"),
+            muestra_1,
+            muestra_2,
+            porcentaje_confianza,
+        ))
+
+    _con_varianza(tamano_muestra_1, "muestra_1")
+    _con_varianza(tamano_muestra_2, "muestra_2")
+    datos = (tamano_muestra_1, tamano_muestra_2, muestra_1, muestra_2, porcentaje_confianza)
+    match caso:
+        case 4:
+            return _resultado(4, cache_resultados.intervalo_caso_4(*datos))
+        case 5:
+            _validar_denominadores(5, muestra_1, muestra_2)
+            return _resultado(5, cache_resultados.intervalo_caso_5(*datos))
+        case 6:
+            return _resultado(6, cache_resultados.intervalo_caso_6(*datos))
+
+    varianzas = str(trabajo.get("varianzas") or "desconocidas").strip().lower()
+    match varianzas:
+        case "iguales":
+            return _resultado(6, cache_resultados.intervalo_caso_6(*datos))
+        case "diferentes":
+            return _dif_medias_diferentes(*datos)
+        case "desconocidas":
+            # Igual que en el menú: el intervalo para el cociente de
+            # varianzas decide si se consideran iguales
+            _validar_denominadores(10, muestra_1, muestra_2)
+            cociente = cache_resultados.intervalo_caso_10(*datos)
+            if cociente[2]:
+                resultado = _resultado(6, cache_resultados.intervalo_caso_6(*datos))
+            else:
+                resultado = _dif_medias_diferentes(*datos)
+
+            resultado["cociente_varianzas"] = _resultado(10, cociente)
+            return resultado
+
+    raise ValueError(f"varianzas: {ERR_OPCION_NO_VALIDA}")
+
+
+def _proporcion(trabajo: dict) -> dict:
+    metodo = _metodo(trabajo, "proporcion")
+    # Sin método explícito, X = 0 y X = n no cumplen las condiciones de
+    # normalidad y se resuelven con Wilson
+    numero_exitos, tamano_muestra = _exitos(trabajo, incluir_extremos=metodo != "normal")
+    porcentaje_confianza = _porcentaje_confianza(trabajo)
+    if metodo in (None, "normal"):
+        if validar_condicion_normalidad_proporcion(tamano_muestra, numero_exitos):
+            return _resultado(7, cache_resultados.intervalo_caso_7(
+                numero_exitos,
+                tamano_muestra,
+                porcentaje_confianza,
+            ), metodo)
+
+        if metodo == "normal":
+            raise ValueError(ERR_APROXIMACION_NORMAL)
+
+        metodo = "wilson"
+
+    return _resultado(7, _FUNCIONES_METODO[metodo](
+        numero_exitos,
+        tamano_muestra,
+        porcentaje_confianza,
+    ), metodo)
+
+
+def _dif_proporciones(trabajo: dict) -> dict:
+    metodo = _metodo(trabajo, "dif_proporciones")
+    numero_exitos_1, tamano_muestra_1 = _exitos(trabajo, "_1", metodo != "normal")
+    numero_exitos_2, tamano_muestra_2 = _exitos(trabajo, "_2", metodo != "normal")
+    porcentaje_confianza = _porcentaje_confianza(trabajo)
+    datos = (
+        numero_exitos_1,
+        numero_exitos_2,
+        tamano_muestra_1,
+        tamano_muestra_2,
+        porcentaje_confianza,
+    )
+    if metodo in (None, "normal"):
+        if validar_condicion_normalidad_dif_proporciones(
+            tamano_muestra_1,
+            numero_exitos_1,
+            tamano_muestra_2,
+            numero_exitos_2,
+        ):
+            return _resultado(8, cache_resultados.intervalo_caso_8(*datos), metodo)
+
+        if metodo == "normal":
+            raise ValueError(ERR_APROXIMACION_NORMAL)
+
+        metodo = "newcombe"
+
+    return _resultado(8, _FUNCIONES_METODO[metodo](*datos), metodo)
+
+
+def _varianza(trabajo: dict) -> dict:
+    tamano_muestra, muestra = _muestra(trabajo)
+    porcentaje_confianza = _porcentaje_confianza(trabajo)
+    _con_varianza(tamano_muestra, "muestra")
+    return _resultado(9, cache_resultados.intervalo_caso_9(tamano_muestra, muestra, porcentaje_confianza))
+
+
+def _coc_varianzas(trabajo: dict) -> dict:
+    tamano_muestra_1, muestra_1, tamano_muestra_2, muestra_2 = _dos_muestras(trabajo)
+    porcentaje_confianza = _porcentaje_confianza(trabajo)
+    _con_varianza(tamano_muestra_1, "muestra_1")
+    _con_varianza(tamano_muestra_2, "muestra_2")
+    _validar_denominadores(10, muestra_1, muestra_2)
+    return _resultado(10, cache_resultados.intervalo_caso_10(
+        tamano_muestra_1,
+        tamano_muestra_2,
+        muestra_1,
+        muestra_2,
+        porcentaje_confianza,
+    ))
+
+
+_DESPACHO = {
+    "media": _media,
+    "dif_medias": _dif_medias,
+    "proporcion": _proporcion,
+    "dif_proporciones": _dif_proporciones,
+    "varianza": _varianza,
+    "coc_varianzas": _coc_varianzas,
+}
+
+def ejecutar_trabajo(trabajo: dict) -> dict:
+    """
+    Valida un trabajo, calcula su intervalo de confianza y devuelve el
+    resultado.
+
+    :param trabajo: Parámetro a estimar y sus datos.
+    :type trabajo: dict
+    :return: Caso usado, límites del intervalo y demás datos del caso.
+    :rtype: dict
+    :raises ValueError: Si algún dato no es válido; el mensaje es el
+    mismo que muestra el menú.
+    """
+    parametro = str(trabajo.get("parametro") or "").strip().lower()
+    caso = _caso_pedido(trabajo)
+    if caso is not None:
+        parametro = parametro or PARAMETRO_CASO[caso]
+        if parametro != PARAMETRO_CASO[caso]:
+            raise ValueError(f"caso: {ERR_OPCION_NO_VALIDA}")
+
+    funcion = _DESPACHO.get(parametro)
+    if funcion is None:
+        raise ValueError(f"parametro: {ERR_OPCION_NO_VALIDA}")
+
+    resultado = {"parametro": parametro, **funcion(trabajo)}
+    if "id" in trabajo:
+        resultado = {"id": trabajo["id"], **resultado}
+
+    return resultado
+
+
+def ejecutar_trabajo_seguro(trabajo) -> dict:
+    """
+    Ejecuta un trabajo y, si falla, devuelve el error en el resultado
+    en lugar de propagarlo, para que un trabajo no detenga el lote.
+
+    :param trabajo: Parámetro a estimar y sus datos, o el error con
+    el que se leyó.
+    :type trabajo: dict | Exception
+    :return: El resultado del trabajo o ``{"error": mensaje}``.
+    :rtype: dict
+    """
+    try:
+        if isinstance(trabajo, Exception):
+            raise trabajo
+
+        return ejecutar_trabajo(trabajo)
+    except ValueError as error:
+        mensaje = str(error)
+    except Exception as error:
+        mensaje = f"{type(error).__name__}: {error}"
+
+    resultado = {"error": mensaje}
+    if isinstance(trabajo, dict) and "id" in trabajo:
+        resultado = {"id": trabajo["id"], **resultado}
+
+    return resultado
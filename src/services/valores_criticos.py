@@ -0,0 +1,429 @@
+"""
+En este módulo se define el servicio de valores críticos que usan los
+cálculos de los intervalos de confianza.
+
+Los cuantiles de las distribuciones normal estándar (Z), t de Student,
+Chi-cuadrada (χ²) y de Fisher (F) se buscan primero en una tabla que
+se construye la primera vez que se pide cada distribución, con los
+niveles de confianza más comunes (90%, 95% y 99%) y los grados de
+libertad más usados. Lo que no está en la tabla se calcula con el
+inverso de la función de distribución y se guarda en una caché LRU
+acotada. Se llevan contadores de aciertos y fallos para poder medir
+la caché.
+
+El inverso se calcula con uno de dos backends que se eligen en tiempo
+de ejecución con ``establecer_backend`` o con la variable de entorno
+``CALCULADORA_BACKEND_CUANTILES``:
+
+- ``"scipy"`` (por defecto): ``scipy.stats``, que se importa hasta
+  que se necesita el primer cuantil.
+- ``"nativo"``: las rutinas de ``distribuciones``, que solo usan la
+  biblioteca estándar y evitan el costo de importar scipy.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from . import distribuciones
+
+__all__ = [
+    "BACKENDS",
+    "DISTRIBUCIONES",
+    "NIVELES_CONFIANZA_TABULADOS",
+    "backend_actual",
+    "configurar_cache",
+    "cuantil",
+    "cuantil_chi2",
+    "cuantil_f",
+    "cuantil_normal",
+    "cuantil_t",
+    "cuantiles",
+    "establecer_backend",
+    "estadisticas_cache",
+    "limpiar_cache",
+]
+
+BACKENDS = ("scipy", "nativo")
+
+DISTRIBUCIONES = ("normal", "t", "chi2", "f")
+
+NIVELES_CONFIANZA_TABULADOS = (90, 95, 99)
+
+TAMANO_CACHE = 4096
+
+# Grados de libertad máximos que se guardan en la tabla precalculada
+# por cada backend; el backend nativo no tabula F porque calcular la
+# malla completa costaría más que resolver los fallos bajo demanda
+_GRADOS_LIBERTAD_TABULADOS = {
+    "scipy": {"normal": 0, "t": 200, "chi2": 200, "f": 60},
+    "nativo": {"normal": 0, "t": 200, "chi2": 200, "f": 0},
+}
+
+_FUNCIONES_NATIVAS = {
+    "normal": np.vectorize(distribuciones.cuantil_normal, otypes=[np.float64]),
+    "t": np.vectorize(distribuciones.cuantil_t, otypes=[np.float64]),
+    "chi2": np.vectorize(distribuciones.cuantil_chi2, otypes=[np.float64]),
+    "f": np.vectorize(distribuciones.cuantil_f, otypes=[np.float64]),
+}
+
+_DECIMALES_CLAVE = 12
+
+_backend = os.environ.get("CALCULADORA_BACKEND_CUANTILES", "scipy")
+if _backend not in BACKENDS:
+    _backend = "scipy"
+
+_candado = threading.Lock()
+_tablas: dict[str, dict[tuple, float]] = {}
+_cache: OrderedDict[tuple, float] = OrderedDict()
+_tamano_cache = TAMANO_CACHE
+_contadores = {
+    "aciertos_tabla": 0,
+    "aciertos_cache": 0,
+    "fallos": 0,
+}
+
+def _ppf(distribucion: str, probabilidades, *grados_libertad):
+    """
+    Evalúa el inverso de la función de distribución con el backend
+    activo.
+
+    :param distribucion: Nombre de la distribución.
+    :type distribucion: str
+    :param probabilidades: Probabilidades acumuladas.
+    :type probabilidades: ArrayLike
+    :return: Cuantiles correspondientes.
+    :rtype: np.ndarray
+    """
+    if distribucion not in DISTRIBUCIONES:
+        raise ValueError(f"Distribución no soportada: {distribucion}")
+
+    if _backend == "nativo":
+        return _FUNCIONES_NATIVAS[distribucion](probabilidades, *grados_libertad)
+
+    from scipy.stats import (
+        norm,
+        t,
+        f,
+        chi2,
+    )
+
+    match distribucion:
+        case "normal":
+            return norm.ppf(probabilidades)
+        case "t":
+            return t.ppf(probabilidades, *grados_libertad)
+        case "chi2":
+            return chi2.ppf(probabilidades, *grados_libertad)
+        case _:
+            return f.ppf(probabilidades, *grados_libertad)
+
+
+def _probabilidades_tabuladas() -> list[float]:
+    """
+    Calcula las probabilidades de ambas colas que usan los intervalos
+    para los niveles de confianza tabulados.
+
+    :return: Probabilidades acumuladas redondeadas para usarse como
+    clave.
+    :rtype: list[float]
+    """
+    probabilidades = []
+    for porcentaje_confianza in NIVELES_CONFIANZA_TABULADOS:
+        alpha = 1 - (porcentaje_confianza / 100)
+        probabilidades.append(round(alpha / 2, _DECIMALES_CLAVE))
+        probabilidades.append(round(1 - (alpha / 2), _DECIMALES_CLAVE))
+
+    return probabilidades
+
+
+def _construir_tabla(distribucion: str) -> dict[tuple, float]:
+    """
+    Construye con una sola llamada vectorizada la tabla de cuantiles
+    de una distribución.
+
+    :param distribucion: Nombre de la distribución.
+    :type distribucion: str
+    :return: Tabla indexada por (probabilidad, grados de libertad...).
+    :rtype: dict[tuple, float]
+    """
+    probabilidades = _probabilidades_tabuladas()
+    maximo = _GRADOS_LIBERTAD_TABULADOS[_backend][distribucion]
+    grados = np.arange(1, maximo + 1)
+    if distribucion != "normal" and maximo == 0:
+        return {}
+
+    match distribucion:
+        case "normal":
+            claves = [(p,) for p in probabilidades]
+            valores = _ppf(distribucion, probabilidades)
+        case "t" | "chi2":
+            p, gl = np.meshgrid(probabilidades, grados, indexing="ij")
+            claves = list(zip(p.ravel().tolist(), gl.ravel().tolist()))
+            valores = _ppf(distribucion, p.ravel(), gl.ravel())
+        case _:
+            p, gl1, gl2 = np.meshgrid(probabilidades, grados, grados, indexing="ij")
+            claves = list(zip(p.ravel().tolist(), gl1.ravel().tolist(), gl2.ravel().tolist()))
+            valores = _ppf(distribucion, p.ravel(), gl1.ravel(), gl2.ravel())
+
+    return dict(zip(claves, np.asarray(valores, dtype=np.float64).tolist()))
+
+
+def _tabla(distribucion: str) -> dict[tuple, float]:
+    tabla = _tablas.get(distribucion)
+    if tabla is None:
+        if distribucion not in DISTRIBUCIONES:
+            raise ValueError(f"Distribución no soportada: {distribucion}")
+
+        tabla = _construir_tabla(distribucion)
+        _tablas[distribucion] = tabla
+
+    return tabla
+
+
+def _clave(probabilidad: float, grados_libertad: tuple) -> tuple:
+    return (round(float(probabilidad), _DECIMALES_CLAVE), *(float(g) for g in grados_libertad))
+
+
+def _buscar(distribucion: str, clave: tuple) -> float | None:
+    """
+    Busca un cuantil en la tabla y luego en la caché LRU, actualizando
+    los contadores. Debe llamarse con el candado tomado.
+    """
+    valor = _tabla(distribucion).get(clave)
+    if valor is not None:
+        _contadores["aciertos_tabla"] += 1
+        return valor
+
+    clave_cache = (distribucion, *clave)
+    valor = _cache.get(clave_cache)
+    if valor is not None:
+        _cache.move_to_end(clave_cache)
+        _contadores["aciertos_cache"] += 1
+        return valor
+
+    _contadores["fallos"] += 1
+    return None
+
+
+def _guardar(distribucion: str, clave: tuple, valor: float) -> None:
+    """Guarda un cuantil en la caché LRU. Debe llamarse con el candado tomado."""
+    _cache[(distribucion, *clave)] = valor
+    while len(_cache) > _tamano_cache:
+        _cache.popitem(last=False)
+
+
+def cuantil(distribucion: str, probabilidad: float, *grados_libertad: float) -> float:
+    """
+    Obtiene el cuantil de una distribución para una probabilidad
+    acumulada.
+
+    :param distribucion: ``"normal"``, ``"t"``, ``"chi2"`` o ``"f"``.
+    :type distribucion: str
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad: Grados de libertad de la distribución.
+    :type grados_libertad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    clave = _clave(probabilidad, grados_libertad)
+    with _candado:
+        valor = _buscar(distribucion, clave)
+
+    if valor is None:
+        valor = float(_ppf(distribucion, clave[0], *clave[1:]))
+        with _candado:
+            _guardar(distribucion, clave, valor)
+
+    return valor
+
+
+def cuantiles(distribucion: str, probabilidades, *grados_libertad) -> np.ndarray:
+    """
+    Versión por lotes de ``cuantil``. Cada combinación distinta de
+    parámetros se busca una sola vez y los fallos se calculan juntos
+    en una llamada vectorizada.
+
+    :param distribucion: ``"normal"``, ``"t"``, ``"chi2"`` o ``"f"``.
+    :type distribucion: str
+    :param probabilidades: Probabilidades acumuladas.
+    :type probabilidades: ArrayLike
+    :param grados_libertad: Grados de libertad de la distribución.
+    :type grados_libertad: ArrayLike
+    :return: Cuantiles con la forma común de los argumentos.
+    :rtype: np.ndarray
+    """
+    arreglos = np.broadcast_arrays(
+        np.round(np.asarray(probabilidades, dtype=np.float64), _DECIMALES_CLAVE),
+        *(np.asarray(g, dtype=np.float64) for g in grados_libertad),
+    )
+    forma = arreglos[0].shape
+    columnas = np.stack([a.ravel() for a in arreglos], axis=1)
+
+    # Cada fila se ve como un bloque de bytes para que np.unique
+    # ordene un solo arreglo en lugar de comparar fila por fila
+    filas = columnas.view(np.dtype((np.void, columnas.itemsize * columnas.shape[1]))).ravel()
+    _, indices, inverso = np.unique(filas, return_index=True, return_inverse=True)
+    unicas = columnas[indices]
+
+    # Con más combinaciones distintas que lugares en la caché (por
+    # ejemplo, los grados de libertad de Welch de cada muestra),
+    # buscarlas una por una cuesta más que calcularlas juntas y solo
+    # desalojaría la caché
+    if unicas.shape[0] > _tamano_cache:
+        with _candado:
+            _contadores["fallos"] += unicas.shape[0]
+
+        return _ppf(distribucion, *unicas.T)[inverso.reshape(-1)].reshape(forma)
+
+    valores = np.empty(unicas.shape[0], dtype=np.float64)
+    pendientes = []
+    with _candado:
+        for i, fila in enumerate(unicas.tolist()):
+            valor = _buscar(distribucion, tuple(fila))
+            if valor is None:
+                pendientes.append(i)
+            else:
+                valores[i] = valor
+
+    if pendientes:
+        faltantes = unicas[pendientes]
+        valores[pendientes] = _ppf(distribucion, *faltantes.T)
+        with _candado:
+            for fila, valor in zip(faltantes.tolist(), valores[pendientes].tolist()):
+                _guardar(distribucion, tuple(fila), valor)
+
+    return valores[inverso.reshape(-1)].reshape(forma)
+
+
+def cuantil_normal(probabilidad: float) -> float:
+    """
+    Cuantil de la distribución normal estándar (Z).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    return cuantil("normal", probabilidad)
+
+
+def cuantil_t(probabilidad: float, grados_libertad: float) -> float:
+    """
+    Cuantil de la distribución t (t de Student).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad: Grados de libertad (ν).
+    :type grados_libertad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    return cuantil("t", probabilidad, grados_libertad)
+
+
+def cuantil_chi2(probabilidad: float, grados_libertad: float) -> float:
+    """
+    Cuantil de la distribución Chi-cuadrada (χ²).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad: Grados de libertad.
+    :type grados_libertad: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    return cuantil("chi2", probabilidad, grados_libertad)
+
+
+def cuantil_f(probabilidad: float, grados_libertad_1: float, grados_libertad_2: float) -> float:
+    """
+    Cuantil de la distribución de Fisher (F).
+
+    :param probabilidad: Probabilidad acumulada.
+    :type probabilidad: float
+    :param grados_libertad_1: Grados de libertad del numerador.
+    :type grados_libertad_1: float
+    :param grados_libertad_2: Grados de libertad del denominador.
+    :type grados_libertad_2: float
+    :return: Cuantil de la distribución.
+    :rtype: float
+    """
+    return cuantil("f", probabilidad, grados_libertad_1, grados_libertad_2)
+
+
+def estadisticas_cache() -> dict[str, int | float]:
+    """
+    Devuelve los contadores del servicio de valores críticos.
+
+    :return: Aciertos en la tabla, aciertos y fallos en la caché LRU,
+    tasa de aciertos, entradas en la caché y su capacidad.
+    :rtype: dict[str, int | float]
+    """
+    with _candado:
+        estadisticas = dict(_contadores)
+        estadisticas["entradas_cache"] = len(_cache)
+        estadisticas["capacidad_cache"] = _tamano_cache
+
+    consultas = (
+        estadisticas["aciertos_tabla"]
+        + estadisticas["aciertos_cache"]
+        + estadisticas["fallos"]
+    )
+    aciertos = estadisticas["aciertos_tabla"] + estadisticas["aciertos_cache"]
+    estadisticas["tasa_aciertos"] = aciertos / consultas if consultas else 0.0
+    return estadisticas
+
+
+def limpiar_cache() -> None:
+    """Vacía la caché LRU y reinicia los contadores; las tablas se conservan."""
+    with _candado:
+        _cache.clear()
+        for nombre in _contadores:
+            _contadores[nombre] = 0
+
+
+def configurar_cache(tamano: int) -> None:
+    """
+    Cambia la capacidad de la caché LRU.
+
+    :param tamano: Número máximo de cuantiles guardados.
+    :type tamano: int
+    """
+    global _tamano_cache
+    if tamano < 0:
+        raise ValueError("El tamaño de la caché debe ser mayor o igual a cero")
+
+    with _candado:
+        _tamano_cache = tamano
+        while len(_cache) > _tamano_cache:
+            _cache.popitem(last=False)
+
+
+def establecer_backend(nombre: str) -> None:
+    """
+    Elige el backend con el que se calculan los cuantiles. Al cambiarlo
+    se descartan las tablas y la caché.
+
+    :param nombre: ``"scipy"`` o ``"nativo"``.
+    :type nombre: str
+    """
+    global _backend
+    if nombre not in BACKENDS:
+        raise ValueError(f"Backend no soportado: {nombre}")
+
+    with _candado:
+        if nombre != _backend:
+            _backend = nombre
+            _tablas.clear()
+            _cache.clear()
+
+
+def backend_actual() -> str:
+    """
+    :return: Nombre del backend activo.
+    :rtype: str
+    """
+    return _backend
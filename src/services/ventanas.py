@@ -0,0 +1,331 @@
+"""
+En este módulo se definen los intervalos de confianza sobre ventanas
+móviles de una serie: para la media (casos 1 y 2) y para la varianza
+(caso 9) de las últimas N observaciones.
+
+- ``intervalos_media_moviles`` e ``intervalos_varianza_moviles``
+  calculan el intervalo de todas las posiciones de la ventana en una
+  sola pasada vectorizada. La serie se parte en bloques de N
+  observaciones, cada uno centrado en su media, y cada ventana es el
+  final de un bloque más el principio del siguiente: sus momentos
+  salen de sumas acumuladas dentro de cada bloque (hacia adelante y
+  hacia atrás, sin restar sumas de otras partes de la serie) que se
+  combinan con la fórmula de Chan. Así un cambio de nivel solo afecta
+  a las ventanas de sus bloques, y las que podrían perder precisión
+  por cancelación se recalculan directamente con sus observaciones.
+  Los intervalos salen de las funciones por lotes.
+- ``VentanaMovil`` es la variante en vivo: un búfer circular de
+  tamaño fijo cuyos momentos se actualizan en O(1) por observación.
+
+Los momentos se redondean igual que en el cálculo escalar, así que
+cada ventana da el mismo intervalo que ``intervalo_caso_2`` o
+``intervalo_caso_9`` con esas N observaciones, salvo empates en el
+redondeo a cuatro decimales.
+"""
+import numpy as np
+
+from src.errores import ERR_OBSERVACIONES_INSUFICIENTES, ERR_TAMANO_MUESTRA, ERR_TAMANO_VENTANA
+
+from .incremental import EstimadorIncremental
+from .lotes import intervalo_caso_1_lote, intervalo_caso_2_lote, intervalo_caso_9_lote
+from .resultados import ResultadoCaso1, ResultadoCaso2, ResultadoCaso9
+
+__all__ = [
+    "VentanaMovil",
+    "intervalos_media_moviles",
+    "intervalos_varianza_moviles",
+    "momentos_moviles",
+]
+
+# Bytes máximos de la matriz de observaciones al recalcular ventanas
+_MEMORIA_RECALCULO = 64 << 20
+
+# Error relativo estimado de M2 a partir del cual una ventana se
+# recalcula directamente con sus observaciones
+_ERROR_RELATIVO = 1e-8
+
+def _serie(datos, tamano_ventana: int, minimo: int) -> np.ndarray:
+    serie = np.asarray(datos, dtype=np.float64).reshape(-1)
+    if tamano_ventana < minimo:
+        raise ValueError(ERR_OBSERVACIONES_INSUFICIENTES if minimo > 1 else ERR_TAMANO_MUESTRA)
+
+    if serie.shape[0] < tamano_ventana:
+        raise ValueError(ERR_TAMANO_VENTANA)
+
+    return serie
+
+
+def _momentos_directos(
+        serie: np.ndarray,
+        tamano_ventana: int,
+        inicios: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Media y M2 de las ventanas que empiezan en ``inicios``, en dos
+    pasadas sobre sus observaciones y por fragmentos que respetan
+    ``_MEMORIA_RECALCULO``.
+    """
+    medias = np.empty(inicios.shape[0])
+    m2 = np.empty(inicios.shape[0])
+    desplazamientos = np.arange(tamano_ventana)
+    filas = max(1, _MEMORIA_RECALCULO // (8 * tamano_ventana))
+    for inicio in range(0, inicios.shape[0], filas):
+        ventanas = serie[inicios[inicio:inicio + filas, None] + desplazamientos]
+        media = ventanas.mean(axis=1)
+        ventanas -= media[:, None]
+        medias[inicio:inicio + filas] = media
+        m2[inicio:inicio + filas] = np.einsum("ij,ij->i", ventanas, ventanas)
+
+    return medias, m2
+
+
+def momentos_moviles(datos, tamano_ventana: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula la media y la varianza muestral de cada ventana de
+    ``tamano_ventana`` observaciones consecutivas.
+
+    :param datos: Serie de observaciones.
+    :type datos: ArrayLike
+    :param tamano_ventana: Observaciones por ventana (N).
+    :type tamano_ventana: int
+    :return: Medias y varianzas muestrales (sin redondear) de las
+    ``len(datos) - N + 1`` ventanas.
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    serie = _serie(datos, tamano_ventana, 1)
+    if tamano_ventana < 2:
+        return serie.copy(), np.full_like(serie, np.nan)
+
+    n = tamano_ventana
+    total = serie.shape[0]
+    bloques = -(-total // n)
+
+    # Bloques de N observaciones centrados en su media; el último se
+    # completa con ceros que ninguna ventana usa
+    matriz = np.zeros(bloques * n)
+    matriz[:total] = serie
+    matriz = matriz.reshape(bloques, n)
+    centros = matriz.sum(axis=1) / np.minimum(n, total - np.arange(bloques) * n)
+    matriz -= centros[:, None]
+    matriz.reshape(-1)[total:] = 0.0
+    cuadrados = matriz * matriz
+
+    adelante = np.cumsum(matriz, axis=1).reshape(-1)
+    adelante_cuadrados = np.cumsum(cuadrados, axis=1).reshape(-1)
+    atras = np.cumsum(matriz[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+    atras_cuadrados = np.cumsum(cuadrados[:, ::-1], axis=1)[:, ::-1].reshape(-1)
+
+    # La ventana [i, i + N) es la parte a, de i al final de su bloque,
+    # más la parte b, las primeras i mod N observaciones del siguiente
+    inicios = np.arange(total - n + 1)
+    bloque = inicios // n
+    n_b = inicios % n
+    n_a = n - n_b
+    con_b = n_b > 0
+    fin = inicios + (n - 1)
+
+    suma_a = atras[inicios]
+    cuadrados_a = atras_cuadrados[inicios]
+    media_a = centros[bloque] + suma_a / n_a
+    m2_a = np.maximum(cuadrados_a - suma_a ** 2 / n_a, 0.0)
+
+    divisor_b = np.maximum(n_b, 1)
+    suma_b = np.where(con_b, adelante[fin], 0.0)
+    cuadrados_b = np.where(con_b, adelante_cuadrados[fin], 0.0)
+    media_b = np.where(
+        con_b,
+        centros[np.minimum(bloque + 1, bloques - 1)] + suma_b / divisor_b,
+        media_a,
+    )
+    m2_b = np.maximum(cuadrados_b - suma_b ** 2 / divisor_b, 0.0)
+
+    # Fórmula de Chan para unir las dos partes
+    delta = media_b - media_a
+    medias = media_a + delta * (n_b / n)
+    m2 = m2_a + m2_b + delta ** 2 * (n_a * n_b / n)
+
+    # El error de las sumas acumuladas crece con la suma de cuadrados
+    # respecto al centro del bloque; si es grande frente a M2 (un cambio
+    # de nivel dentro del bloque) la ventana se recalcula
+    error = (cuadrados_a + cuadrados_b) * (n * np.finfo(np.float64).eps)
+    sospechosas = np.flatnonzero(error > _ERROR_RELATIVO * m2)
+    if sospechosas.size:
+        medias[sospechosas], m2[sospechosas] = _momentos_directos(serie, n, sospechosas)
+
+    return medias, m2 / (n - 1)
+
+
+def intervalos_media_moviles(
+        datos,
+        tamano_ventana: int,
+        porcentaje_confianza: int = 95,
+        desv_estandar_poblacional: float | None = None,
+    ) -> ResultadoCaso1 | ResultadoCaso2:
+    """
+    Intervalo para la media poblacional (μ) de cada ventana móvil:
+    caso 1 si se conoce σ y caso 2 si no.
+
+    :param datos: Serie de observaciones.
+    :type datos: ArrayLike
+    :param tamano_ventana: Observaciones por ventana (N).
+    :type tamano_ventana: int
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :param desv_estandar_poblacional: Desviación estándar
+    poblacional (σ), si se conoce.
+    :type desv_estandar_poblacional: float | None
+    :return: El mismo registro que ``intervalo_caso_1_lote`` o
+    ``intervalo_caso_2_lote``, con un elemento por ventana en cada
+    arreglo; el elemento i corresponde a ``datos[i:i + N]``.
+    :rtype: ResultadoCaso1 | ResultadoCaso2
+    """
+    _serie(datos, tamano_ventana, 1 if desv_estandar_poblacional is not None else 2)
+    medias, varianzas = momentos_moviles(datos, tamano_ventana)
+    medias = np.round(medias, 4)
+    if desv_estandar_poblacional is not None:
+        return intervalo_caso_1_lote(
+            tamano_ventana,
+            medias,
+            porcentaje_confianza,
+            desv_estandar_poblacional,
+        )
+
+    return intervalo_caso_2_lote(
+        tamano_ventana,
+        medias,
+        np.round(varianzas, 4),
+        porcentaje_confianza,
+    )
+
+
+def intervalos_varianza_moviles(
+        datos,
+        tamano_ventana: int,
+        porcentaje_confianza: int = 95,
+    ) -> ResultadoCaso9:
+    """
+    Intervalo para la varianza poblacional (σ²) de cada ventana móvil
+    (caso 9).
+
+    :param datos: Serie de observaciones.
+    :type datos: ArrayLike
+    :param tamano_ventana: Observaciones por ventana (N).
+    :type tamano_ventana: int
+    :param porcentaje_confianza: Porcentaje de confianza para un
+    intervalo de confianza.
+    :type porcentaje_confianza: int
+    :return: El mismo registro que ``intervalo_caso_9_lote``, con
+    un elemento por ventana en cada arreglo.
+    :rtype: ResultadoCaso9
+    """
+    _serie(datos, tamano_ventana, 2)
+    _, varianzas = momentos_moviles(datos, tamano_ventana)
+    return intervalo_caso_9_lote(tamano_ventana, np.round(varianzas, 4), porcentaje_confianza)
+
+
+class VentanaMovil:
+    """
+    Ventana de las últimas N observaciones de un flujo en vivo,
+    guardadas en un búfer circular, con sus intervalos de confianza.
+    """
+    __slots__ = ("_bufer", "_posicion", "_tamano", "_estimador", "_desde_reinicio")
+
+    def __init__(self, tamano_ventana: int) -> None:
+        """
+        :param tamano_ventana: Observaciones por ventana (N).
+        :type tamano_ventana: int
+        """
+        if tamano_ventana < 1:
+            raise ValueError(ERR_TAMANO_MUESTRA)
+
+        self._bufer = np.empty(tamano_ventana, dtype=np.float64)
+        self._posicion = 0
+        self._tamano = 0
+        self._estimador = EstimadorIncremental()
+        self._desde_reinicio = 0
+
+    @property
+    def tamano_ventana(self) -> int:
+        """Capacidad de la ventana (N)."""
+        return self._bufer.shape[0]
+
+    @property
+    def llena(self) -> bool:
+        """Si la ventana ya tiene N observaciones."""
+        return self._tamano == self._bufer.shape[0]
+
+    @property
+    def datos(self) -> np.ndarray:
+        """Copia de las observaciones de la ventana, de la más antigua a la más reciente."""
+        if not self.llena:
+            return self._bufer[:self._tamano].copy()
+
+        return np.roll(self._bufer, -self._posicion)
+
+    def agregar(self, valor: float) -> None:
+        """
+        Agrega una observación y, si la ventana está llena, descarta
+        la más antigua, en O(1).
+
+        :param valor: Observación a agregar.
+        :type valor: float
+        """
+        valor = float(valor)
+        capacidad = self._bufer.shape[0]
+        if self.llena:
+            self._estimador.quitar(self._bufer[self._posicion])
+        else:
+            self._tamano += 1
+
+        self._bufer[self._posicion] = valor
+        self._posicion = (self._posicion + 1) % capacidad
+        self._estimador.agregar(valor)
+
+        # Cada N observaciones se recalculan los momentos a partir del
+        # búfer para que el error de las restas no se acumule (O(1)
+        # amortizado)
+        self._desde_reinicio += 1
+        if self._desde_reinicio >= capacidad:
+            self._estimador.reiniciar(self._bufer[:self._tamano])
+            self._desde_reinicio = 0
+
+    def agregar_varios(self, valores) -> None:
+        """
+        Agrega varias observaciones en orden.
+
+        :param valores: Observaciones a agregar.
+        :type valores: ArrayLike
+        """
+        for valor in np.asarray(valores, dtype=np.float64).reshape(-1).tolist():
+            self.agregar(valor)
+
+    def intervalo_media(
+            self,
+            porcentaje_confianza: int = 95,
+            desv_estandar_poblacional: float | None = None,
+        ) -> ResultadoCaso1 | ResultadoCaso2:
+        """
+        Intervalo para la media poblacional (μ) de la ventana actual.
+
+        :return: El mismo resultado que ``intervalo_caso_1`` o
+        ``intervalo_caso_2``.
+        :rtype: ResultadoCaso1 | ResultadoCaso2
+        """
+        return self._estimador.intervalo_media(porcentaje_confianza, desv_estandar_poblacional)
+
+    def intervalo_varianza(self, porcentaje_confianza: int = 95) -> ResultadoCaso9:
+        """
+        Intervalo para la varianza poblacional (σ²) de la ventana
+        actual.
+
+        :return: El mismo resultado que ``intervalo_caso_9``.
+        :rtype: ResultadoCaso9
+        """
+        return self._estimador.intervalo_varianza(porcentaje_confianza)
+
+    def __len__(self) -> int:
+        return self._tamano
+
+    def __repr__(self) -> str:
+        return f"VentanaMovil(n={self._tamano}, tamano_ventana={self._bufer.shape[0]})"
@@ -0,0 +1,250 @@
+"""
+En este módulo se define el servicio HTTP/JSON local de la
+calculadora, construido sobre ``asyncio`` y la biblioteca estándar.
+
+Cada parámetro tiene su ruta (``POST /media``, ``POST /dif_medias``,
+``POST /proporcion``, ``POST /dif_proporciones``, ``POST /varianza``
+y ``POST /coc_varianzas``) que recibe un trabajo en JSON con las
+mismas claves que un lote (ver ``src.services.trabajos``) y responde
+con el resultado. ``GET /salud`` indica si el servicio está activo.
+
+El cálculo se hace en un grupo de procesos para que el ciclo de
+eventos nunca se bloquee, y cada solicitud tiene un tiempo límite
+tras el cual se responde 504 (el cálculo no se puede interrumpir, así
+que sigue ocupando su proceso hasta terminar). Por seguridad no se
+aceptan las claves ``archivo*``: el servicio no lee archivos del
+servidor.
+
+Uso:
+    py main.py servidor --puerto 8000 --procesos 4 --tiempo-limite 5
+"""
+import asyncio
+import json
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from http import HTTPStatus
+
+from .services.trabajos import PARAMETROS, a_json, ejecutar_trabajo
+
+__all__ = [
+    "ServidorCalculadora",
+    "TAMANO_MAXIMO_CUERPO",
+    "TIEMPO_LIMITE",
+    "servir",
+]
+
+TIEMPO_LIMITE = 10.0
+TAMANO_MAXIMO_CUERPO = 16 << 20
+
+_CLAVES_PROHIBIDAS = ("archivo", "archivo_1", "archivo_2")
+
+class _ErrorHttp(Exception):
+    def __init__(self, estado: HTTPStatus, mensaje: str) -> None:
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+class ServidorCalculadora:
+    """
+    Servidor HTTP/1.1 con conexiones persistentes que despacha los
+    trabajos a un ejecutor.
+    """
+    def __init__(
+            self,
+            ejecutor: Executor,
+            tiempo_limite: float = TIEMPO_LIMITE,
+        ) -> None:
+        """
+        :param ejecutor: Ejecutor donde se calculan los intervalos.
+        :type ejecutor: Executor
+        :param tiempo_limite: Segundos máximos por solicitud.
+        :type tiempo_limite: float
+        """
+        self.ejecutor = ejecutor
+        self.tiempo_limite = tiempo_limite
+
+    async def _calcular(self, parametro: str, cuerpo: bytes) -> dict:
+        try:
+            trabajo = json.loads(cuerpo or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError) as error:
+            raise _ErrorHttp(HTTPStatus.BAD_REQUEST, f"JSON no válido: {error}") from None
+
+        if not isinstance(trabajo, dict):
+            raise _ErrorHttp(HTTPStatus.BAD_REQUEST, "El trabajo debe ser un objeto JSON")
+
+        for clave in _CLAVES_PROHIBIDAS:
+            if clave in trabajo:
+                raise _ErrorHttp(HTTPStatus.BAD_REQUEST, f"{clave}: no se permite en el servicio")
+
+        trabajo["parametro"] = parametro
+        ciclo = asyncio.get_running_loop()
+        futuro = ciclo.run_in_executor(self.ejecutor, ejecutar_trabajo, trabajo)
+        try:
+            return await asyncio.wait_for(futuro, self.tiempo_limite)
+        except TimeoutError:
+            raise _ErrorHttp(
+                HTTPStatus.GATEWAY_TIMEOUT,
+                f"El cálculo excedió el tiempo límite de {self.tiempo_limite} s",
+            ) from None
+        except ValueError as error:
+            raise _ErrorHttp(HTTPStatus.BAD_REQUEST, str(error)) from None
+        except ArithmeticError as error:
+            raise _ErrorHttp(HTTPStatus.BAD_REQUEST, f"{type(error).__name__}: {error}") from None
+        except Exception as error:
+            # La solicitud ya se leyó completa, así que un fallo del
+            # cálculo no obliga a cerrar la conexión
+            raise _ErrorHttp(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                f"{type(error).__name__}: {error}",
+            ) from None
+
+    async def _despachar(self, metodo: str, ruta: str, cuerpo: bytes) -> dict:
+        ruta = ruta.split("?", 1)[0].strip("/")
+        if ruta == "salud":
+            if metodo != "GET":
+                raise _ErrorHttp(HTTPStatus.METHOD_NOT_ALLOWED, "Usa GET")
+
+            return {"estado": "ok"}
+
+        if ruta not in PARAMETROS:
+            raise _ErrorHttp(HTTPStatus.NOT_FOUND, f"No existe la ruta /{ruta}")
+
+        if metodo != "POST":
+            raise _ErrorHttp(HTTPStatus.METHOD_NOT_ALLOWED, "Usa POST")
+
+        return await self._calcular(ruta, cuerpo)
+
+    @staticmethod
+    async def _leer_solicitud(lector: asyncio.StreamReader) -> tuple[str, str, dict, bytes] | None:
+        try:
+            encabezado = await lector.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None
+        except asyncio.LimitOverrunError:
+            raise _ErrorHttp(
+                HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE,
+                "Los encabezados son demasiado grandes",
+            ) from None
+
+        lineas = encabezado.decode("latin-1").split("\r\n")
+        try:
+            metodo, ruta, _ = lineas[0].split(" ", 2)
+        except ValueError:
+            raise _ErrorHttp(HTTPStatus.BAD_REQUEST, "Línea de solicitud no válida") from None
+
+        encabezados = {}
+        for linea in lineas[1:]:
+            if ":" in linea:
+                nombre, valor = linea.split(":", 1)
+                encabezados[nombre.strip().lower()] = valor.strip()
+
+        try:
+            longitud = int(encabezados.get("content-length", "0"))
+        except ValueError:
+            raise _ErrorHttp(HTTPStatus.BAD_REQUEST, "Content-Length no válido") from None
+
+        if longitud > TAMANO_MAXIMO_CUERPO:
+            raise _ErrorHttp(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "El cuerpo es demasiado grande")
+
+        cuerpo = await lector.readexactly(longitud) if longitud else b""
+        return metodo.upper(), ruta, encabezados, cuerpo
+
+    @staticmethod
+    def _escribir_respuesta(
+            escritor: asyncio.StreamWriter,
+            estado: HTTPStatus,
+            contenido: dict,
+            mantener: bool,
+        ) -> None:
+        cuerpo = a_json(contenido).encode("utf-8")
+        escritor.write(
+            (
+                f"HTTP/1.1 {estado.value} {estado.phrase}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(cuerpo)}\r\n"
+                f"Connection: {'keep-alive' if mantener else 'close'}\r\n"
+                "\r\n"
+            ).encode("latin-1")
+            + cuerpo
+        )
+
+    async def atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """
+        Atiende las solicitudes de una conexión hasta que el cliente
+        la cierre o pida ``Connection: close``.
+        """
+        try:
+            while True:
+                # Si la solicitud no se pudo leer completa se cierra la
+                # conexión, porque no se sabe dónde empieza la siguiente
+                mantener = False
+                try:
+                    solicitud = await self._leer_solicitud(lector)
+                    if solicitud is None:
+                        break
+
+                    metodo, ruta, encabezados, cuerpo = solicitud
+                    mantener = encabezados.get("connection", "").lower() != "close"
+                    estado = HTTPStatus.OK
+                    contenido = await self._despachar(metodo, ruta, cuerpo)
+                except _ErrorHttp as error:
+                    estado = error.estado
+                    contenido = {"error": str(error)}
+                except Exception as error:
+                    mantener = False
+                    estado = HTTPStatus.INTERNAL_SERVER_ERROR
+                    contenido = {"error": f"{type(error).__name__}: {error}"}
+
+                self._escribir_respuesta(escritor, estado, contenido, mantener)
+                await escritor.drain()
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            escritor.close()
+
+
+def _preparar_proceso() -> None:
+    # Carga el backend de valores críticos antes de la primera
+    # solicitud para que su importación no cuente en la latencia
+    from .services.valores_criticos import cuantil_normal
+
+    cuantil_normal(0.975)
+
+
+async def servir(
+        anfitrion: str = "127.0.0.1",
+        puerto: int = 8000,
+        procesos: int | None = None,
+        tiempo_limite: float = TIEMPO_LIMITE,
+    ) -> None:
+    """
+    Inicia el servicio y atiende solicitudes hasta que se cancele.
+
+    :param anfitrion: Dirección donde escuchar.
+    :type anfitrion: str
+    :param puerto: Puerto donde escuchar.
+    :type puerto: int
+    :param procesos: Procesos que calculan los intervalos; por
+    defecto uno por núcleo.
+    :type procesos: int | None
+    :param tiempo_limite: Segundos máximos por solicitud.
+    :type tiempo_limite: float
+    """
+    procesos = procesos or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_preparar_proceso) as ejecutor:
+        # Los procesos se crean con el primer trabajo; se inician antes
+        # de escuchar para que las primeras solicitudes no los esperen
+        ciclo = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            ciclo.run_in_executor(ejecutor, _preparar_proceso) for _ in range(procesos)
+        ))
+        servidor = ServidorCalculadora(ejecutor, tiempo_limite)
+        async with await asyncio.start_server(servidor.atender, anfitrion, puerto) as base:
+            direcciones = ", ".join(
+                f"http://{socket.getsockname()[0]}:{socket.getsockname()[1]}"
+                for socket in base.sockets
+            )
+            print(f">> Servicio escuchando en {direcciones}", flush=True)
+            await base.serve_forever()
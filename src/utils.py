@@ -3,7 +3,6 @@ En este módulo se definen las constantes para darle color al texto de
 la calculadora así como algunas funciones genéricas.
 """
 import os
-import msvcrt
 
 BRIGHT_RED = "\033[91m"
 BRIGHT_GREEN = "\033[92m"
@@ -18,4 +17,11 @@ def limpiar_consola() -> None:
 
 
 def esperar_enter() -> None:
+    # msvcrt solo existe en Windows; en otros sistemas se espera Enter
+    try:
+        import msvcrt
+    except ImportError:
+        input()
+        return
+
     msvcrt.getch()
@@ -2,7 +2,8 @@
 En este módulo se definen las funciones para validar los valores
 y formatos de los parámetros que pide la calculadora.
 """
-import re
+from .muestra import Muestra
+from .services.momentos import AcumuladorMomentos
 
 __all__ = [
     "validar_condicion_normalidad_dif_proporciones",
@@ -51,17 +52,43 @@ def validar_desviacion_estandar_poblacional(desv_estandar_poblacional: float) ->
 
 
 def validar_formato_muestra(muestra: str) -> bool:
-    formato = r'^\d+(\.\d+)?( \d+(\.\d+)?)*$'
-    return re.fullmatch(formato, muestra.strip()) is not None
+    # Mismo análisis que Muestra.desde_texto; si además se necesita la
+    # muestra conviene llamarlo directamente para no analizarla dos veces
+    try:
+        Muestra.desde_texto(muestra)
+    except ValueError:
+        return False
 
+    return True
+
+
+def validar_numero_exitos(
+        tamano_muestra: int,
+        numero_exitos: int,
+        incluir_extremos: bool = False,
+    ) -> bool:
+    # La aproximación normal (casos 7 y 8) necesita 1 <= X < n; Wilson,
+    # Agresti-Coull, Clopper-Pearson y Newcombe también admiten X = 0
+    # y X = n
+    if incluir_extremos:
+        return 0 <= numero_exitos <= tamano_muestra
 
-def validar_numero_exitos(tamano_muestra: int, numero_exitos: int) -> bool:
     return 1 <= numero_exitos < tamano_muestra
 
 
-def validar_numero_observaciones(muestra: str, tamano_muestra: int) -> bool:
-    observaciones = muestra.strip().split()
-    return len(observaciones) == tamano_muestra
+def validar_numero_observaciones(
+        muestra: Muestra | AcumuladorMomentos | str,
+        tamano_muestra: int,
+    ) -> bool:
+    # El texto de las observaciones se analiza como muestra; su len()
+    # contaría caracteres, no observaciones
+    if not isinstance(muestra, AcumuladorMomentos):
+        try:
+            muestra = Muestra.desde(muestra)
+        except ValueError:
+            return False
+
+    return len(muestra) == tamano_muestra
 
 
 def validar_porcentaje_confianza(porcentaje_confianza: int) -> bool:
@@ -1,17 +1,24 @@
 """
 En este módulo se definen las funciones para graficar el intervalo de
 confianza correspondiente a cada parámetro a estimar y caso.
+
+matplotlib y scipy se importan dentro de cada función para que el
+menú de la calculadora no pague su costo hasta la primera gráfica.
+
+Por defecto cada gráfica se muestra en una ventana. Con ``destino``
+se guarda en un archivo o en un búfer binario, y con
+``activar_modo_sin_pantalla`` se usa un backend no interactivo para
+generar gráficas en equipos sin pantalla; en ese modo, si no se da un
+destino, la función devuelve los bytes de la imagen. Las figuras se
+cierran después de guardarse para que la memoria no crezca al generar
+miles de gráficas.
 """
-import matplotlib.pyplot as plt
-import matplotlib.image as mpimg
-import numpy as np
+import io
+import os
+from pathlib import Path
+from typing import BinaryIO
 
-from scipy.stats import (
-    norm,
-    t,
-    f,
-    chi2,
-)
+import numpy as np
 
 from config import (
     IMAGE_INTERVAL_CASE_1,
@@ -26,15 +33,94 @@ from config import (
     IMAGE_INTERVAL_CASE_10,
 )
 
+from src.instrumentacion import tramo
+
+from .imagenes import cargar_formula
+
+Destino = str | os.PathLike | BinaryIO | None
+
+FORMATOS = ("png", "svg", "pdf")
+
+_sin_pantalla = False
+
+def activar_modo_sin_pantalla() -> None:
+    """
+    Usa el backend no interactivo Agg de matplotlib para que las
+    gráficas se generen sin pantalla y nunca se bloquee con
+    ``plt.show()``.
+    """
+    global _sin_pantalla
+    import matplotlib
+
+    matplotlib.use("Agg")
+    _sin_pantalla = True
+
+
+def _resolver_formato(destino: Destino, formato: str | None) -> str:
+    """
+    Determina el formato de la imagen a partir del argumento o de la
+    extensión del archivo; por defecto se usa png.
+    """
+    if formato is None and isinstance(destino, (str, os.PathLike)):
+        formato = Path(destino).suffix.lstrip(".") or None
+
+    formato = (formato or "png").lower()
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+
+    return formato
+
+
+def _finalizar_figura(figura, destino: Destino, formato: str | None) -> bytes | Path | None:
+    """
+    Muestra la figura o la guarda en el destino y la cierra.
+
+    :return: Bytes de la imagen si no hay destino en modo sin
+    pantalla, la ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
+    """
+    import matplotlib.pyplot as plt
+
+    # La disposición se mide aparte para que cada figura guardada cuente
+    # una sola vez en graficas.render
+    with tramo("graficas.disposicion"):
+        figura.tight_layout()
+    if destino is None and not _sin_pantalla:
+        # Incluye el tiempo que la ventana permanece abierta
+        with tramo("graficas.mostrar"):
+            plt.show()
+        return None
+
+    formato = _resolver_formato(destino, formato)
+    try:
+        with tramo("graficas.render"):
+            if destino is None:
+                buffer = io.BytesIO()
+                figura.savefig(buffer, format=formato)
+                return buffer.getvalue()
+
+            if isinstance(destino, (str, os.PathLike)):
+                ruta = Path(destino)
+                figura.savefig(ruta, format=formato)
+                return ruta
+
+            figura.savefig(destino, format=formato)
+            return None
+    finally:
+        plt.close(figura)
+
+
 def graficar_intervalo_z_caso_1(
         media_muestral: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         desv_estandar_poblacional: float,
         tamano_muestra: int,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Gráfica el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Una media poblacional (μ).
@@ -44,10 +130,10 @@ def graficar_intervalo_z_caso_1(
     
     :param media_muestral: Media muestral (X̄).
     :type media_muestral: float
-    :param limite_superior: Límite superior del intervalo de confianza.
-    :type limite_superior: float
     :param limite_inferior: Límite inferior del intervalo de confianza.
     :type limite_inferior: float
+    :param limite_superior: Límite superior del intervalo de confianza.
+    :type limite_superior: float
     :param desv_estandar_poblacional: Desviación estándar
     poblacional (σ).
     :type desv_estandar_poblacional: float
@@ -58,7 +144,18 @@ def graficar_intervalo_z_caso_1(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import norm
+
     error_estandar = desv_estandar_poblacional / np.sqrt(tamano_muestra)
 
     # Rango para la ditribución normal
@@ -66,13 +163,13 @@ def graficar_intervalo_z_caso_1(
     y = norm.pdf(x, loc=media_muestral, scale=error_estandar)
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_1)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_1)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_1}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -82,7 +179,7 @@ def graficar_intervalo_z_caso_1(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -90,16 +187,16 @@ def graficar_intervalo_z_caso_1(
 
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         media_muestral,
@@ -121,19 +218,20 @@ def graficar_intervalo_z_caso_1(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_t_caso_2(
         media_muestral: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         desv_estandar_muestral: float,
         tamano_muestra: int,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Gráfica el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Una media poblacional (μ).
@@ -143,10 +241,10 @@ def graficar_intervalo_t_caso_2(
     
     :param media_muestral: Media muestral (X̄).
     :type media_muestral: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param desv_estandar_muestral: Desviación estándar muestral (S).
     :type desv_estandar_muestral: float
     :param tamano_muestra: Tamaño de una muestra (n).
@@ -156,7 +254,18 @@ def graficar_intervalo_t_caso_2(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import t
+
     error_estandar = desv_estandar_muestral / np.sqrt(tamano_muestra)
 
     # Crear dominio para la curva t centrada en Media
@@ -172,13 +281,13 @@ def graficar_intervalo_t_caso_2(
     y = t.pdf((x - media_muestral) / error_estandar, df=tamano_muestra - 1) / error_estandar
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_2)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_2)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_2}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -188,23 +297,23 @@ def graficar_intervalo_t_caso_2(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3, label=f"Nivel de confianza: {porcentaje_confianza}%",
     )
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         media_muestral,
@@ -226,17 +335,18 @@ def graficar_intervalo_t_caso_2(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_z_caso_3(
         dif_medias_muestrales: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -249,18 +359,29 @@ def graficar_intervalo_z_caso_3(
     :param dif_medias_muestrales: Diferencia de medias
     muestrales (X̄₁ - X̄₂).
     :type dif_medias_muestrales: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param porcentaje_confianza: Porcentaje de confianza para el
     intervalo de confianza.
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import norm
+
     # Aproximar el error estándar desde los límites si se quiere la curva
-    aprox_error_estandar = (limite_superior - limite_inferior) / 2
+    aprox_error_estandar = (limite_inferior - limite_superior) / 2
 
     # Rango para la ditribución normal
     x = np.linspace(
@@ -271,13 +392,13 @@ def graficar_intervalo_z_caso_3(
     y = norm.pdf(x, loc=dif_medias_muestrales, scale=aprox_error_estandar)
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_3)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_3)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_3}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -287,7 +408,7 @@ def graficar_intervalo_z_caso_3(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -295,16 +416,16 @@ def graficar_intervalo_z_caso_3(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         dif_medias_muestrales,
@@ -326,18 +447,19 @@ def graficar_intervalo_z_caso_3(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_z_caso_4(
         dif_medias_muestrales: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         valor_critico_Z: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -350,10 +472,10 @@ def graficar_intervalo_z_caso_4(
     :param dif_medias_muestrales: Diferencia de medias
     muestrales (X̄₁ - X̄₂).
     :type dif_medias_muestrales: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param valor_critico_Z: Valor crítico de la distribución
     normal estándar (Z).
     :type valor_critico_Z: float
@@ -362,9 +484,20 @@ def graficar_intervalo_z_caso_4(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import norm
+
     # Aproximar el error estándar inversamente a partir del margen
-    aprox_error_estandar = (limite_superior - limite_inferior) / (2 * valor_critico_Z)
+    aprox_error_estandar = (limite_inferior - limite_superior) / (2 * valor_critico_Z)
 
     # Rango para la ditribución normal
     x = np.linspace(
@@ -375,13 +508,13 @@ def graficar_intervalo_z_caso_4(
     y = norm.pdf(x, loc=dif_medias_muestrales, scale=aprox_error_estandar)
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_4)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_4)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_4}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -391,7 +524,7 @@ def graficar_intervalo_z_caso_4(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -399,16 +532,16 @@ def graficar_intervalo_z_caso_4(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         dif_medias_muestrales,
@@ -430,19 +563,20 @@ def graficar_intervalo_z_caso_4(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_t_caso_5(
         dif_medias_muestrales: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         valor_critico_t: float,
         grados_libertad: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -455,10 +589,10 @@ def graficar_intervalo_t_caso_5(
     :param dif_medias_muestrales: Diferencia de medias
     muestrales (X̄₁ - X̄₂).
     :type dif_medias_muestrales: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param valor_critico_t: Valor crítico de la distribución t.
     :type valor_critico_t: float
     :param grados_libertad: Grados de libertad del valor crítico.
@@ -468,9 +602,20 @@ def graficar_intervalo_t_caso_5(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import t
+
     # Aproximar el error estándar desde el margen
-    aprox_error_estandar = (limite_superior - limite_inferior) / (2 * valor_critico_t)
+    aprox_error_estandar = (limite_inferior - limite_superior) / (2 * valor_critico_t)
 
     # Rango para la ditribución t de Student
     x = np.linspace(
@@ -484,13 +629,13 @@ def graficar_intervalo_t_caso_5(
     ) / aprox_error_estandar  # escalada
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_5)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_5)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_5}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -500,7 +645,7 @@ def graficar_intervalo_t_caso_5(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -508,16 +653,16 @@ def graficar_intervalo_t_caso_5(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         dif_medias_muestrales,
@@ -539,19 +684,20 @@ def graficar_intervalo_t_caso_5(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_t_caso_6(
         dif_medias_muestrales: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         valor_critico_t: float,
         grados_libertad: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de medias
@@ -564,10 +710,10 @@ def graficar_intervalo_t_caso_6(
     :param dif_medias_muestrales: Diferencia de medias
     muestrales (X̄₁ - X̄₂).
     :type dif_medias_muestrales: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param valor_critico_t: Valor crítico de la distribución t.
     :type valor_critico_t: float
     :param grados_libertad: Grados de libertad del valor crítico.
@@ -577,9 +723,20 @@ def graficar_intervalo_t_caso_6(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import t
+
     # Aproximar el error estándar desde el margen
-    aprox_error_estandar = (limite_superior - limite_inferior) / (2 * valor_critico_t)
+    aprox_error_estandar = (limite_inferior - limite_superior) / (2 * valor_critico_t)
 
     # Rango para la ditribución t de Student
     x = np.linspace(
@@ -593,13 +750,13 @@ def graficar_intervalo_t_caso_6(
     ) / aprox_error_estandar
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_6)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_6)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_6}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -609,7 +766,7 @@ def graficar_intervalo_t_caso_6(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -617,16 +774,16 @@ def graficar_intervalo_t_caso_6(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         dif_medias_muestrales,
@@ -648,18 +805,19 @@ def graficar_intervalo_t_caso_6(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_z_caso_7(
         proporcion_muestral: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         valor_critico_Z: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Proporción poblacional (𝑃).
@@ -668,10 +826,10 @@ def graficar_intervalo_z_caso_7(
     
     :param proporcion_muestral: Proporción muestral (𝑝).
     :type proporcion_muestral: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param valor_critico_Z: Valor crítico de la distribución normal
     estándar (Z).
     :type valor_critico_Z: float
@@ -680,9 +838,20 @@ def graficar_intervalo_z_caso_7(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import norm
+
     # Aproximar el error estándar inverso desde los márgenes
-    aprox_error_estandar = (limite_superior - limite_inferior) / (2 * valor_critico_Z)
+    aprox_error_estandar = (limite_inferior - limite_superior) / (2 * valor_critico_Z)
 
     # Rango para la ditribución normal
     x = np.linspace(
@@ -693,13 +862,13 @@ def graficar_intervalo_z_caso_7(
     y = norm.pdf(x, loc=proporcion_muestral, scale=aprox_error_estandar)
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_7)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_7)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_7}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -709,7 +878,7 @@ def graficar_intervalo_z_caso_7(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -717,16 +886,16 @@ def graficar_intervalo_z_caso_7(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         proporcion_muestral,
@@ -748,18 +917,19 @@ def graficar_intervalo_z_caso_7(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_z_caso_8(
         dif_proporciones_muestrales: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         valor_critico_Z: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Diferencia de proporciones
@@ -772,10 +942,10 @@ def graficar_intervalo_z_caso_8(
     :param dif_proporciones_muestrales: Diferencia de proporciones
     muestrales (𝑝₁ - 𝑝₂).
     :type dif_proporciones_muestrales: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param valor_critico_Z: Valor crítico de la distribución normal
     estándar (Z).
     :type valor_critico_Z: float
@@ -784,9 +954,20 @@ def graficar_intervalo_z_caso_8(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import norm
+
     # Aproximar el error estándar desde del margen
-    aprox_error_estandar = (limite_superior - limite_inferior) / (2 * valor_critico_Z)    
+    aprox_error_estandar = (limite_inferior - limite_superior) / (2 * valor_critico_Z)    
 
     # Rango para la ditribución normal
     x = np.linspace(
@@ -797,13 +978,13 @@ def graficar_intervalo_z_caso_8(
     y = norm.pdf(x, loc=dif_proporciones_muestrales, scale=aprox_error_estandar)
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_8)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_8)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_8}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
     
     # ==============
     # Gráfica
@@ -813,7 +994,7 @@ def graficar_intervalo_z_caso_8(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -821,16 +1002,16 @@ def graficar_intervalo_z_caso_8(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         dif_proporciones_muestrales,
@@ -855,18 +1036,19 @@ def graficar_intervalo_z_caso_8(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_chi2_caso_9(
         varianza_muestral: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         grados_libertad: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Varianza poblacional (σ²).
@@ -875,10 +1057,10 @@ def graficar_intervalo_chi2_caso_9(
     
     :param varianza_muestral: Varianza muestral (𝑠²).
     :type varianza_muestral: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param grados_libertad: Grador de libertad del valor crítico.
     :type grados_libertad: float
     :param porcentaje_confianza: Porcentaje de confianza para el
@@ -886,9 +1068,20 @@ def graficar_intervalo_chi2_caso_9(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import chi2
+
     # Rango para valores de sigma cuadrada
-    x = np.linspace(0.01, limite_superior * 1.5, 1000)
+    x = np.linspace(0.01, limite_inferior * 1.5, 1000)
     # Cambio de variable: x = (gl * s²) / χ²
     chi_vals = (grados_libertad * varianza_muestral) / x
     y = chi2.pdf(
@@ -897,13 +1090,13 @@ def graficar_intervalo_chi2_caso_9(
     ) * (grados_libertad * varianza_muestral) / (x ** 2)  # PDF transformada
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_9)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_9)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_9}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -913,7 +1106,7 @@ def graficar_intervalo_chi2_caso_9(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -921,16 +1114,16 @@ def graficar_intervalo_chi2_caso_9(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         varianza_muestral,
@@ -952,19 +1145,20 @@ def graficar_intervalo_chi2_caso_9(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
 
 
 def graficar_intervalo_f_caso_10(
         coc_varianzas_muestrales: float,
-        limite_superior: float,
         limite_inferior: float,
+        limite_superior: float,
         grados_libertad_1: float,
         grados_libertad_2: float,
         porcentaje_confianza: int,
-        titulo_intervalo: str
-    ) -> None:
+        titulo_intervalo: str,
+        destino: Destino = None,
+        formato: str | None = None,
+    ) -> bytes | Path | None:
     """
     Calcula el intervalo de confianza para la siguiente situación:
     - Parámetro a estimar: Cociente de varianzas
@@ -976,10 +1170,10 @@ def graficar_intervalo_f_caso_10(
     :param coc_varianzas_muestrales: Cocientes de varianzas
     muestrales (𝑠₁² / 𝑠₂²)
     :type coc_varianzas_muestrales: float
+    :param limite_inferior: Límite inferior del intervalo de confianza.
+    :type limite_inferior: float
     :param limite_superior: Límite superior del intervalo de confianza.
     :type limite_superior: float
-    :param limite_superior: Límite inferior del intervalo de confianza.
-    :type limite_inferior: float
     :param grados_libertad_1: Primeros grados de libertad del
     valor crítico.
     :type grados_libertad_1: float
@@ -991,9 +1185,20 @@ def graficar_intervalo_f_caso_10(
     :type porcentaje_confianza: int
     :param titulo_intervalo: Título de la gráfica del intervalo.
     :type titulo_intervalo: str
+    :param destino: Archivo o búfer binario donde se guarda la gráfica;
+    si es None se muestra en pantalla, salvo en modo sin pantalla.
+    :type destino: str | Path | BinaryIO | None
+    :param formato: Formato de la imagen (png, svg o pdf).
+    :type formato: str | None
+    :return: Bytes de la imagen en modo sin pantalla sin destino, la
+    ruta del archivo guardado o None.
+    :rtype: bytes | Path | None
     """
+    import matplotlib.pyplot as plt
+    from scipy.stats import f
+
     # Dominio para la curva de la razón
-    x = np.linspace(0.01, limite_superior * 1.5, 1000)
+    x = np.linspace(0.01, limite_inferior * 1.5, 1000)
     f_vals = (x / coc_varianzas_muestrales)
     y = f.pdf(
         f_vals,
@@ -1002,13 +1207,13 @@ def graficar_intervalo_f_caso_10(
     ) / coc_varianzas_muestrales  # Transformación del PDF de F
 
     try:
-        formula_intervalo = mpimg.imread(IMAGE_INTERVAL_CASE_10)
+        formula_intervalo = cargar_formula(IMAGE_INTERVAL_CASE_10)
     except FileNotFoundError:
         print(f"Imagen no encontrada en: {IMAGE_INTERVAL_CASE_10}")
         return
     
     # Crear figura con 2 subplots (gráfica + imagen de la fórmula)
-    _, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
+    figura, axs = plt.subplots(2, 1, figsize=(10, 7), gridspec_kw={'height_ratios': [3, 1]})
 
     # ==============
     # Gráfica
@@ -1018,7 +1223,7 @@ def graficar_intervalo_f_caso_10(
     # Sombrear el nivel de confianza
     axs[0].fill_between(
         x, y,
-        where=(x >= limite_superior) & (x <= limite_inferior),
+        where=(x >= limite_inferior) & (x <= limite_superior),
         color='green',
         alpha=0.3,
         label=f"Nivel de confianza: {porcentaje_confianza}%",
@@ -1026,16 +1231,16 @@ def graficar_intervalo_f_caso_10(
     
     # Líneas verticales
     axs[0].axvline(
-        limite_superior,
+        limite_inferior,
         color='orange',
         linestyle='--',
-        label=f"Límite inferior: {limite_superior:.3f}",
+        label=f"Límite inferior: {limite_inferior:.3f}",
     )
     axs[0].axvline(
-        limite_inferior,
+        limite_superior,
         color='red',
         linestyle='--',
-        label=f"Límite superior: {limite_inferior:.3f}",
+        label=f"Límite superior: {limite_superior:.3f}",
     )
     axs[0].axvline(
         coc_varianzas_muestrales,
@@ -1057,5 +1262,4 @@ def graficar_intervalo_f_caso_10(
     axs[1].imshow(formula_intervalo)
     axs[1].axis('off')  # Oculta ejes
 
-    plt.tight_layout()
-    plt.show()
+    return _finalizar_figura(figura, destino, formato)
@@ -0,0 +1,114 @@
+"""
+En este módulo se define la caché de las imágenes de las fórmulas de
+cada caso (``config.IMAGE_INTERVAL_CASE_*``).
+
+Cada imagen se decodifica la primera vez que se pide y queda guardada
+para todo el proceso, así que graficar cientos de intervalos no vuelve
+a leer ni a decodificar el PNG. También se pueden pedir variantes
+reducidas por un factor entero, que se calculan una sola vez a partir
+de la imagen original promediando bloques de pixeles.
+"""
+import threading
+from pathlib import Path
+
+import numpy as np
+
+__all__ = [
+    "cargar_formula",
+    "establecer_reduccion",
+    "limpiar_cache_formulas",
+    "precargar_formulas",
+]
+
+_candado = threading.Lock()
+_cache: dict[tuple[Path, int], np.ndarray] = {}
+_reduccion = 1
+
+def _reducir(imagen: np.ndarray, factor: int) -> np.ndarray:
+    """
+    Reduce una imagen promediando bloques de ``factor`` x ``factor``
+    pixeles; los pixeles que sobran en los bordes se descartan.
+    """
+    alto = (imagen.shape[0] // factor) * factor
+    ancho = (imagen.shape[1] // factor) * factor
+    recortada = imagen[:alto, :ancho]
+    bloques = recortada.reshape(
+        alto // factor,
+        factor,
+        ancho // factor,
+        factor,
+        *imagen.shape[2:],
+    )
+    return bloques.mean(axis=(1, 3)).astype(imagen.dtype)
+
+
+def cargar_formula(ruta: str | Path, reduccion: int | None = None) -> np.ndarray:
+    """
+    Devuelve la imagen decodificada de una fórmula, leyéndola del disco
+    solo la primera vez.
+
+    :param ruta: Ruta de la imagen, normalmente una de
+    ``config.IMAGE_INTERVAL_CASE_*``.
+    :type ruta: str | Path
+    :param reduccion: Factor entero de reducción; si es None se usa el
+    configurado con ``establecer_reduccion``.
+    :type reduccion: int | None
+    :return: Imagen de solo lectura.
+    :rtype: np.ndarray
+    :raises FileNotFoundError: Si la imagen no existe.
+    """
+    factor = _reduccion if reduccion is None else reduccion
+    if factor < 1:
+        raise ValueError("La reducción debe ser un entero mayor o igual a 1")
+
+    clave = (Path(ruta), factor)
+    imagen = _cache.get(clave)
+    if imagen is not None:
+        return imagen
+
+    if factor == 1:
+        import matplotlib.image as mpimg
+
+        imagen = mpimg.imread(clave[0])
+    else:
+        imagen = _reducir(cargar_formula(ruta, 1), factor)
+
+    imagen.flags.writeable = False
+    with _candado:
+        return _cache.setdefault(clave, imagen)
+
+
+def precargar_formulas(reducciones: tuple[int, ...] = (1,)) -> None:
+    """
+    Decodifica por adelantado las imágenes de los diez casos, por
+    ejemplo antes de generar gráficas por lotes.
+
+    :param reducciones: Factores de reducción que se preparan.
+    :type reducciones: tuple[int, ...]
+    """
+    import config
+
+    for numero in range(1, 11):
+        ruta = getattr(config, f"IMAGE_INTERVAL_CASE_{numero}")
+        for reduccion in reducciones:
+            cargar_formula(ruta, reduccion)
+
+
+def establecer_reduccion(reduccion: int) -> None:
+    """
+    Cambia el factor de reducción que usan las gráficas por defecto.
+
+    :param reduccion: Factor entero mayor o igual a 1.
+    :type reduccion: int
+    """
+    global _reduccion
+    if reduccion < 1:
+        raise ValueError("La reducción debe ser un entero mayor o igual a 1")
+
+    _reduccion = reduccion
+
+
+def limpiar_cache_formulas() -> None:
+    """Descarta todas las imágenes decodificadas."""
+    with _candado:
+        _cache.clear()